@@ -1,3 +1,10 @@
-from src.utils.terminal_engine import TerminalEngine
+import sys
 
-TerminalEngine().run()
+if len(sys.argv) > 1 and sys.argv[1] == "uci":
+    from src.uci import UciEngine
+
+    UciEngine().run()
+else:
+    from src.utils.terminal_engine import TerminalEngine
+
+    TerminalEngine().run()
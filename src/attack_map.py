@@ -0,0 +1,112 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from src.bitboard import NUM_OF_SQUARES, iter_squares
+from src.pieces.piece import Piece
+
+
+@dataclass
+class AttackMap:
+    """Attack Map
+
+    The attack map of one team keeps the bitmask of the squares attacked by each of its pieces,
+    keyed by piece id, along with the number of pieces attacking every square. A square is
+    attacked when a piece could capture an enemy piece on it, so squares defended by the team
+    and the diagonals in front of its pawns are attacked as well.
+
+    The map is updated incrementally with the cached move sets, so whether a square is attacked
+    is a single bit test.
+    """
+
+    _attacks: Dict[int, int] = field(default_factory=dict)
+    _counts: List[int] = field(default_factory=lambda: [0] * NUM_OF_SQUARES)
+    _attacked: int = 0
+
+    def clear(self) -> None:
+        """Remove every piece from the attack map."""
+        self._attacks.clear()
+        self._counts = [0] * NUM_OF_SQUARES
+        self._attacked = 0
+
+    def get_attacks(self, piece: Piece) -> int:
+        """Get the squares attacked by the given piece.
+
+        Args:
+            piece (Piece): The chess piece.
+
+        Returns:
+            int: The bitmask of the attacked squares. Empty if the piece is not in the map.
+        """
+        return self._attacks.get(piece.piece_id, 0)
+
+    def set_attacks(self, piece: Piece, attacks: int) -> None:
+        """Set the squares attacked by the given piece.
+
+        Args:
+            piece (Piece): The chess piece.
+            attacks (int): The bitmask of the squares attacked by the piece.
+        """
+        previous = self._attacks.get(piece.piece_id, 0)
+        self._attacks[piece.piece_id] = attacks
+        if previous != attacks:
+            self._update_counts(previous, attacks)
+
+    def remove_piece(self, piece: Piece) -> int:
+        """Remove the given piece and its attacks from the attack map.
+
+        Args:
+            piece (Piece): The chess piece.
+
+        Returns:
+            int: The bitmask of the squares the piece attacked.
+        """
+        attacks = self._attacks.pop(piece.piece_id, 0)
+        self._update_counts(attacks, 0)
+        return attacks
+
+    def _update_counts(self, previous: int, attacks: int) -> None:
+        """Update the attacker counts of the squares a piece stopped or started attacking.
+
+        Args:
+            previous (int): The bitmask of the squares the piece attacked before.
+            attacks (int): The bitmask of the squares the piece attacks now.
+        """
+        counts = self._counts
+        for square in iter_squares(previous & ~attacks):
+            counts[square] -= 1
+            if not counts[square]:
+                self._attacked ^= 1 << square
+        for square in iter_squares(attacks & ~previous):
+            if not counts[square]:
+                self._attacked |= 1 << square
+            counts[square] += 1
+
+    def is_attacked(self, square: int) -> bool:
+        """Determine if the team attacks the given square.
+
+        Args:
+            square (int): The square index.
+
+        Returns:
+            bool: True if at least one piece of the team attacks the square. Otherwise, False.
+        """
+        return bool(self._attacked >> square & 1)
+
+    def get_attacked(self) -> int:
+        """Get every square attacked by the team.
+
+        Returns:
+            int: The bitmask of the attacked squares.
+        """
+        return self._attacked
+
+    def count_attackers(self, square: int) -> int:
+        """Count the pieces of the team attacking the given square.
+
+        Args:
+            square (int): The square index.
+
+        Returns:
+            int: The number of attackers.
+        """
+        return self._counts[square]
@@ -0,0 +1,292 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.bitboard import NUM_OF_SQUARES
+from src.chess_engine import ChessEngine
+from src.constants import Color, PieceName
+from src.evaluation import MOBILITY_WEIGHTS
+from src.piece_square_tables import MAX_PHASE, PHASE_WEIGHTS, PIECE_SQUARE_SCORES
+
+"""Feature planes of the batch encoding, a plane holds the pieces of one color and piece name"""
+PLANES: List[Tuple[Color, PieceName]] = [
+    (color, name)
+    for color in [Color.WHITE, Color.BLACK]
+    for name in [
+        PieceName.PAWN,
+        PieceName.KNIGHT,
+        PieceName.BISHOP,
+        PieceName.ROOK,
+        PieceName.QUEEN,
+        PieceName.KING,
+    ]
+]
+
+"""Number of features of an encoded position, one per plane and square"""
+NUM_OF_FEATURES = len(PLANES) * NUM_OF_SQUARES
+
+"""Plane index of each FEN piece character"""
+FEN_PLANES: Dict[str, int] = {
+    name.value if color == Color.WHITE else name.value.lower(): plane
+    for plane, (color, name) in enumerate(PLANES)
+}
+
+
+def _build_feature_weights() -> np.ndarray:
+    """Build the middlegame score, endgame score and phase weight of every feature.
+
+    The weights are float32 so the feature product runs through BLAS, every sum is a small
+    integer and is represented exactly.
+
+    Returns:
+        np.ndarray: The (NUM_OF_FEATURES, 3) weight matrix, the scores are signed from white's
+            point of view like PIECE_SQUARE_SCORES.
+    """
+    weights = np.zeros((NUM_OF_FEATURES, 3), dtype=np.float32)
+    for plane, (color, name) in enumerate(PLANES):
+        for square in range(NUM_OF_SQUARES):
+            mg_score, eg_score = PIECE_SQUARE_SCORES[color][name][square]
+            weights[plane * NUM_OF_SQUARES + square] = (
+                mg_score,
+                eg_score,
+                PHASE_WEIGHTS[name],
+            )
+    return weights
+
+
+"""Middlegame score, endgame score and phase weight of every feature"""
+FEATURE_WEIGHTS = _build_feature_weights()
+
+_FULL = np.uint64(0xFFFFFFFFFFFFFFFF)
+_NOT_A_FILE = np.uint64(0xFEFEFEFEFEFEFEFE)
+_NOT_H_FILE = np.uint64(0x7F7F7F7F7F7F7F7F)
+_NOT_AB_FILES = np.uint64(0xFCFCFCFCFCFCFCFC)
+_NOT_GH_FILES = np.uint64(0x3F3F3F3F3F3F3F3F)
+
+# Board shifts as (shift, mask), a positive shift moves towards h1. The mask clears the squares
+# a shift wraps onto from the other edge of the board.
+
+"""Single square shifts along the rows and columns"""
+ROOK_SHIFTS = [(1, _NOT_A_FILE), (-1, _NOT_H_FILE), (8, _FULL), (-8, _FULL)]
+
+"""Single square shifts along the diagonals"""
+BISHOP_SHIFTS = [
+    (9, _NOT_A_FILE),
+    (7, _NOT_H_FILE),
+    (-7, _NOT_A_FILE),
+    (-9, _NOT_H_FILE),
+]
+
+"""Knight jumps"""
+KNIGHT_SHIFTS = [
+    (17, _NOT_A_FILE),
+    (15, _NOT_H_FILE),
+    (10, _NOT_AB_FILES),
+    (6, _NOT_GH_FILES),
+    (-6, _NOT_AB_FILES),
+    (-10, _NOT_GH_FILES),
+    (-15, _NOT_A_FILE),
+    (-17, _NOT_H_FILE),
+]
+
+"""Board shifts of each piece with mobility and whether the piece slides along them"""
+MOBILITY_SHIFTS = {
+    PieceName.KNIGHT: (KNIGHT_SHIFTS, False),
+    PieceName.BISHOP: (BISHOP_SHIFTS, True),
+    PieceName.ROOK: (ROOK_SHIFTS, True),
+    PieceName.QUEEN: (ROOK_SHIFTS + BISHOP_SHIFTS, True),
+}
+
+
+def _shift(bitboards: np.ndarray, shift: int, mask: np.uint64) -> np.ndarray:
+    """Shift every piece of a batch of bitboards by the given number of squares.
+
+    Args:
+        bitboards (np.ndarray): The bitboards.
+        shift (int): The number of squares, positive towards h1 and negative towards a8.
+        mask (np.uint64): The squares the shifted pieces may land on.
+
+    Returns:
+        np.ndarray: The shifted bitboards.
+    """
+    if shift > 0:
+        return (bitboards << np.uint64(shift)) & mask
+    return (bitboards >> np.uint64(-shift)) & mask
+
+
+def _popcount(bitboards: np.ndarray) -> np.ndarray:
+    """Count the set bits of a batch of bitboards.
+
+    Args:
+        bitboards (np.ndarray): The uint64 bitboards.
+
+    Returns:
+        np.ndarray: The number of set bits of each bitboard.
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bitboards).astype(np.int32)
+    bytes_ = np.ascontiguousarray(bitboards, dtype="<u8").view(np.uint8)
+    bits = np.unpackbits(bytes_.reshape(bitboards.shape + (8,)), axis=-1)
+    return bits.sum(axis=-1, dtype=np.int32)
+
+
+def engine_bitboards(
+    engines: Iterable[ChessEngine],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Read the piece bitboards and the team to move of a batch of chess engines.
+
+    Args:
+        engines (Iterable[ChessEngine]): The chess engines.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (N, 12) uint64 bitboards indexed by position and
+            plane, and the (N,) side to move, 1 for white and -1 for black.
+    """
+    bitboards, turns = [], []
+    for engine in engines:
+        board = engine.get_board()
+        bitboards.append([board.get_bitboard(color, name) for color, name in PLANES])
+        turns.append(1 if engine.get_turn() == Color.WHITE else -1)
+    return (
+        np.array(bitboards, dtype=np.uint64).reshape(-1, len(PLANES)),
+        np.array(turns, dtype=np.int8),
+    )
+
+
+def fen_bitboards(fens: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Read the piece bitboards and the team to move of a batch of FEN strings.
+
+    Only the piece placement and active color fields are read, so no chess engine is built.
+
+    Args:
+        fens (Iterable[str]): The FEN strings.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (N, 12) uint64 bitboards indexed by position and
+            plane, and the (N,) side to move, 1 for white and -1 for black.
+    """
+    bitboards, turns = [], []
+    for fen in fens:
+        placement, active_color = fen.split()[:2]
+        planes = [0] * len(PLANES)
+        square = 0
+        for char in placement:
+            if char.isdigit():
+                square += int(char)
+            elif char != "/":
+                planes[FEN_PLANES[char]] |= 1 << square
+                square += 1
+        bitboards.append(planes)
+        turns.append(1 if active_color == "w" else -1)
+    return (
+        np.array(bitboards, dtype=np.uint64).reshape(-1, len(PLANES)),
+        np.array(turns, dtype=np.int8),
+    )
+
+
+def encode_bitboards(bitboards: np.ndarray) -> np.ndarray:
+    """Encode a batch of piece bitboards as one-hot piece-square features.
+
+    Args:
+        bitboards (np.ndarray): The (N, 12) uint64 bitboards indexed by position and plane.
+
+    Returns:
+        np.ndarray: The (N, 768) uint8 features, feature plane * 64 + square is 1 when the
+            square holds a piece of the plane. Reshape to (N, 12, 64) for a plane layout.
+    """
+    bytes_ = np.ascontiguousarray(bitboards, dtype="<u8").view(np.uint8)
+    return np.unpackbits(bytes_, axis=1, bitorder="little")
+
+
+@dataclass
+class BatchEvaluator:
+    """Vectorized Batch Evaluation
+
+    The batch evaluator scores many positions at once with NumPy. It computes the tapered
+    material and piece-square score of the Evaluator from the one-hot features and the
+    pseudo-legal mobility of the knights, bishops, rooks and queens from the bitboards with
+    board shifts, so no per-position Python work is done after the bitboards are read.
+
+    The pawn structure and king safety terms of the Evaluator are not part of the batch score.
+    """
+
+    mobility_weights: Dict[PieceName, int] = field(
+        default_factory=lambda: dict(MOBILITY_WEIGHTS)
+    )
+
+    def evaluate(self, bitboards: np.ndarray, turns: np.ndarray) -> np.ndarray:
+        """Evaluate a batch of positions.
+
+        Args:
+            bitboards (np.ndarray): The (N, 12) uint64 bitboards indexed by position and plane.
+            turns (np.ndarray): The (N,) side to move, 1 for white and -1 for black.
+
+        Returns:
+            np.ndarray: The (N,) scores in centipawns from the point of view of the team to move.
+        """
+        features = encode_bitboards(bitboards).astype(np.float32)
+        scores = (features @ FEATURE_WEIGHTS).astype(np.int32)
+        mobility = self.mobility(bitboards)
+        mg_scores = scores[:, 0] + mobility
+        eg_scores = scores[:, 1] + mobility
+        phases = np.minimum(scores[:, 2], MAX_PHASE)
+        tapered = (mg_scores * phases + eg_scores * (MAX_PHASE - phases)) // MAX_PHASE
+        return tapered * turns
+
+    def evaluate_engines(self, engines: Iterable[ChessEngine]) -> np.ndarray:
+        """Evaluate the current positions of a batch of chess engines.
+
+        Args:
+            engines (Iterable[ChessEngine]): The chess engines.
+
+        Returns:
+            np.ndarray: The (N,) scores in centipawns from the point of view of the team to move.
+        """
+        return self.evaluate(*engine_bitboards(engines))
+
+    def evaluate_fens(self, fens: Iterable[str]) -> np.ndarray:
+        """Evaluate a batch of FEN strings.
+
+        Args:
+            fens (Iterable[str]): The FEN strings.
+
+        Returns:
+            np.ndarray: The (N,) scores in centipawns from the point of view of the team to move.
+        """
+        return self.evaluate(*fen_bitboards(fens))
+
+    def mobility(self, bitboards: np.ndarray) -> np.ndarray:
+        """Score the pseudo-legal mobility of a batch of positions.
+
+        The moves of every piece are counted separately: the rays of two sliding pieces never
+        share a square in the same direction, because the rear piece is blocked by the front one.
+
+        Args:
+            bitboards (np.ndarray): The (N, 12) uint64 bitboards indexed by position and plane.
+
+        Returns:
+            np.ndarray: The (N,) mobility scores in centipawns from white's point of view.
+        """
+        half = len(PLANES) // 2
+        occupancy = {
+            Color.WHITE: np.bitwise_or.reduce(bitboards[:, :half], axis=1),
+            Color.BLACK: np.bitwise_or.reduce(bitboards[:, half:], axis=1),
+        }
+        empty = ~(occupancy[Color.WHITE] | occupancy[Color.BLACK])
+        scores = np.zeros(len(bitboards), dtype=np.int32)
+        for plane, (color, name) in enumerate(PLANES):
+            weight = self.mobility_weights.get(name)
+            if not weight or name not in MOBILITY_SHIFTS:
+                continue
+            shifts, slides = MOBILITY_SHIFTS[name]
+            targets = ~occupancy[color]
+            moves = np.zeros(len(bitboards), dtype=np.int32)
+            for shift, mask in shifts:
+                ray = _shift(bitboards[:, plane], shift, mask)
+                moves += _popcount(ray & targets)
+                while slides and ray.any():
+                    ray = _shift(ray & empty, shift, mask)
+                    moves += _popcount(ray & targets)
+            scores += (weight if color == Color.WHITE else -weight) * moves
+        return scores
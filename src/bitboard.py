@@ -0,0 +1,51 @@
+from typing import Iterator, List, Tuple
+
+from src.constants import NUM_OF_COLS, NUM_OF_ROWS
+
+"""Number of squares on the chess board"""
+NUM_OF_SQUARES = NUM_OF_ROWS * NUM_OF_COLS
+
+"""Square index to (row, col) coordinates lookup table (square 0 is a8, square 63 is h1)"""
+COORDINATES: List[Tuple[int, int]] = [
+    (square // NUM_OF_COLS, square % NUM_OF_COLS) for square in range(NUM_OF_SQUARES)
+]
+
+
+def to_square(coordinates: Tuple[int, int]) -> int:
+    """Convert (row, col) coordinates to a square index.
+
+    Args:
+        coordinates (Tuple[int, int]): The coordinates of the square.
+
+    Returns:
+        int: The square index between 0 (a8) and 63 (h1).
+    """
+    row, col = coordinates
+    return row * NUM_OF_COLS + col
+
+
+def iter_squares(bitboard: int) -> Iterator[int]:
+    """Iterate over the square indices of the set bits of a bitboard.
+
+    Args:
+        bitboard (int): The bitboard.
+
+    Yields:
+        int: The square index of each set bit, lowest square first.
+    """
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        yield lowest_bit.bit_length() - 1
+        bitboard ^= lowest_bit
+
+
+def popcount(bitboard: int) -> int:
+    """Count the number of set bits of a bitboard.
+
+    Args:
+        bitboard (int): The bitboard.
+
+    Returns:
+        int: The number of occupied squares in the bitboard.
+    """
+    return bin(bitboard).count("1")
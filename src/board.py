@@ -1,19 +1,45 @@
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
-from src.constants import NUM_OF_COLS, NUM_OF_ROWS
+from src.constants import NUM_OF_COLS, NUM_OF_ROWS, Color, PieceName
 from src.pieces.piece import Piece
 
 
 @dataclass
 class Board:
-    """Chess Board Class"""
+    """Chess Board Class
+
+    The board keeps a mailbox of piece objects for piece lookups alongside one
+    bitboard per (color, piece name) and per-color occupancy bitboards. Square
+    index 0 is a8 (row 0, col 0) and square index 63 is h1 (row 7, col 7).
+    """
 
     _board: List[List[Piece]] = field(
         default_factory=lambda: [
             [None for _ in range(NUM_OF_COLS)] for _ in range(NUM_OF_ROWS)
         ]
     )
+    _bitboards: Dict[Color, Dict[PieceName, int]] = field(
+        default_factory=lambda: {
+            color: {name: 0 for name in PieceName} for color in Color
+        }
+    )
+    _occupancy: Dict[Color, int] = field(
+        default_factory=lambda: {color: 0 for color in Color}
+    )
+    _occupied: int = 0
+
+    def clear(self) -> None:
+        """Remove every chess piece from the board."""
+        for row in self._board:
+            for col in range(NUM_OF_COLS):
+                row[col] = None
+        for bitboards in self._bitboards.values():
+            for name in bitboards:
+                bitboards[name] = 0
+        for color in self._occupancy:
+            self._occupancy[color] = 0
+        self._occupied = 0
 
     def get_board(self) -> List[List[Piece]]:
         return [
@@ -38,9 +64,7 @@ class Board:
             bool: True if the cell is currently vacant. Otherwise, False.
         """
         row, col = coordinates
-        if self._board[row][col] is None:
-            return True
-        return False
+        return not self._occupied >> (row * NUM_OF_COLS + col) & 1
 
     def is_capture(self, piece: Piece, dest: Tuple[int, int]) -> bool:
         """Determine if moving the piece to the given destination cell is an enemy capture.
@@ -52,10 +76,12 @@ class Board:
         Returns:
             bool: True if moving the given piece to the destination coordinates captures an enemy piece. Otherwise, False.
         """
-        enemy = self.get_piece(dest)
-        if enemy and enemy.color != piece.color:
-            return True
-        return False
+        row, col = dest
+        square = row * NUM_OF_COLS + col
+        return bool(
+            self._occupied >> square & 1
+            and not self._occupancy[piece.color] >> square & 1
+        )
 
     def get_piece(self, coordinates: Tuple[int, int]) -> Piece:
         """Get the chess piece at the given coordinates. Do not remove chess piece.
@@ -70,6 +96,50 @@ class Board:
         row, col = coordinates
         return self._board[row][col]
 
+    def get_bitboard(self, color: Color, name: PieceName) -> int:
+        """Get the bitboard of the given color and piece name.
+
+        Args:
+            color (Color): The color of the pieces.
+            name (PieceName): The name of the pieces.
+
+        Returns:
+            int: The bitboard with a set bit for every square occupied by the given pieces.
+        """
+        return self._bitboards[color][name]
+
+    def get_occupancy(self, color: Color = None) -> int:
+        """Get the occupancy bitboard of the given color or of both colors.
+
+        Args:
+            color (Color, optional): The color of the pieces. Defaults to None (both colors).
+
+        Returns:
+            int: The bitboard with a set bit for every occupied square.
+        """
+        if color is None:
+            return self._occupied
+        return self._occupancy[color]
+
+    def _set_square(self, piece: Piece, row: int, col: int) -> None:
+        """Place the piece in the mailbox and set its bit in the bitboards."""
+        mask = 1 << (row * NUM_OF_COLS + col)
+        self._board[row][col] = piece
+        self._bitboards[piece.color][piece.name] |= mask
+        self._occupancy[piece.color] |= mask
+        self._occupied |= mask
+
+    def _clear_square(self, row: int, col: int) -> None:
+        """Remove the occupant of the square from the mailbox and the bitboards."""
+        occupant = self._board[row][col]
+        if occupant is None:
+            return
+        mask = ~(1 << (row * NUM_OF_COLS + col))
+        self._board[row][col] = None
+        self._bitboards[occupant.color][occupant.name] &= mask
+        self._occupancy[occupant.color] &= mask
+        self._occupied &= mask
+
     def _pickup_piece(
         self, piece: Piece = None, coordinates: Tuple[int, int] = None
     ) -> Piece:
@@ -84,12 +154,12 @@ class Board:
         if piece:
             row, col = piece.coordinates
             piece.has_moved = True
-            self._board[row][col] = None
+            self._clear_square(row, col)
             return piece
         elif coordinates:
             row, col = coordinates
             piece = self._board[row][col]
-            self._board[row][col] = None
+            self._clear_square(row, col)
             piece.has_moved = True
             return piece
         else:
@@ -112,7 +182,8 @@ class Board:
         """
         piece.coordinates = dest
         row, col = dest
-        self._board[row][col] = piece
+        self._clear_square(row, col)
+        self._set_square(piece, row, col)
 
     # def find_piece(self, , dest: Tuple[int, int]) -> Piece:
     #     """Find chess piece given the type of chess piece and destination coordinates.
@@ -189,41 +260,3 @@ class Board:
     #     valid_moves = moves.union(captures)
 
     #     return valid_moves
-
-    # def is_attacked(self, team: Team, coordinates: Tuple[int, int]) -> bool:
-    #     """Determines if the given coordinates are attacked by opposing team.
-
-    #     Returns:
-    #         bool: True if the given coordinates are attacked by opposing team. Otherwise, False.
-    #     """
-    #     for _, move in team.get_moves():
-    #         if coordinates == move:
-    #             return True
-    #     return False
-
-    # def is_check(self, team: Team) -> bool:
-    #     """Determines if current team is in check position.
-
-    #     Returns:
-    #         bool: True if the curret team is in check position. Otherwise, False
-    #     """
-    #     king_coordinates = team.get_king().coordinates
-    #     enemy = self._black if team.color == Color.WHITE else self._white
-    #     return self.is_attacked(enemy, king_coordinates)
-
-    # def is_checkmate(self) -> bool:
-    #     """Determines if current team is in a checkmate position.
-
-    #     Returns:
-    #         bool: True if current team is in a checkmate position. Otherwise, False.
-    #     """
-    #     king = self._current_team.get_king()
-
-    #     if not self.is_check():
-    #         return False
-
-    #     for piece, move in self._current_team.get_moves():
-    #         self._move_piece(piece, move)
-    #         if not self.is_check():
-    #             return False
-    #     return True
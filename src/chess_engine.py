@@ -1,12 +1,107 @@
 from dataclasses import dataclass, field
-from typing import List, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
 
+from src.attack_map import AttackMap
+from src.bitboard import COORDINATES, iter_squares, to_square
 from src.board import Board
-from src.constants import Color
+from src.constants import (
+    CASTLING,
+    CASTLING_FEN,
+    NUM_OF_COLS,
+    NUM_OF_ROWS,
+    Color,
+    PieceName,
+)
+from src.exceptions import (
+    InvalidColumnUserInput,
+    InvalidCoordinatesUserInput,
+    InvalidFen,
+    InvalidRowUserInput,
+    StaleAccumulator,
+    StaleAttackMap,
+    StaleMoveCache,
+    StalePositionHash,
+    StaleScores,
+)
+from src.move import PROMOTION_PIECES, Move, UndoInfo
+from src.pieces.bishop import Bishop
+from src.pieces.king import King
+from src.pieces.knight import Knight
+from src.pieces.move_tables import BETWEEN_MASKS, MOVE_TABLES, REACH_TABLES
+from src.pieces.pawn import Pawn
 from src.pieces.piece import Piece
+from src.pieces.queen import Queen
+from src.pieces.rook import Rook
+from src.piece_square_tables import PHASE_WEIGHTS, PIECE_SQUARE_SCORES
 from src.teams.black import Black
 from src.teams.team import Team
 from src.teams.white import White
+from src.utils.utils import convert_coordinates, format_coordinates
+from src.zobrist import (
+    BLACK_TO_MOVE_KEY,
+    CASTLING_KEYS,
+    PIECE_KEYS,
+    en_passant_key,
+    hash_position,
+)
+
+if TYPE_CHECKING:
+    from src.nnue import Accumulator
+
+"""Chess Piece Constructors by FEN letter"""
+PIECE_CONSTRUCTORS = {
+    "p": Pawn,
+    "r": Rook,
+    "n": Knight,
+    "b": Bishop,
+    "q": Queen,
+    "k": King,
+}
+
+"""Starting row of the pawns of each color"""
+PAWN_START_ROWS = {Color.BLACK: 1, Color.WHITE: 6}
+
+"""Row the pawns of each color are promoted on"""
+PROMOTION_ROWS = {Color.BLACK: 7, Color.WHITE: 0}
+
+"""Bitmask of the king and rook squares that castling rights depend on"""
+CASTLING_MASK = 0
+for _, _, _king, _rook in CASTLING:
+    CASTLING_MASK |= 1 << to_square(_king) | 1 << to_square(_rook)
+
+"""Castling moves indexed by the king's dest coordinates: the castling right, the color, the
+rook's src and dest coordinates, the squares that must be vacant and the squares the king
+crosses that must not be attacked"""
+CASTLING_MOVES: Dict[Tuple[int, int], Tuple] = {}
+for _right, _color, _king, _rook in CASTLING:
+    _step = 1 if _rook[1] > _king[1] else -1
+    _king_dest = (_king[0], _king[1] + 2 * _step)
+    _rook_dest = (_king[0], _king[1] + _step)
+    CASTLING_MOVES[_king_dest] = (
+        _right,
+        _color,
+        _rook,
+        _rook_dest,
+        BETWEEN_MASKS[to_square(_king)][to_square(_rook)],
+        1 << to_square(_king_dest) | 1 << to_square(_rook_dest),
+    )
+
+"""Rays along which a piece can be pinned to its king, with the names of the pinning pieces"""
+PIN_RAYS = [
+    (
+        MOVE_TABLES[(PieceName.ROOK, Color.WHITE)],
+        REACH_TABLES[(PieceName.ROOK, Color.WHITE)],
+        (PieceName.ROOK, PieceName.QUEEN),
+    ),
+    (
+        MOVE_TABLES[(PieceName.BISHOP, Color.WHITE)],
+        REACH_TABLES[(PieceName.BISHOP, Color.WHITE)],
+        (PieceName.BISHOP, PieceName.QUEEN),
+    ),
+]
+
+"""Names of the pieces whose attacks continue past the square they attack"""
+SLIDING_PIECES = (PieceName.ROOK, PieceName.BISHOP, PieceName.QUEEN)
 
 
 @dataclass
@@ -16,15 +111,35 @@ class ChessEngine:
     _board: Board = field(default_factory=Board)
     _black: Team = field(default_factory=Black)
     _white: Team = field(default_factory=White)
+    debug: bool = False
+    _undo_stack: List[UndoInfo] = field(default_factory=list)
+    _turn: Color = Color.WHITE
+    _en_passant: Tuple[int, int] = None
+    _halfmove_clock: int = 0
+    _fullmove_number: int = 1
+    _accumulator: "Accumulator" = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         """Post initialization."""
         # set chess board with given black/white teams
         self._set_board()
 
-        # calculate team moves to get valid moves for every piece
+        # hash the starting position, the hash is updated incrementally afterwards
+        self._castling_rights = self._calculate_castling_rights()
+        self._hash = hash_position(
+            self._board, self._turn, self._castling_rights, self._en_passant
+        )
+
+        # score the starting position, the scores are updated incrementally afterwards
+        self._mg_score, self._eg_score, self._phase = self._calculate_scores()
+
+        # calculate team moves to get valid moves and attacks for every piece
+        self._attack_maps = {Color.BLACK: AttackMap(), Color.WHITE: AttackMap()}
+        self._restricted = []
         self._calculate_team_moves(self._black)
         self._calculate_team_moves(self._white)
+        self._update_king_safety()
+        self._update_legal_moves()
 
     def _set_board(self) -> None:
         """Set chess board with black and white pieces."""
@@ -32,18 +147,626 @@ class ChessEngine:
             for piece in team.get_all_pieces():
                 self._board.put_piece(piece, piece.coordinates)
 
-    def move(self, src: Tuple[int, int], dest: Tuple[int, int]) -> None:
+    @classmethod
+    def from_fen(cls, fen: str, debug: bool = False) -> "ChessEngine":
+        """Create a chess engine from a FEN string.
+
+        Args:
+            fen (str): The FEN string of the position.
+            debug (bool, optional): Cross-check incremental updates. Defaults to False.
+
+        Returns:
+            ChessEngine: The chess engine with the given position.
+        """
+        chess_engine = cls(
+            Board(),
+            Black(pieces={name: set() for name in PieceName}),
+            White(pieces={name: set() for name in PieceName}),
+            debug=debug,
+        )
+        chess_engine.set_fen(fen)
+        return chess_engine
+
+    def set_fen(self, fen: str) -> None:
+        """Replace the current position with the position of a FEN string.
+
+        The board and teams are reused and filled in a single pass over the piece placement.
+        Pawns off their starting rank are marked as moved and missing castling rights mark the
+        corresponding rook as moved.
+
+        Args:
+            fen (str): The FEN string of the position.
+
+        Raises:
+            InvalidFen: Raises InvalidFen if the FEN string cannot be parsed, e.g. a row does not
+                have 8 squares, a team does not have exactly one king, a pawn is on the first
+                or last row or the castling field is not - or a subset of KQkq. The current
+                position is left unchanged.
+        """
+        fields = fen.split()
+        if len(fields) < 4 or fields[1] not in ("w", "b"):
+            raise InvalidFen(fen)
+        placement, turn, castling, en_passant = fields[:4]
+
+        # parse every field before the current position is cleared, so an invalid FEN string
+        # leaves the position unchanged
+        squares, row, col = [], 0, 0
+        for char in placement + "/":
+            if char == "/":
+                if col != NUM_OF_COLS:
+                    raise InvalidFen(fen)
+                row, col = row + 1, 0
+            elif char.isdigit():
+                col += int(char)
+            elif char.lower() in PIECE_CONSTRUCTORS and col < NUM_OF_COLS:
+                squares.append((char, (row, col)))
+                col += 1
+            else:
+                raise InvalidFen(fen)
+        kings = [char for char, _ in squares if char.lower() == "k"]
+        if row != NUM_OF_ROWS or sorted(kings) != ["K", "k"]:
+            raise InvalidFen(fen)
+        if any(
+            char.lower() == "p" and coordinates[0] in (0, NUM_OF_ROWS - 1)
+            for char, coordinates in squares
+        ):
+            raise InvalidFen(fen)
+        if castling != "-" and (
+            len(set(castling)) != len(castling)
+            or not set(castling) <= set(CASTLING_FEN.values())
+        ):
+            raise InvalidFen(fen)
+        try:
+            en_passant = None if en_passant == "-" else convert_coordinates(en_passant)
+            halfmove_clock = int(fields[4]) if len(fields) > 4 else 0
+            fullmove_number = int(fields[5]) if len(fields) > 5 else 1
+        except (
+            ValueError,
+            InvalidColumnUserInput,
+            InvalidCoordinatesUserInput,
+            InvalidRowUserInput,
+        ):
+            raise InvalidFen(fen)
+
+        self._board.clear()
+        self._black.set_pieces({name: set() for name in PieceName})
+        self._white.set_pieces({name: set() for name in PieceName})
+        for char, coordinates in squares:
+            color = Color.WHITE if char.isupper() else Color.BLACK
+            piece = PIECE_CONSTRUCTORS[char.lower()](color, coordinates)
+            if piece.name == PieceName.PAWN:
+                piece.has_moved = coordinates[0] != PAWN_START_ROWS[color]
+            self._board.put_piece(piece, coordinates)
+            self.get_team(color).add_piece(piece)
+
+        # an unmoved king and rook imply a castling right, so a missing right moves the rook
+        for right, _, _, rook_coordinates in CASTLING:
+            rook = self._board.get_piece(rook_coordinates)
+            if rook and CASTLING_FEN[right] not in castling:
+                rook.has_moved = True
+
+        self._turn = Color.WHITE if turn == "w" else Color.BLACK
+        self._en_passant = en_passant
+        self._halfmove_clock = halfmove_clock
+        self._fullmove_number = fullmove_number
+        self._undo_stack.clear()
+
+        self._castling_rights = self._calculate_castling_rights()
+        self._hash = hash_position(
+            self._board, self._turn, self._castling_rights, self._en_passant
+        )
+        self._mg_score, self._eg_score, self._phase = self._calculate_scores()
+        if self._accumulator:
+            self._accumulator.refresh(self._all_pieces())
+        for attack_map in self._attack_maps.values():
+            attack_map.clear()
+        self._restricted = []
+        self._calculate_team_moves(self._black)
+        self._calculate_team_moves(self._white)
+        self._update_king_safety()
+        self._update_legal_moves()
+
+    def to_fen(self) -> str:
+        """Get the FEN string of the current position.
+
+        Returns:
+            str: The FEN string of the current position.
+        """
+        rows = []
+        for row in self._board._board:
+            fen_row, empty = "", 0
+            for piece in row:
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty:
+                    fen_row, empty = fen_row + str(empty), 0
+                letter = piece.name.value
+                fen_row += letter if piece.color == Color.WHITE else letter.lower()
+            rows.append(fen_row + str(empty) if empty else fen_row)
+
+        castling = "".join(
+            CASTLING_FEN[right]
+            for right, _, _, _ in CASTLING
+            if self._castling_rights & right
+        )
+        en_passant = format_coordinates(self._en_passant) if self._en_passant else "-"
+        return " ".join(
+            [
+                "/".join(rows),
+                self._turn.value.lower(),
+                castling or "-",
+                en_passant,
+                str(self._halfmove_clock),
+                str(self._fullmove_number),
+            ]
+        )
+
+    def move(
+        self,
+        src: Tuple[int, int],
+        dest: Tuple[int, int],
+        promotion: PieceName = PieceName.QUEEN,
+    ) -> Piece:
         """Move piece from src to dest.
 
         Args:
             src (Tuple[int, int]): The src coordinates
             dest (Tuple[int, int]): The dest coordinates
+            promotion (PieceName, optional): The piece a pawn is promoted to when it reaches the
+                last row. Defaults to PieceName.QUEEN.
+
+        Returns:
+            Piece: The captured piece. If the move is not a capture return None.
         """
-        piece = self._board._pickup_piece(coordinates=src)
-        piece.coordinates = dest
-        self._board.move_piece(piece, dest)
-        self._calculate_team_moves(self._black)
-        self._calculate_team_moves(self._white)
+        return self._move_piece(self._board.get_piece(src), dest, promotion)
+
+    def make_move(self, move: Move) -> UndoInfo:
+        """Make a move that can be taken back with ChessEngine.unmake_move.
+
+        The returned undo information is also pushed onto the engine's undo stack so moves
+        must be unmade in the reverse order they were made.
+
+        Args:
+            move (Move): The move to make.
+
+        Returns:
+            UndoInfo: The state needed to take back the move.
+        """
+        piece = self._board.get_piece(move.src)
+        captured = self._board.get_piece(move.dest)
+        if (
+            captured is None
+            and move.dest == self._en_passant
+            and piece.name == PieceName.PAWN
+        ):
+            captured = self._board.get_piece((move.src[0], move.dest[1]))
+        undo = UndoInfo(
+            move=move,
+            piece=piece,
+            captured=captured,
+            piece_had_moved=piece.has_moved,
+            captured_had_moved=captured.has_moved if captured else False,
+            castling_rights=self._castling_rights,
+            en_passant=self._en_passant,
+            halfmove_clock=self._halfmove_clock,
+            fullmove_number=self._fullmove_number,
+            hash=self._hash,
+            scores=(self._mg_score, self._eg_score, self._phase),
+            checkers=self._checkers,
+            pins=self._pins,
+            restricted=self._restricted,
+            accumulator=self._accumulator,
+        )
+        if self._accumulator:
+            self._accumulator.push()
+        self._move_piece(piece, move.dest, move.promotion, undo)
+        self._undo_stack.append(undo)
+        return undo
+
+    def unmake_move(self, undo: UndoInfo) -> None:
+        """Take back the last move made by ChessEngine.make_move.
+
+        The board, team pieces, has_moved flags, cached move sets, attack maps and pins and
+        checkers are restored from the undo information without recalculating any moves.
+
+        Args:
+            undo (UndoInfo): The undo information returned by ChessEngine.make_move.
+        """
+        self._undo_stack.pop()
+        piece, captured, promoted = undo.piece, undo.captured, undo.promoted
+        team = self.get_team(piece.color)
+
+        if promoted:
+            self._board._pickup_piece(promoted)
+            team.remove_piece(promoted)
+            team.add_piece(piece)
+        else:
+            self._board._pickup_piece(piece)
+        self._board.put_piece(piece, undo.move.src)
+        piece.has_moved = undo.piece_had_moved
+
+        rook = undo.castling_rook
+        if rook:
+            _, _, rook_src, _, _, _ = CASTLING_MOVES[undo.move.dest]
+            self._board._pickup_piece(rook)
+            self._board.put_piece(rook, rook_src)
+            rook.has_moved = False
+
+        if captured:
+            # an en passant capture puts the pawn back beside the dest square
+            self._board.put_piece(captured, captured.coordinates)
+            captured.has_moved = undo.captured_had_moved
+            self.get_team(captured.color).add_piece(captured)
+
+        for replaced, pseudo_moves, moves, attacks in reversed(undo.replaced_moves):
+            replaced._pseudo_moves = pseudo_moves
+            replaced._valid_moves = moves
+            self._attack_maps[replaced.color].set_attacks(replaced, attacks)
+        if promoted:
+            self._attack_maps[promoted.color].remove_piece(promoted)
+
+        self._turn = Color.BLACK if self._turn == Color.WHITE else Color.WHITE
+        self._castling_rights = undo.castling_rights
+        self._en_passant = undo.en_passant
+        self._halfmove_clock = undo.halfmove_clock
+        self._fullmove_number = undo.fullmove_number
+        self._hash = undo.hash
+        self._mg_score, self._eg_score, self._phase = undo.scores
+        if self._accumulator and undo.accumulator is self._accumulator:
+            self._accumulator.pop()
+        elif self._accumulator:
+            # attached after the move was made, so its values from before the move were never saved
+            self._accumulator.refresh(self._all_pieces())
+        self._checkers = undo.checkers
+        self._pins = undo.pins
+        self._restricted = undo.restricted
+
+    def _move_piece(
+        self,
+        piece: Piece,
+        dest: Tuple[int, int],
+        promotion: PieceName = PieceName.QUEEN,
+        undo: UndoInfo = None,
+    ) -> Piece:
+        """Move the piece to dest, capturing the enemy piece on dest if there is one.
+
+        Castling also moves the rook, an en passant capture removes the pawn beside dest and a
+        pawn reaching the last row is replaced by the promotion piece. The position hash,
+        castling rights, en passant square, move counters and side to move are updated along
+        with the board.
+
+        Args:
+            piece (Piece): The chess piece to move.
+            dest (Tuple[int, int]): The dest coordinates.
+            promotion (PieceName, optional): The piece a pawn is promoted to when it reaches the
+                last row. Defaults to PieceName.QUEEN.
+            undo (UndoInfo, optional): Collects the promoted piece, the castling rook and the
+                cached move sets and attacks replaced by the move. Defaults to None.
+
+        Returns:
+            Piece: The captured piece. If the move is not a capture return None.
+        """
+        replaced_moves = undo.replaced_moves if undo else None
+        src = piece.coordinates
+        src_square, dest_square = to_square(src), to_square(dest)
+        changed = 1 << src_square | 1 << dest_square
+        keys = PIECE_KEYS[piece.color][piece.name]
+        self._hash ^= keys[src_square] ^ keys[dest_square] ^ BLACK_TO_MOVE_KEY
+        self._hash ^= en_passant_key(self._board, self._turn, self._en_passant)
+        self._score_piece(piece, src_square, -1)
+        self._score_piece(piece, dest_square, 1)
+
+        is_pawn = piece.name == PieceName.PAWN
+        if is_pawn and dest == self._en_passant:
+            # en passant, the captured pawn is beside the dest square
+            captured = self._board._pickup_piece(coordinates=(src[0], dest[1]))
+            self._board.move_piece(piece, dest)
+        else:
+            captured = self._board.move_piece(piece, dest)
+        if captured:
+            captured_square = captured.square
+            changed |= 1 << captured_square
+            self._hash ^= PIECE_KEYS[captured.color][captured.name][captured_square]
+            self._score_piece(captured, captured_square, -1)
+            self.get_team(captured.color).remove_piece(captured)
+            self._remove_attacks(captured, replaced_moves)
+
+        moved = piece
+        if piece.name == PieceName.KING and abs(dest[1] - src[1]) == 2:
+            _, _, rook_src, rook_dest, _, _ = CASTLING_MOVES[dest]
+            rook = self._board.get_piece(rook_src)
+            self._board.move_piece(rook, rook_dest)
+            rook_keys = PIECE_KEYS[rook.color][PieceName.ROOK]
+            self._hash ^= rook_keys[rook.square] ^ rook_keys[to_square(rook_src)]
+            changed |= 1 << to_square(rook_src) | 1 << rook.square
+            self._score_piece(rook, to_square(rook_src), -1)
+            self._score_piece(rook, rook.square, 1)
+            if undo:
+                undo.castling_rook = rook
+        elif is_pawn and dest[0] == PROMOTION_ROWS[piece.color]:
+            moved = PIECE_CONSTRUCTORS[promotion.value.lower()](
+                piece.color, dest, has_moved=True
+            )
+            self._board.put_piece(moved, dest)
+            team = self.get_team(piece.color)
+            team.remove_piece(piece)
+            team.add_piece(moved)
+            self._remove_attacks(piece, replaced_moves)
+            self._hash ^= (
+                keys[dest_square] ^ PIECE_KEYS[moved.color][promotion][dest_square]
+            )
+            self._score_piece(piece, dest_square, -1)
+            self._score_piece(moved, dest_square, 1)
+            if undo:
+                undo.promoted = moved
+
+        if changed & CASTLING_MASK:
+            self._update_castling_rights()
+
+        if is_pawn and abs(dest[0] - src[0]) == 2:
+            self._en_passant = ((src[0] + dest[0]) // 2, src[1])
+        else:
+            self._en_passant = None
+        self._halfmove_clock = 0 if is_pawn or captured else self._halfmove_clock + 1
+        if piece.color == Color.BLACK:
+            self._fullmove_number += 1
+        self._turn = Color.BLACK if self._turn == Color.WHITE else Color.WHITE
+        self._hash ^= en_passant_key(self._board, self._turn, self._en_passant)
+
+        self._update_moves(moved, changed, replaced_moves)
+        return captured
+
+    def _remove_attacks(
+        self,
+        piece: Piece,
+        replaced_moves: List[
+            Tuple[Piece, Set[Tuple[int, int]], Set[Tuple[int, int]], int]
+        ] = None,
+    ) -> None:
+        """Remove the attacks of a piece taken off the board from its team's attack map.
+
+        Args:
+            piece (Piece): The chess piece taken off the board.
+            replaced_moves (List[Tuple[Piece, Set[Tuple[int, int]], Set[Tuple[int, int]], int]], optional):
+                Collects the removed attacks. Defaults to None.
+        """
+        attacks = self._attack_maps[piece.color].remove_piece(piece)
+        if replaced_moves is not None:
+            replaced_moves.append(
+                (piece, piece._pseudo_moves, piece._valid_moves, attacks)
+            )
+
+    def _score_piece(self, piece: Piece, square: int, sign: int) -> None:
+        """Add or subtract the material, piece-square and phase scores of a piece on a square.
+
+        Args:
+            piece (Piece): The chess piece.
+            square (int): The square index of the piece.
+            sign (int): 1 if the piece is placed on the square, -1 if it is removed.
+        """
+        mg_score, eg_score = PIECE_SQUARE_SCORES[piece.color][piece.name][square]
+        self._mg_score += sign * mg_score
+        self._eg_score += sign * eg_score
+        self._phase += sign * PHASE_WEIGHTS[piece.name]
+        if self._accumulator:
+            self._accumulator.update(piece, square, sign)
+
+    def _calculate_scores(self) -> Tuple[int, int, int]:
+        """Calculate the material, piece-square and phase scores from scratch.
+
+        Returns:
+            Tuple[int, int, int]: The middlegame and endgame scores from white's point of view
+                and the game phase.
+        """
+        mg_score, eg_score, phase = 0, 0, 0
+        for team in [self._black, self._white]:
+            for piece in team.get_all_pieces():
+                scores = PIECE_SQUARE_SCORES[piece.color][piece.name][piece.square]
+                mg_score += scores[0]
+                eg_score += scores[1]
+                phase += PHASE_WEIGHTS[piece.name]
+        return mg_score, eg_score, phase
+
+    def get_scores(self) -> Tuple[int, int, int]:
+        """Get the running material and piece-square scores of the current position.
+
+        Returns:
+            Tuple[int, int, int]: The middlegame and endgame scores in centipawns from white's
+                point of view and the game phase.
+        """
+        return self._mg_score, self._eg_score, self._phase
+
+    def set_accumulator(self, accumulator: "Accumulator") -> None:
+        """Attach an NNUE accumulator that is updated with every piece put on or taken off a square.
+
+        Args:
+            accumulator (Accumulator): The accumulator, refreshed from the current position.
+                None detaches the current accumulator.
+        """
+        self._accumulator = accumulator
+        if accumulator:
+            accumulator.refresh(self._all_pieces())
+
+    def get_accumulator(self) -> "Accumulator":
+        """Get the attached NNUE accumulator.
+
+        Returns:
+            Accumulator: The accumulator. If no accumulator is attached return None.
+        """
+        return self._accumulator
+
+    def _all_pieces(self) -> List[Piece]:
+        """Get the pieces of both teams.
+
+        Returns:
+            List[Piece]: Every piece on the board.
+        """
+        return list(self._black.get_all_pieces()) + list(self._white.get_all_pieces())
+
+    def _calculate_castling_rights(self) -> int:
+        """Calculate the castling rights implied by the unmoved kings and rooks on the board.
+
+        Returns:
+            int: The castling rights bit flags.
+        """
+        rights = 0
+        for right, color, king_coordinates, rook_coordinates in CASTLING:
+            king = self._board.get_piece(king_coordinates)
+            rook = self._board.get_piece(rook_coordinates)
+            if (
+                king
+                and rook
+                and king.name == PieceName.KING
+                and rook.name == PieceName.ROOK
+                and king.color == color
+                and rook.color == color
+                and not king.has_moved
+                and not rook.has_moved
+            ):
+                rights |= right
+        return rights
+
+    def _update_castling_rights(self) -> None:
+        """Recalculate the castling rights and update the position hash accordingly."""
+        rights = self._calculate_castling_rights()
+        self._hash ^= CASTLING_KEYS[self._castling_rights] ^ CASTLING_KEYS[rights]
+        self._castling_rights = rights
+
+    def get_hash(self) -> int:
+        """Get the Zobrist hash of the current position.
+
+        The hash covers piece placement, side to move and castling rights.
+
+        Returns:
+            int: The 64-bit Zobrist hash of the current position.
+        """
+        return self._hash
+
+    def get_turn(self) -> Color:
+        """Get the color of the team to move.
+
+        Returns:
+            Color: The color of the team to move.
+        """
+        return self._turn
+
+    def get_en_passant(self) -> Tuple[int, int]:
+        """Get the square a pawn can be captured on en passant.
+
+        Returns:
+            Tuple[int, int]: The en passant coordinates. If the last move was not a double pawn
+                advance return None.
+        """
+        return self._en_passant
+
+    def get_halfmove_clock(self) -> int:
+        """Get the number of plies since the last capture or pawn move.
+
+        Returns:
+            int: The halfmove clock of the fifty-move rule.
+        """
+        return self._halfmove_clock
+
+    def get_fullmove_number(self) -> int:
+        """Get the number of the current move, starting at 1 and incremented after black moves.
+
+        Returns:
+            int: The fullmove number.
+        """
+        return self._fullmove_number
+
+    def _update_moves(
+        self,
+        moved: Piece,
+        changed: int,
+        replaced_moves: List[
+            Tuple[Piece, Set[Tuple[int, int]], Set[Tuple[int, int]], int]
+        ] = None,
+    ) -> None:
+        """Recalculate the moves of the pieces affected by a change of the given squares.
+
+        Only the moved piece and the pieces whose move or capture rays pass through a changed
+        square can have different pseudo-legal moves and attacks after a move, so every other
+        cached move set and attack map entry is kept as is. The pins, checkers and legal moves
+        of both teams are updated afterwards. In debug mode every cached move set and attack
+        map entry is cross-checked against a full recalculation.
+
+        Args:
+            moved (Piece): The piece that was moved or placed.
+            changed (int): The bitmask of the squares whose occupant changed.
+            replaced_moves (List[Tuple[Piece, Set[Tuple[int, int]], Set[Tuple[int, int]], int]], optional):
+                Collects the cached move sets and attacks that are replaced. Defaults to None.
+        """
+        for team in [self._black, self._white]:
+            attack_map = self._attack_maps[team.color]
+            for piece in team.get_all_pieces():
+                if piece is moved or piece.get_reach_mask() & changed:
+                    if replaced_moves is not None:
+                        replaced_moves.append(
+                            (
+                                piece,
+                                piece._pseudo_moves,
+                                piece._valid_moves,
+                                attack_map.get_attacks(piece),
+                            )
+                        )
+                    moves, attacks = self._calculate_piece_moves_and_attacks(piece)
+                    piece._pseudo_moves = piece._valid_moves = moves
+                    attack_map.set_attacks(piece, attacks)
+        self._update_king_safety()
+        self._update_legal_moves(replaced_moves)
+
+        if self.debug:
+            self._verify_moves()
+
+    def _verify_moves(self) -> None:
+        """Cross-check the cached move sets, attack maps, pins, checkers and position hash
+        against a full recalculation.
+
+        Raises:
+            StaleMoveCache: Raises StaleMoveCache if a cached move set is out of date.
+            StaleAttackMap: Raises StaleAttackMap if an attack map, pin or checker is out of date.
+            StalePositionHash: Raises StalePositionHash if the position hash is out of date.
+        """
+        for team in [self._black, self._white]:
+            attack_map = self._attack_maps[team.color]
+            attacked = 0
+            for piece in team.get_all_pieces():
+                moves, attacks = self._calculate_piece_moves_and_attacks(piece)
+                if piece.get_pseudo_moves() != moves:
+                    raise StaleMoveCache(piece.coordinates)
+                if attack_map.get_attacks(piece) != attacks:
+                    raise StaleAttackMap(piece.coordinates)
+                attacked |= attacks
+            if attack_map.get_attacked() != attacked:
+                square = (attack_map.get_attacked() ^ attacked).bit_length() - 1
+                raise StaleAttackMap(COORDINATES[square])
+
+            king = team.get_king()
+            if king and (
+                self._checkers[team.color] != self._find_checkers(team)
+                or self._pins[team.color] != self._find_pins(team)
+            ):
+                raise StaleAttackMap(king.coordinates)
+
+            for piece in team.get_all_pieces():
+                if piece.get_moves() != self._calculate_legal_moves(piece):
+                    raise StaleMoveCache(piece.coordinates)
+
+        castling_rights = self._calculate_castling_rights()
+        if self._hash != hash_position(
+            self._board, self._turn, castling_rights, self._en_passant
+        ):
+            raise StalePositionHash(self._hash)
+
+        if self.get_scores() != self._calculate_scores():
+            raise StaleScores(self.get_scores())
+
+        if self._accumulator:
+            values = self._accumulator.calculate(self._all_pieces())
+            if abs(self._accumulator.values - values).max() > 1e-3:
+                raise StaleAccumulator()
 
     def _calculate_team_moves(self, team: Team) -> None:
         """Calculate moves for given team (Black or White).
@@ -51,15 +774,16 @@ class ChessEngine:
         Args:
             team (Team): The given chess team. Black or White.
         """
+        attack_map = self._attack_maps[team.color]
         for piece in team.get_all_pieces():
-            moves = self._calculate_piece_moves(piece)
-            piece.set_moves(moves)
+            moves, attacks = self._calculate_piece_moves_and_attacks(piece)
+            piece._pseudo_moves = piece._valid_moves = moves
+            attack_map.set_attacks(piece, attacks)
 
     def _calculate_piece_moves(self, piece: Piece) -> Set[Tuple[int, int]]:
         """Calculate possible moves a piece can make.
 
-        This method finds all possible moves for a given piece and ensures not
-        moving into a check or checkmate position.
+        The moves are pseudo-legal: they may leave the team's own king attacked.
 
         Args:
             piece (Piece): The chess piece.
@@ -67,46 +791,377 @@ class ChessEngine:
         Returns:
             Set[Tuple[int, int]]: The set of valid moves for the chess piece.
         """
+        return self._calculate_piece_moves_and_attacks(piece)[0]
+
+    def _calculate_piece_moves_and_attacks(
+        self, piece: Piece
+    ) -> Tuple[Set[Tuple[int, int]], int]:
+        """Calculate the possible moves of a piece and the squares it attacks.
+
+        The attacked squares are walked along the capture rays up to and including the first
+        occupied square of each ray, whichever team occupies it.
+
+        Args:
+            piece (Piece): The chess piece.
+
+        Returns:
+            Tuple[Set[Tuple[int, int]], int]: The set of valid moves for the chess piece and the
+                bitmask of the squares it attacks.
+        """
+        occupied = self._board.get_occupancy()
+        friendly = self._board.get_occupancy(piece.color)
+
         moves = set()
         for direction in piece.get_possible_moves():
             for move in direction:
-                if self._board.is_vacant(move):
-                    moves.add(move)
-                else:
+                row, col = move
+                if occupied >> (row * NUM_OF_COLS + col) & 1:
                     break
+                moves.add(move)
 
-        captures = set()
+        attacks = 0
         for direction in piece.get_possible_captures():
             for capture in direction:
-                if self._board.is_capture(piece, capture):
-                    captures.add(capture)
+                row, col = capture
+                square = row * NUM_OF_COLS + col
+                attacks |= 1 << square
+                if occupied >> square & 1:
+                    if not friendly >> square & 1:
+                        moves.add(capture)
                     break
-                if not self._board.is_vacant(capture):
+
+        return moves, attacks
+
+    def _update_king_safety(self) -> None:
+        """Recalculate the checkers and pinned pieces of both teams.
+
+        The dictionaries are replaced rather than updated in place, so the undo information
+        of a move can keep the previous ones.
+        """
+        self._checkers = {
+            Color.BLACK: self._find_checkers(self._black),
+            Color.WHITE: self._find_checkers(self._white),
+        }
+        self._pins = {
+            Color.BLACK: self._find_pins(self._black),
+            Color.WHITE: self._find_pins(self._white),
+        }
+
+    def _find_checkers(self, team: Team) -> int:
+        """Find the enemy pieces giving check to the given team's king.
+
+        Args:
+            team (Team): The given chess team.
+
+        Returns:
+            int: The bitmask of the squares of the checking pieces.
+        """
+        king = team.get_king()
+        enemy = self._white if team.color == Color.BLACK else self._black
+        attack_map = self._attack_maps[enemy.color]
+        if king is None or not attack_map.is_attacked(king.square):
+            return 0
+
+        checkers = 0
+        for piece in enemy.get_all_pieces():
+            if attack_map.get_attacks(piece) >> king.square & 1:
+                checkers |= 1 << piece.square
+        return checkers
+
+    def _find_pins(self, team: Team) -> Dict[int, int]:
+        """Find the pieces of the given team pinned to their king by an enemy rook, bishop or queen.
+
+        Args:
+            team (Team): The given chess team.
+
+        Returns:
+            Dict[int, int]: The bitmask of the squares each pinned piece may still move to
+                (the squares between its king and the pinning piece and the pinning piece's
+                square), keyed by the square index of the pinned piece.
+        """
+        king = team.get_king()
+        if king is None:
+            return {}
+
+        enemy_color = Color.WHITE if team.color == Color.BLACK else Color.BLACK
+        pins = {}
+        for ray_table, reach_table, pinners in PIN_RAYS:
+            enemy_sliders = 0
+            for name in pinners:
+                enemy_sliders |= self._board.get_bitboard(enemy_color, name)
+            if not reach_table[king.square] & enemy_sliders:
+                continue
+
+            for ray in ray_table[king.square]:
+                pinned = None
+                for coordinates in ray:
+                    piece = self._board.get_piece(coordinates)
+                    if piece is None:
+                        continue
+                    if pinned is None and piece.color == team.color:
+                        pinned = piece
+                        continue
+                    if pinned and piece.color == enemy_color and piece.name in pinners:
+                        pins[pinned.square] = (
+                            BETWEEN_MASKS[king.square][piece.square] | 1 << piece.square
+                        )
                     break
+        return pins
+
+    def _update_legal_moves(
+        self,
+        replaced_moves: List[
+            Tuple[Piece, Set[Tuple[int, int]], Set[Tuple[int, int]], int]
+        ] = None,
+    ) -> None:
+        """Update the legal moves of the pieces whose moves are restricted by king safety.
 
-        return moves.union(captures)
+        The pseudo-legal moves of a piece are all legal unless it is a king, it is pinned, its
+        king is in check or it can capture en passant. The legal move set of every other piece
+        is its pseudo-legal move set, so only the restricted pieces are filtered and the pieces
+        that were restricted before the move are reset.
+
+        Args:
+            replaced_moves (List[Tuple[Piece, Set[Tuple[int, int]], Set[Tuple[int, int]], int]], optional):
+                Collects the cached move sets that are replaced. Defaults to None.
+        """
+        restricted = set()
+        for team in [self._black, self._white]:
+            king = team.get_king()
+            if king is None:
+                continue
+            if self._checkers[team.color]:
+                restricted.update(team.get_all_pieces())
+            else:
+                restricted.add(king)
+                for square in self._pins[team.color]:
+                    restricted.add(self._board.get_piece(COORDINATES[square]))
+
+        if self._en_passant:
+            row = 3 if self._turn == Color.WHITE else 4
+            for col in [self._en_passant[1] - 1, self._en_passant[1] + 1]:
+                piece = (
+                    self._board.get_piece((row, col))
+                    if 0 <= col < NUM_OF_COLS
+                    else None
+                )
+                if piece and piece.name == PieceName.PAWN and piece.color == self._turn:
+                    restricted.add(piece)
+
+        for piece in self._restricted:
+            if (
+                piece not in restricted
+                and piece._valid_moves is not piece._pseudo_moves
+            ):
+                if replaced_moves is not None:
+                    replaced_moves.append(self._cached_moves(piece))
+                piece._valid_moves = piece._pseudo_moves
+        for piece in restricted:
+            if replaced_moves is not None:
+                replaced_moves.append(self._cached_moves(piece))
+            piece._valid_moves = self._calculate_legal_moves(piece)
+        self._restricted = restricted
+
+    def _cached_moves(
+        self, piece: Piece
+    ) -> Tuple[Piece, Set[Tuple[int, int]], Set[Tuple[int, int]], int]:
+        """Get the cached move sets and attacks of a piece to restore them later.
+
+        Args:
+            piece (Piece): The chess piece.
+
+        Returns:
+            Tuple[Piece, Set[Tuple[int, int]], Set[Tuple[int, int]], int]: The piece, its
+                pseudo-legal and legal move sets and the bitmask of the squares it attacks.
+        """
+        attacks = self._attack_maps[piece.color].get_attacks(piece)
+        return piece, piece._pseudo_moves, piece._valid_moves, attacks
+
+    def _calculate_legal_moves(self, piece: Piece) -> Set[Tuple[int, int]]:
+        """Calculate the legal moves of a piece from its pseudo-legal moves.
+
+        Against a single checker the piece must capture the checker or block its line, against
+        two checkers only the king can move, and a pinned piece must stay on the line between
+        its king and the pinning piece. En passant captures of the team to move are added.
+
+        Args:
+            piece (Piece): The chess piece.
+
+        Returns:
+            Set[Tuple[int, int]]: The set of legal moves for the chess piece. The pseudo-legal
+                move set itself if no move is restricted.
+        """
+        moves = piece._pseudo_moves
+        king = self.get_team(piece.color).get_king()
+        if king is None:
+            return moves
+        if piece is king:
+            return self._calculate_king_moves(king)
+
+        checkers = self._checkers[piece.color]
+        pin = self._pins[piece.color].get(piece.square)
+        if checkers & (checkers - 1):
+            return set()
+        if checkers or pin:
+            targets = -1
+            if checkers:
+                checker = checkers.bit_length() - 1
+                targets = BETWEEN_MASKS[king.square][checker] | checkers
+            if pin:
+                targets &= pin
+            moves = {
+                (row, col)
+                for row, col in moves
+                if targets >> (row * NUM_OF_COLS + col) & 1
+            }
+
+        en_passant = self._en_passant
+        if (
+            en_passant
+            and piece.name == PieceName.PAWN
+            and piece.color == self._turn
+            and any(ray[0] == en_passant for ray in piece.get_possible_captures())
+            and self._is_en_passant_legal(piece, king)
+        ):
+            moves = moves | {en_passant}
+        return moves
+
+    def _calculate_king_moves(self, king: King) -> Set[Tuple[int, int]]:
+        """Calculate the legal moves of a king, including castling.
+
+        The king cannot move to an attacked square nor retreat along the line of a sliding
+        checker, whose attacks stop at the king in the attack map. Castling requires the
+        castling right, vacant squares between the king and the rook and a king that is not
+        in check and does not cross an attacked square.
+
+        Args:
+            king (King): The king.
+
+        Returns:
+            Set[Tuple[int, int]]: The set of legal moves for the king.
+        """
+        checkers = self._checkers[king.color]
+        enemy_color = Color.WHITE if king.color == Color.BLACK else Color.BLACK
+        attacked = self._attack_maps[enemy_color].get_attacked()
+        sliding_checkers = [
+            square
+            for square in iter_squares(checkers)
+            if self._board.get_piece(COORDINATES[square]).name in SLIDING_PIECES
+        ]
+
+        moves = set()
+        for row, col in king._pseudo_moves:
+            square = row * NUM_OF_COLS + col
+            if attacked >> square & 1:
+                continue
+            if any(
+                BETWEEN_MASKS[checker][square] >> king.square & 1
+                for checker in sliding_checkers
+            ):
+                continue
+            moves.add((row, col))
+
+        if not checkers:
+            occupied = self._board.get_occupancy()
+            for king_dest, castling_move in CASTLING_MOVES.items():
+                right, color, _, _, vacant, crossed = castling_move
+                if (
+                    color == king.color
+                    and self._castling_rights & right
+                    and not occupied & vacant
+                    and not attacked & crossed
+                ):
+                    moves.add(king_dest)
+        return moves
+
+    def _is_en_passant_legal(self, pawn: Pawn, king: King) -> bool:
+        """Determine if capturing en passant with the given pawn leaves its king safe.
+
+        The capture removes two pawns from the same row at once, so besides the usual checks
+        and pins the king is tested against the rooks, bishops and queens on the board after the
+        capture.
+
+        Args:
+            pawn (Pawn): The capturing pawn.
+            king (King): The king of the capturing pawn.
+
+        Returns:
+            bool: True if the pawn beside the capturing pawn can be captured en passant and the
+                capture is legal. Otherwise, False.
+        """
+        dest_square = to_square(self._en_passant)
+        captured_square = pawn.square - pawn.square % NUM_OF_COLS + self._en_passant[1]
+        enemy_color = Color.WHITE if pawn.color == Color.BLACK else Color.BLACK
+        if (
+            not self._board.get_bitboard(enemy_color, PieceName.PAWN) >> captured_square
+            & 1
+        ):
+            return False
+        for checker in iter_squares(self._checkers[king.color]):
+            checker_name = self._board.get_piece(COORDINATES[checker]).name
+            if checker != captured_square and checker_name not in SLIDING_PIECES:
+                return False
+
+        occupied = (
+            self._board.get_occupancy() ^ 1 << pawn.square ^ 1 << captured_square
+        ) | 1 << dest_square
+        for ray_table, _, pinners in PIN_RAYS:
+            for ray in ray_table[king.square]:
+                for coordinates in ray:
+                    square = to_square(coordinates)
+                    if not occupied >> square & 1:
+                        continue
+                    if square != dest_square:
+                        piece = self._board.get_piece(coordinates)
+                        if piece.color != king.color and piece.name in pinners:
+                            return False
+                    break
+        return True
 
     def put_piece(self, team: Team, piece: Piece, dest: Tuple[int, int]) -> None:
+        """Place a new chess piece on dest, replacing the piece on dest if there is one.
+
+        The replaced piece is removed from its team and the position hash, scores and cached
+        moves are updated along with the board.
+
+        Args:
+            team (Team): The team the new piece is added to.
+            piece (Piece): The chess piece, not yet on the board.
+            dest (Tuple[int, int]): The dest coordinates.
+        """
+        dest_square = to_square(dest)
+        replaced = self._board.get_piece(dest)
+        if replaced:
+            self._hash ^= PIECE_KEYS[replaced.color][replaced.name][dest_square]
+            self._score_piece(replaced, dest_square, -1)
+            self.get_team(replaced.color).remove_piece(replaced)
+            self._remove_attacks(replaced)
+        self._hash ^= PIECE_KEYS[piece.color][piece.name][dest_square]
+        self._score_piece(piece, dest_square, 1)
+
         self._board.put_piece(piece, dest)
         team.add_piece(piece)
 
+        if 1 << dest_square & CASTLING_MASK:
+            self._update_castling_rights()
+        self._update_moves(piece, 1 << dest_square)
+
     def move_or_capture(self, team: Team, piece: Piece, dest: Tuple[int, int]) -> Piece:
-        captured = None
-        if self._board.is_vacant(dest):
-            self._board._pickup_piece(piece)
-            self._board.put_piece(piece, dest)
-        elif self._board.is_capture(piece, dest):
-            self._board._pickup_piece(piece)
-            captured = self._board._pickup_piece(coordinates=dest)
-            self._board.put_piece(piece, dest)
-            team.remove_piece(captured)
+        """Move the piece to dest if it is vacant or capture the enemy piece on dest.
 
-        self._calculate_team_moves(self._black)
-        self._calculate_team_moves(self._white)
+        Args:
+            team (Team): The team of the piece that may be captured.
+            piece (Piece): The chess piece to move.
+            dest (Tuple[int, int]): The dest coordinates.
 
-        return captured
+        Returns:
+            Piece: The captured piece. If the move is not a capture return None.
+        """
+        if self._board.is_vacant(dest) or self._board.is_capture(piece, dest):
+            return self._move_piece(piece, dest)
+        return None
 
-    def is_check(self, team: Team, enemy: Team) -> bool:
+    def is_check(self, team: Team) -> bool:
         """Determines if given team is in a check position.
 
         Args:
@@ -115,11 +1170,7 @@ class ChessEngine:
         Returns:
             bool: True if given team is in a check position. Otherwise, False.
         """
-        king_coordinates = team.get_king().coordinates
-        for piece, move in enemy.get_moves():
-            if move == king_coordinates:
-                return True
-        return False
+        return bool(self._checkers[team.color])
 
     def is_checkmate(self, team: Team) -> bool:
         """Determines if the given team is in a checkmate position.
@@ -130,7 +1181,151 @@ class ChessEngine:
         Returns:
             bool: True if the given team is in a checkmate position. Otherwise, False.
         """
-        return True
+        return bool(self._checkers[team.color]) and not self._has_legal_moves(team)
+
+    def is_stalemate(self, team: Team) -> bool:
+        """Determines if the given team is in a stalemate position.
+
+        Args:
+            team (Team): The given chess team.
+
+        Returns:
+            bool: True if the given team is not in check and has no legal moves. Otherwise, False.
+        """
+        return not self._checkers[team.color] and not self._has_legal_moves(team)
+
+    def _has_legal_moves(self, team: Team) -> bool:
+        """Determine if any piece of the given team has a legal move.
+
+        Args:
+            team (Team): The given chess team.
+
+        Returns:
+            bool: True if the team has at least one legal move. Otherwise, False.
+        """
+        return any(piece.get_moves() for piece in team.get_all_pieces())
+
+    def get_attack_map(self, color: Color) -> AttackMap:
+        """Get the attack map of the team of the given color.
+
+        Args:
+            color (Color): The color of the team.
+
+        Returns:
+            AttackMap: The attack map of the team.
+        """
+        return self._attack_maps[color]
+
+    def get_checkers(self, color: Color) -> int:
+        """Get the enemy pieces giving check to the king of the given color.
+
+        Args:
+            color (Color): The color of the king.
+
+        Returns:
+            int: The bitmask of the squares of the checking pieces.
+        """
+        return self._checkers[color]
+
+    def get_pins(self, color: Color) -> Dict[int, int]:
+        """Get the pieces of the given color pinned to their king.
+
+        Args:
+            color (Color): The color of the pinned pieces.
+
+        Returns:
+            Dict[int, int]: The bitmask of the squares each pinned piece may still move to,
+                keyed by the square index of the pinned piece.
+        """
+        return self._pins[color]
+
+    def get_team(self, color: Color) -> Team:
+        """Get the team of the given color.
+
+        Args:
+            color (Color): The color of the team.
+
+        Returns:
+            Team: The black or white team.
+        """
+        return self._white if color == Color.WHITE else self._black
+
+    def generate_moves(self) -> List[Move]:
+        """Generate the legal moves of the team to move from the cached piece moves.
+
+        A pawn move to the last row is generated once for every promotion piece.
+
+        Returns:
+            List[Move]: The legal moves of the team to move.
+        """
+        team = self._white if self._turn == Color.WHITE else self._black
+        promotion_row = PROMOTION_ROWS[self._turn]
+        moves = []
+        for piece in team.get_all_pieces():
+            src = piece.coordinates
+            if piece.name == PieceName.PAWN and abs(src[0] - promotion_row) == 1:
+                for dest in piece.get_moves():
+                    for promotion in PROMOTION_PIECES:
+                        moves.append(Move(src, dest, promotion))
+            else:
+                for dest in piece.get_moves():
+                    moves.append(Move(src, dest))
+        return moves
+
+    def generate_legal_moves(self) -> List[Move]:
+        """Generate the legal moves of the team to move.
+
+        The cached piece moves are already legal, so this is the same as
+        ChessEngine.generate_moves.
+
+        Returns:
+            List[Move]: The legal moves of the team to move.
+        """
+        return self.generate_moves()
+
+    def perft(self, depth: int) -> int:
+        """Count the leaf nodes of the legal move tree of the given depth.
+
+        Args:
+            depth (int): The depth of the move tree in plies.
+
+        Returns:
+            int: The number of leaf nodes.
+        """
+        moves = self.generate_legal_moves()
+        if depth <= 1:
+            return len(moves) if depth == 1 else 1
+
+        nodes = 0
+        for move in moves:
+            undo = self.make_move(move)
+            nodes += self.perft(depth - 1)
+            self.unmake_move(undo)
+        return nodes
+
+    def divide(self, depth: int) -> Dict[Move, int]:
+        """Count the leaf nodes of the legal move tree of the given depth per root move.
+
+        Args:
+            depth (int): The depth of the move tree in plies.
+
+        Returns:
+            Dict[Move, int]: The number of leaf nodes below each legal move.
+        """
+        nodes = {}
+        for move in self.generate_legal_moves():
+            undo = self.make_move(move)
+            nodes[move] = self.perft(depth - 1)
+            self.unmake_move(undo)
+        return nodes
+
+    def get_board(self) -> Board:
+        """Get the chess board.
+
+        Returns:
+            Board: The chess board.
+        """
+        return self._board
 
     def get_piece(self, coordinates: Tuple[int, int]) -> Piece:
         return self._board.get_piece(coordinates)
@@ -53,3 +53,29 @@ PIECES = {
     "q": PieceName.QUEEN,
     "k": PieceName.KING,
 }
+
+
+"""Castling Rights Bit Flags"""
+WHITE_KINGSIDE = 1
+WHITE_QUEENSIDE = 2
+BLACK_KINGSIDE = 4
+BLACK_QUEENSIDE = 8
+
+"""Castling Rights (bit flag, color, king coordinates, rook coordinates)"""
+CASTLING = [
+    (WHITE_KINGSIDE, Color.WHITE, (7, 4), (7, 7)),
+    (WHITE_QUEENSIDE, Color.WHITE, (7, 4), (7, 0)),
+    (BLACK_KINGSIDE, Color.BLACK, (0, 4), (0, 7)),
+    (BLACK_QUEENSIDE, Color.BLACK, (0, 4), (0, 0)),
+]
+
+"""Castling Rights FEN Characters"""
+CASTLING_FEN = {
+    WHITE_KINGSIDE: "K",
+    WHITE_QUEENSIDE: "Q",
+    BLACK_KINGSIDE: "k",
+    BLACK_QUEENSIDE: "q",
+}
+
+"""Standard Chess Starting Position FEN"""
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
@@ -0,0 +1,246 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from src.bitboard import NUM_OF_SQUARES, iter_squares, popcount
+from src.chess_engine import ChessEngine
+from src.constants import NUM_OF_COLS, NUM_OF_ROWS, Color, PieceName
+from src.pieces.move_tables import REACH_TABLES
+from src.piece_square_tables import MAX_PHASE
+
+"""Centipawn bonus of each legal move of a piece, by piece name"""
+MOBILITY_WEIGHTS = {
+    PieceName.KNIGHT: 4,
+    PieceName.BISHOP: 5,
+    PieceName.ROOK: 2,
+    PieceName.QUEEN: 1,
+}
+
+"""Middlegame and endgame penalty of every pawn beyond the first on a file"""
+DOUBLED_PAWN_PENALTY = (10, 20)
+
+"""Middlegame and endgame penalty of a pawn without friendly pawns on the adjacent files"""
+ISOLATED_PAWN_PENALTY = (10, 15)
+
+"""Middlegame and endgame bonus of a passed pawn, indexed by the number of ranks it advanced"""
+PASSED_PAWN_BONUS = [(0, 0), (5, 10), (10, 20), (20, 35), (35, 60), (60, 100)]
+
+"""Middlegame bonus of every friendly pawn sheltering the king"""
+PAWN_SHIELD_BONUS = 10
+
+"""Middlegame penalty of every square next to the king attacked by the enemy"""
+KING_ZONE_ATTACK_PENALTY = 8
+
+"""Maximum number of pawn structure scores kept in the pawn cache"""
+PAWN_CACHE_SIZE = 16384
+
+"""Row a pawn of each color starts on"""
+PAWN_START_ROWS = {Color.BLACK: 1, Color.WHITE: NUM_OF_ROWS - 2}
+
+"""Row direction a pawn of each color advances in"""
+PAWN_DIRECTIONS = {Color.BLACK: 1, Color.WHITE: -1}
+
+
+def _build_file_masks() -> List[int]:
+    """Build the bitmask of every square of each file.
+
+    Returns:
+        List[int]: The file bitmasks indexed by column.
+    """
+    return [
+        sum(1 << (row * NUM_OF_COLS + col) for row in range(NUM_OF_ROWS))
+        for col in range(NUM_OF_COLS)
+    ]
+
+
+"""Bitmask of every square of a file, indexed by column"""
+FILE_MASKS = _build_file_masks()
+
+"""Bitmask of every square of the files next to a file, indexed by column"""
+ADJACENT_FILE_MASKS = [
+    (FILE_MASKS[col - 1] if col > 0 else 0)
+    | (FILE_MASKS[col + 1] if col < NUM_OF_COLS - 1 else 0)
+    for col in range(NUM_OF_COLS)
+]
+
+
+def _build_front_masks(
+    files: List[int], rows_ahead: int = NUM_OF_ROWS
+) -> Dict[Color, List[int]]:
+    """Build the bitmask of the squares in front of every square on the given files.
+
+    Args:
+        files (List[int]): The bitmasks of the files in front of a square, indexed by column.
+        rows_ahead (int, optional): The number of rows in front of the square. Defaults to
+            NUM_OF_ROWS (up to the edge of the board).
+
+    Returns:
+        Dict[Color, List[int]]: The front bitmasks indexed by color and then by square index.
+    """
+    masks = {}
+    for color, direction in PAWN_DIRECTIONS.items():
+        masks[color] = []
+        for square in range(NUM_OF_SQUARES):
+            row, col = divmod(square, NUM_OF_COLS)
+            rows = 0
+            for step in range(1, rows_ahead + 1):
+                ahead = row + step * direction
+                if 0 <= ahead < NUM_OF_ROWS:
+                    rows |= 0xFF << (ahead * NUM_OF_COLS)
+            masks[color].append(rows & files[col])
+    return masks
+
+
+"""Squares that must be free of enemy pawns for a pawn to be passed, indexed by color and square"""
+PASSED_PAWN_MASKS = _build_front_masks(
+    [FILE_MASKS[col] | ADJACENT_FILE_MASKS[col] for col in range(NUM_OF_COLS)]
+)
+
+"""Squares of the pawn shield in front of a king, indexed by color and square"""
+PAWN_SHIELD_MASKS = _build_front_masks(
+    [FILE_MASKS[col] | ADJACENT_FILE_MASKS[col] for col in range(NUM_OF_COLS)],
+    rows_ahead=2,
+)
+
+
+@dataclass
+class Evaluator:
+    """Static Evaluation
+
+    The evaluator scores a position with a tapered evaluation of material, piece-square tables,
+    mobility, pawn structure and king safety. The material and piece-square scores are the
+    running totals kept by the chess engine, the mobility is counted from the cached legal moves
+    of each piece and the pawn structure scores are cached by the pawn bitboards of both teams.
+    """
+
+    mobility_weights: Dict[PieceName, int] = field(
+        default_factory=lambda: dict(MOBILITY_WEIGHTS)
+    )
+    pawn_cache_size: int = PAWN_CACHE_SIZE
+    _pawn_cache: Dict[Tuple[int, int], Tuple[int, int]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def evaluate(self, engine: ChessEngine) -> int:
+        """Evaluate the current position of the chess engine.
+
+        Args:
+            engine (ChessEngine): The chess engine.
+
+        Returns:
+            int: The score in centipawns from the point of view of the team to move.
+        """
+        mg_score, eg_score, phase = engine.get_scores()
+        pawn_mg_score, pawn_eg_score = self._evaluate_pawns(engine)
+        mobility = self._evaluate_mobility(engine)
+        mg_score += pawn_mg_score + mobility + self._evaluate_king_safety(engine)
+        eg_score += pawn_eg_score + mobility
+
+        # promotions can push the phase above the phase of the starting position
+        phase = min(phase, MAX_PHASE)
+        score = (mg_score * phase + eg_score * (MAX_PHASE - phase)) // MAX_PHASE
+        return score if engine.get_turn() == Color.WHITE else -score
+
+    def _evaluate_mobility(self, engine: ChessEngine) -> int:
+        """Score the number of legal moves of the knights, bishops, rooks and queens.
+
+        Args:
+            engine (ChessEngine): The chess engine.
+
+        Returns:
+            int: The mobility score in centipawns from white's point of view.
+        """
+        score = 0
+        for color, sign in [(Color.WHITE, 1), (Color.BLACK, -1)]:
+            for piece in engine.get_team(color).get_all_pieces():
+                weight = self.mobility_weights.get(piece.name)
+                if weight:
+                    score += sign * weight * len(piece.get_moves())
+        return score
+
+    def _evaluate_pawns(self, engine: ChessEngine) -> Tuple[int, int]:
+        """Score the doubled, isolated and passed pawns of both teams.
+
+        The pawn structure only depends on the pawn bitboards, so the scores are cached by them.
+        The cache is cleared once it holds pawn_cache_size entries.
+
+        Args:
+            engine (ChessEngine): The chess engine.
+
+        Returns:
+            Tuple[int, int]: The middlegame and endgame pawn structure scores in centipawns from
+                white's point of view.
+        """
+        board = engine.get_board()
+        key = (
+            board.get_bitboard(Color.WHITE, PieceName.PAWN),
+            board.get_bitboard(Color.BLACK, PieceName.PAWN),
+        )
+        scores = self._pawn_cache.get(key)
+        if scores is None:
+            white_mg, white_eg = _score_pawns(Color.WHITE, key[0], key[1])
+            black_mg, black_eg = _score_pawns(Color.BLACK, key[1], key[0])
+            scores = (white_mg - black_mg, white_eg - black_eg)
+            if len(self._pawn_cache) >= self.pawn_cache_size:
+                self._pawn_cache.clear()
+            self._pawn_cache[key] = scores
+        return scores
+
+    def _evaluate_king_safety(self, engine: ChessEngine) -> int:
+        """Score the pawn shield of each king and the enemy attacks next to it.
+
+        Args:
+            engine (ChessEngine): The chess engine.
+
+        Returns:
+            int: The middlegame king safety score in centipawns from white's point of view.
+        """
+        board = engine.get_board()
+        score = 0
+        for color, enemy, sign in [
+            (Color.WHITE, Color.BLACK, 1),
+            (Color.BLACK, Color.WHITE, -1),
+        ]:
+            king = engine.get_team(color).get_king()
+            if king is None:
+                continue
+            pawns = board.get_bitboard(color, PieceName.PAWN)
+            shield = popcount(PAWN_SHIELD_MASKS[color][king.square] & pawns)
+            zone = REACH_TABLES[(PieceName.KING, color)][king.square]
+            attacked = popcount(zone & engine.get_attack_map(enemy).get_attacked())
+            score += sign * (
+                shield * PAWN_SHIELD_BONUS - attacked * KING_ZONE_ATTACK_PENALTY
+            )
+        return score
+
+
+def _score_pawns(color: Color, pawns: int, enemy_pawns: int) -> Tuple[int, int]:
+    """Score the doubled, isolated and passed pawns of one team.
+
+    Args:
+        color (Color): The color of the team.
+        pawns (int): The pawn bitboard of the team.
+        enemy_pawns (int): The pawn bitboard of the enemy team.
+
+    Returns:
+        Tuple[int, int]: The middlegame and endgame scores in centipawns of the team.
+    """
+    mg_score, eg_score = 0, 0
+    for col in range(NUM_OF_COLS):
+        count = popcount(pawns & FILE_MASKS[col])
+        if count > 1:
+            mg_score -= (count - 1) * DOUBLED_PAWN_PENALTY[0]
+            eg_score -= (count - 1) * DOUBLED_PAWN_PENALTY[1]
+        if count and not pawns & ADJACENT_FILE_MASKS[col]:
+            mg_score -= count * ISOLATED_PAWN_PENALTY[0]
+            eg_score -= count * ISOLATED_PAWN_PENALTY[1]
+
+    start_row, direction = PAWN_START_ROWS[color], PAWN_DIRECTIONS[color]
+    for square in iter_squares(pawns):
+        if not enemy_pawns & PASSED_PAWN_MASKS[color][square]:
+            advanced = (square // NUM_OF_COLS - start_row) * direction
+            # a pawn placed on a back row, e.g. by put_piece, scores as the nearest table rank
+            advanced = min(max(advanced, 0), len(PASSED_PAWN_BONUS) - 1)
+            mg_bonus, eg_bonus = PASSED_PAWN_BONUS[advanced]
+            mg_score += mg_bonus
+            eg_score += eg_bonus
+    return mg_score, eg_score
@@ -41,3 +41,65 @@ class InvalidUserInput(Exception):
 class InvalidCoordinatesUserInput(Exception):
     def __init__(self, coordinates: str) -> None:
         super().__init__(f"Coordinates {coordinates} is an invalid user input.")
+
+
+class StaleMoveCache(Exception):
+    def __init__(self, coordinates: Tuple[int, int]) -> None:
+        row, col = coordinates
+        super().__init__(
+            f"Cached moves of piece at ({row}, {col}) do not match a full recalculation!"
+        )
+
+
+class StalePositionHash(Exception):
+    def __init__(self, key: int) -> None:
+        super().__init__(
+            f"Position hash {key:#018x} does not match a full recalculation!"
+        )
+
+
+class InvalidFen(Exception):
+    def __init__(self, fen: str) -> None:
+        super().__init__(f"FEN {fen} is not a valid chess position.")
+
+
+class StaleAttackMap(Exception):
+    def __init__(self, coordinates: Tuple[int, int]) -> None:
+        row, col = coordinates
+        super().__init__(
+            f"Attack map entry of square ({row}, {col}) does not match a full recalculation!"
+        )
+
+
+class StaleScores(Exception):
+    def __init__(self, scores: Tuple[int, int, int]) -> None:
+        super().__init__(
+            f"Running evaluation scores {scores} do not match a full recalculation!"
+        )
+
+
+class StaleAccumulator(Exception):
+    def __init__(self) -> None:
+        super().__init__("NNUE accumulator does not match a full recalculation!")
+
+
+class InvalidUciMove(Exception):
+    def __init__(self, move: str) -> None:
+        super().__init__(f"Move {move} is not a legal move in UCI notation.")
+
+
+class InvalidSan(Exception):
+    def __init__(self, san: str, fen: str) -> None:
+        super().__init__(f"Move {san} is not a legal move in position {fen}.")
+
+
+class InvalidBookFile(Exception):
+    def __init__(self, file_path: str) -> None:
+        super().__init__(f"{file_path} is not a valid opening book file.")
+
+
+class InvalidBitboards(Exception):
+    def __init__(self, index: int) -> None:
+        super().__init__(
+            f"Bitboards of position {index} overlap or have more than 32 pieces."
+        )
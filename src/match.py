@@ -0,0 +1,386 @@
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, TextIO, Tuple
+
+from src.chess_engine import ChessEngine
+from src.constants import Color, PieceName
+from src.evaluation import Evaluator
+from src.move import Move
+from src.nnue import NnueEvaluator
+from src.search import Search
+from src.transposition_table import TranspositionTable
+from src.utils.pgn import PgnGame, write_game
+
+"""Positions after common opening moves, each played twice with the colors swapped"""
+OPENINGS = [
+    "r1bqkbnr/pppp1ppp/2n5/1B2p3/4P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3",
+    "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3",
+    "rnbqkbnr/pp2pppp/3p4/2p5/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 0 3",
+    "rnbqkbnr/pp1ppppp/8/2p5/4P3/2N5/PPPP1PPP/R1BQKBNR b KQkq - 1 2",
+    "rnbqkbnr/ppp2ppp/4p3/3p4/3PP3/8/PPP2PPP/RNBQKBNR w KQkq d6 0 3",
+    "rnbqkbnr/pp2pppp/2p5/3p4/3PP3/8/PPP2PPP/RNBQKBNR w KQkq d6 0 3",
+    "rnbqkbnr/ppp2ppp/4p3/3p4/2PP4/8/PP2PPPP/RNBQKBNR w KQkq - 0 3",
+    "rnbqkbnr/pp2pppp/2p5/3p4/2PP4/8/PP2PPPP/RNBQKBNR w KQkq - 0 3",
+    "rnbqkb1r/pppppp1p/5np1/8/2PP4/8/PP2PPPP/RNBQKBNR w KQkq - 0 3",
+    "rnbqk2r/pppp1ppp/4pn2/8/1bPP4/2N5/PP2PPPP/R1BQKBNR w KQkq - 2 4",
+    "rnbqkbnr/pppp1ppp/8/4p3/2P5/8/PP1PPPPP/RNBQKBNR w KQkq e6 0 2",
+    "rnbqkbnr/ppp1pppp/8/3p4/8/5NP1/PPPPPP1P/RNBQKB1R b KQkq - 0 2",
+]
+
+"""Game results in PGN notation"""
+WHITE_WINS = "1-0"
+BLACK_WINS = "0-1"
+DRAW = "1/2-1/2"
+
+"""Z-score of the 95% confidence interval of the Elo difference"""
+CONFIDENCE_Z_SCORE = 1.96
+
+
+@dataclass
+class EngineConfig:
+    """Engine Configuration
+
+    The search settings of one side of a match. A move is searched to the given depth or until
+    the time per move is spent, whichever comes first.
+    """
+
+    name: str
+    depth: int = None
+    move_time: float = 0.1
+    size_mb: int = 16
+    nnue_weights: str = None
+
+    def create_search(self, engine: ChessEngine) -> Search:
+        """Create a search of the chess engine with the settings of the configuration.
+
+        Args:
+            engine (ChessEngine): The chess engine.
+
+        Returns:
+            Search: The search.
+        """
+        if self.nnue_weights:
+            evaluator = NnueEvaluator.load(self.nnue_weights)
+        else:
+            evaluator = Evaluator()
+        return Search(
+            engine, table=TranspositionTable(size_mb=self.size_mb), evaluator=evaluator
+        )
+
+
+@dataclass
+class GameResult:
+    """Result of one game of a match with the search statistics of both engines."""
+
+    round_number: int
+    white: str
+    black: str
+    fen: str
+    moves: List[Move]
+    result: str
+    termination: str
+    nodes: Dict[str, int]
+    seconds: Dict[str, float]
+
+    def score(self, name: str) -> float:
+        """Get the score of an engine in the game.
+
+        Args:
+            name (str): The name of the engine.
+
+        Returns:
+            float: 1 for a win, 0.5 for a draw and 0 for a loss.
+        """
+        if self.result == DRAW:
+            return 0.5
+        winner = self.white if self.result == WHITE_WINS else self.black
+        return 1.0 if winner == name else 0.0
+
+    def to_pgn(self, event: str = "Engine Match") -> PgnGame:
+        """Convert the game to a PGN game.
+
+        Args:
+            event (str, optional): The event tag. Defaults to "Engine Match".
+
+        Returns:
+            PgnGame: The PGN game.
+        """
+        headers = {
+            "Event": event,
+            "Site": "?",
+            "Date": time.strftime("%Y.%m.%d"),
+            "Round": str(self.round_number),
+            "White": self.white,
+            "Black": self.black,
+            "Result": self.result,
+            "SetUp": "1",
+            "FEN": self.fen,
+            "Termination": self.termination,
+        }
+        return PgnGame(headers, list(self.moves))
+
+
+@dataclass
+class MatchResult:
+    """Score of the first engine against the second and the search statistics of both."""
+
+    first: str
+    second: str
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    nodes: Dict[str, int] = field(default_factory=dict)
+    seconds: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, game: GameResult) -> None:
+        """Add the result and statistics of a game.
+
+        Args:
+            game (GameResult): The game.
+        """
+        score = game.score(self.first)
+        if score == 1.0:
+            self.wins += 1
+        elif score == 0.0:
+            self.losses += 1
+        else:
+            self.draws += 1
+        for name in (game.white, game.black):
+            self.nodes[name] = self.nodes.get(name, 0) + game.nodes[name]
+            self.seconds[name] = self.seconds.get(name, 0.0) + game.seconds[name]
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    @property
+    def score(self) -> float:
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.5
+
+    def nodes_per_second(self, name: str) -> float:
+        """Get the nodes searched per second by an engine over all its moves.
+
+        Args:
+            name (str): The name of the engine.
+
+        Returns:
+            float: The nodes per second.
+        """
+        seconds = self.seconds.get(name, 0.0)
+        return self.nodes.get(name, 0) / seconds if seconds else 0.0
+
+    def elo(self) -> Tuple[float, float]:
+        """Estimate the Elo difference of the first engine over the second.
+
+        The error margin is the half width of the 95% confidence interval, from the standard
+        deviation of the game scores.
+
+        Returns:
+            Tuple[float, float]: The Elo difference and its error margin.
+        """
+        if not self.games:
+            return 0.0, math.inf
+        score = self.score
+        deviation = math.sqrt(
+            (
+                self.wins * (1 - score) ** 2
+                + self.losses * score**2
+                + self.draws * (0.5 - score) ** 2
+            )
+            / self.games
+        )
+        margin = CONFIDENCE_Z_SCORE * deviation / math.sqrt(self.games)
+        low, high = _elo(score - margin), _elo(score + margin)
+        return _elo(score), (high - low) / 2
+
+
+def _elo(score: float) -> float:
+    """Convert an expected score to an Elo difference.
+
+    Args:
+        score (float): The expected score between 0 and 1.
+
+    Returns:
+        float: The Elo difference, infinite for a score of 0 or 1.
+    """
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+def _is_insufficient_material(engine: ChessEngine) -> bool:
+    """Determine if neither team has the material to checkmate, i.e. a lone king against a
+    king with at most one knight or bishop.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+
+    Returns:
+        bool: True if the position is a dead draw. Otherwise, False.
+    """
+    pieces = [
+        piece.name
+        for color in Color
+        for piece in engine.get_team(color).get_all_pieces()
+        if piece.name != PieceName.KING
+    ]
+    return not pieces or pieces in ([PieceName.KNIGHT], [PieceName.BISHOP])
+
+
+def play_game(
+    white: EngineConfig,
+    black: EngineConfig,
+    fen: str,
+    round_number: int = 1,
+    max_plies: int = 300,
+    time_margin: float = 1.0,
+) -> GameResult:
+    """Play a game between two engine configurations.
+
+    The game ends by checkmate, stalemate, threefold repetition, the fifty-move rule,
+    insufficient material or when the ply limit is reached, which is adjudicated as a draw. An
+    engine that overruns its time per move by more than the margin loses on time.
+
+    Args:
+        white (EngineConfig): The configuration of the white engine.
+        black (EngineConfig): The configuration of the black engine.
+        fen (str): The FEN string of the opening position.
+        round_number (int, optional): The round of the game in the match. Defaults to 1.
+        max_plies (int, optional): The maximum length of the game in plies. Defaults to 300.
+        time_margin (float, optional): The time a move may overrun the time per move in
+            seconds. Defaults to 1.0.
+
+    Returns:
+        GameResult: The result of the game.
+    """
+    engine = ChessEngine.from_fen(fen)
+    configs = {Color.WHITE: white, Color.BLACK: black}
+    searches = {
+        color: config.create_search(engine) for color, config in configs.items()
+    }
+    nodes = {white.name: 0, black.name: 0}
+    seconds = {white.name: 0.0, black.name: 0.0}
+    repetitions = {engine.get_hash(): 1}
+    moves = []
+
+    def finish(result: str, termination: str) -> GameResult:
+        return GameResult(
+            round_number,
+            white.name,
+            black.name,
+            fen,
+            moves,
+            result,
+            termination,
+            nodes,
+            seconds,
+        )
+
+    while True:
+        turn = engine.get_turn()
+        config = configs[turn]
+        loser_wins = BLACK_WINS if turn == Color.WHITE else WHITE_WINS
+        if not engine.generate_moves():
+            if engine.is_check(engine.get_team(turn)):
+                return finish(loser_wins, "checkmate")
+            return finish(DRAW, "stalemate")
+        if repetitions[engine.get_hash()] >= 3:
+            return finish(DRAW, "threefold repetition")
+        if engine.get_halfmove_clock() >= 100:
+            return finish(DRAW, "fifty-move rule")
+        if _is_insufficient_material(engine):
+            return finish(DRAW, "insufficient material")
+        if len(moves) >= max_plies:
+            return finish(DRAW, "adjudication")
+
+        search = searches[turn]
+        start = time.perf_counter()
+        best_move, _, _ = search.search(config.depth, config.move_time)
+        elapsed = time.perf_counter() - start
+        nodes[config.name] += search.nodes
+        seconds[config.name] += elapsed
+        if config.move_time is not None and elapsed > config.move_time + time_margin:
+            return finish(loser_wins, "time forfeit")
+
+        engine.make_move(best_move)
+        moves.append(best_move)
+        key = engine.get_hash()
+        repetitions[key] = repetitions.get(key, 0) + 1
+
+
+@dataclass
+class Match:
+    """Engine Match
+
+    Plays games between two engine configurations on a pool of worker processes. Every
+    opening is played twice with the colors swapped, cycling through the openings until the
+    number of games is reached. Games are reported in the order they finish.
+    """
+
+    first: EngineConfig
+    second: EngineConfig
+    games: int = 2
+    workers: int = field(default_factory=os.cpu_count)
+    openings: List[str] = field(default_factory=lambda: list(OPENINGS))
+    max_plies: int = 300
+    time_margin: float = 1.0
+
+    def __post_init__(self) -> None:
+        """Post initialization.
+
+        Raises:
+            ValueError: Raises ValueError if both engine configurations have the same name.
+        """
+        if self.first.name == self.second.name:
+            raise ValueError(f"Both engines are named {self.first.name}")
+
+    def play_games(self) -> Iterator[GameResult]:
+        """Play the games of the match.
+
+        Yields:
+            GameResult: The result of each game as soon as it finishes.
+        """
+        with ProcessPoolExecutor(self.workers) as pool:
+            futures = []
+            for index in range(self.games):
+                fen = self.openings[index // 2 % len(self.openings)]
+                white, black = self.first, self.second
+                if index % 2:
+                    white, black = black, white
+                futures.append(
+                    pool.submit(
+                        play_game,
+                        white,
+                        black,
+                        fen,
+                        index + 1,
+                        self.max_plies,
+                        self.time_margin,
+                    )
+                )
+            for future in as_completed(futures):
+                yield future.result()
+
+    def play(self, output: TextIO = None) -> MatchResult:
+        """Play the match.
+
+        Args:
+            output (TextIO, optional): The text stream every finished game is written to in PGN
+                format. Defaults to None (no PGN output).
+
+        Returns:
+            MatchResult: The score of the first engine and the statistics of both engines.
+        """
+        result = MatchResult(self.first.name, self.second.name)
+        engine = ChessEngine()
+        for game in self.play_games():
+            result.add(game)
+            if output is not None:
+                write_game(output, game.to_pgn(), engine)
+                output.flush()
+        return result
@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Set, Tuple
+
+from src.bitboard import COORDINATES
+from src.constants import NUM_OF_COLS, Color, PieceName
+from src.pieces.piece import Piece
+
+if TYPE_CHECKING:
+    from src.nnue import Accumulator
+
+"""Pieces a pawn can be promoted to, in the order moves are generated"""
+PROMOTION_PIECES = [PieceName.QUEEN, PieceName.ROOK, PieceName.BISHOP, PieceName.KNIGHT]
+
+"""Promotion piece names indexed by the promotion code of a packed move (0 is no promotion)"""
+PROMOTION_CODES = [None] + PROMOTION_PIECES
+
+
+class Move(NamedTuple):
+    """Chess Move"""
+
+    src: Tuple[int, int]
+    dest: Tuple[int, int]
+    promotion: PieceName = None
+
+
+def encode_move(move: Move) -> int:
+    """Pack a move into a 16-bit integer.
+
+    The dest square is stored in bits 0-5, the src square in bits 6-11 and the promotion code
+    in bits 12-14.
+
+    Args:
+        move (Move): The move.
+
+    Returns:
+        int: The packed move.
+    """
+    (src_row, src_col), (dest_row, dest_col), promotion = move
+    return (
+        PROMOTION_CODES.index(promotion) << 12
+        | (src_row * NUM_OF_COLS + src_col) << 6
+        | dest_row * NUM_OF_COLS + dest_col
+    )
+
+
+def decode_move(code: int) -> Move:
+    """Unpack a move packed by encode_move.
+
+    Args:
+        code (int): The packed move.
+
+    Returns:
+        Move: The move.
+    """
+    return Move(
+        COORDINATES[code >> 6 & 63],
+        COORDINATES[code & 63],
+        PROMOTION_CODES[code >> 12 & 7],
+    )
+
+
+@dataclass
+class UndoInfo:
+    """The state needed to take back a move made by ChessEngine.make_move."""
+
+    move: Move
+    piece: Piece
+    captured: Piece
+    piece_had_moved: bool
+    captured_had_moved: bool
+    castling_rights: int
+    en_passant: Tuple[int, int]
+    halfmove_clock: int
+    fullmove_number: int
+    hash: int
+    scores: Tuple[int, int, int] = None
+    checkers: Dict[Color, int] = None
+    pins: Dict[Color, Dict[int, int]] = None
+    restricted: Set[Piece] = None
+    promoted: Piece = None
+    castling_rook: Piece = None
+    accumulator: "Accumulator" = None
+    replaced_moves: List[
+        Tuple[Piece, Set[Tuple[int, int]], Set[Tuple[int, int]], int]
+    ] = field(default_factory=list)
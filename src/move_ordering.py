@@ -0,0 +1,168 @@
+from dataclasses import dataclass, field
+from typing import Iterator, List
+
+from src.bitboard import NUM_OF_SQUARES, to_square
+from src.chess_engine import PROMOTION_ROWS, ChessEngine
+from src.constants import Color, PieceName
+from src.move import Move
+from src.static_exchange import is_tactical, mvv_lva, static_exchange
+
+"""Number of killer moves kept per ply"""
+NUM_OF_KILLERS = 2
+
+
+def _history_index(move: Move) -> int:
+    """Get the history table index of a move.
+
+    Args:
+        move (Move): The move.
+
+    Returns:
+        int: The src square index times 64 plus the dest square index.
+    """
+    return to_square(move.src) * NUM_OF_SQUARES + to_square(move.dest)
+
+
+def _is_legal(engine: ChessEngine, move: Move) -> bool:
+    """Determine if a move from the transposition table is legal in the current position.
+
+    Two positions can share a hash key, so the move is checked against the cached legal moves
+    of the piece on its src square.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+        move (Move): The move.
+
+    Returns:
+        bool: True if the team to move can make the move. Otherwise, False.
+    """
+    piece = engine.get_piece(move.src)
+    if piece is None or piece.color != engine.get_turn():
+        return False
+    promotes = (
+        piece.name == PieceName.PAWN and move.dest[0] == PROMOTION_ROWS[piece.color]
+    )
+    return (move.promotion is not None) == promotes and move.dest in piece.get_moves()
+
+
+@dataclass
+class MoveOrdering:
+    """Move Ordering
+
+    Orders the legal moves of a position in stages: the transposition table move, captures
+    and promotions that do not lose material by MVV-LVA, the killer moves of the ply, the
+    other quiet moves by history score and the losing captures last. The stages are produced
+    lazily, so a beta cutoff skips the move generation, exchange evaluation and sorting of the
+    later stages.
+
+    Killer moves are the quiet moves that caused a beta cutoff at the same ply, the history
+    score of a quiet move grows with the depth of the cutoffs it caused.
+    """
+
+    _killers: List[List[Move]] = field(default_factory=list, repr=False)
+    _history: List[List[int]] = field(
+        default_factory=lambda: [[0] * NUM_OF_SQUARES**2 for _ in range(2)],
+        repr=False,
+    )
+
+    def new_search(self) -> None:
+        """Forget the killer moves and age the history scores before a new search."""
+        self._killers.clear()
+        for history in self._history:
+            for index, score in enumerate(history):
+                if score:
+                    history[index] = score // 2
+
+    def order_moves(
+        self, engine: ChessEngine, ply: int, table_move: Move = None
+    ) -> Iterator[Move]:
+        """Lazily produce the legal moves of the current position, best moves first.
+
+        The position of the chess engine must be the same every time the next move is
+        requested, i.e. every move made by the caller must be unmade first.
+
+        Args:
+            engine (ChessEngine): The chess engine.
+            ply (int): The distance from the root in plies.
+            table_move (Move, optional): The best move stored in the transposition table.
+                Defaults to None.
+
+        Yields:
+            Move: Every legal move exactly once.
+        """
+        if table_move is not None and _is_legal(engine, table_move):
+            yield table_move
+        else:
+            table_move = None
+
+        captures, quiets = [], []
+        for move in engine.generate_moves():
+            if move != table_move:
+                (captures if is_tactical(engine, move) else quiets).append(move)
+
+        captures.sort(key=lambda move: mvv_lva(engine, move), reverse=True)
+        losing_captures = []
+        for move in captures:
+            if static_exchange(engine, move) < 0:
+                losing_captures.append(move)
+            else:
+                yield move
+
+        if ply < len(self._killers):
+            for killer in self._killers[ply]:
+                if killer in quiets:
+                    quiets.remove(killer)
+                    yield killer
+
+        history = self._history[engine.get_turn() == Color.WHITE]
+        quiets.sort(key=lambda move: history[_history_index(move)], reverse=True)
+        yield from quiets
+        yield from losing_captures
+
+    def update(self, engine: ChessEngine, move: Move, ply: int, depth: int) -> None:
+        """Record a move that caused a beta cutoff.
+
+        Captures and promotions are already ordered by MVV-LVA, so only quiet moves are
+        recorded as killer moves and in the history table.
+
+        Args:
+            engine (ChessEngine): The chess engine, in the position the move was made from.
+            move (Move): The move.
+            ply (int): The distance from the root in plies.
+            depth (int): The remaining search depth in plies.
+        """
+        if is_tactical(engine, move):
+            return
+
+        while len(self._killers) <= ply:
+            self._killers.append([])
+        killers = self._killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[NUM_OF_KILLERS:]
+
+        history = self._history[engine.get_turn() == Color.WHITE]
+        history[_history_index(move)] += depth * depth
+
+    def get_killers(self, ply: int) -> List[Move]:
+        """Get the killer moves of a ply.
+
+        Args:
+            ply (int): The distance from the root in plies.
+
+        Returns:
+            List[Move]: The killer moves, most recent first.
+        """
+        return list(self._killers[ply]) if ply < len(self._killers) else []
+
+    def get_history(self, color: Color, move: Move) -> int:
+        """Get the history score of a quiet move.
+
+        Args:
+            color (Color): The color of the team making the move.
+            move (Move): The move.
+
+        Returns:
+            int: The history score.
+        """
+        return self._history[color == Color.WHITE][_history_index(move)]
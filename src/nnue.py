@@ -0,0 +1,253 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.batch_evaluation import NUM_OF_FEATURES, PLANES
+from src.bitboard import NUM_OF_SQUARES
+from src.chess_engine import ChessEngine
+from src.constants import Color, PieceName
+from src.pieces.piece import Piece
+
+"""Default number of accumulator neurons of each perspective"""
+HIDDEN_SIZE = 128
+
+"""Default number of neurons of the hidden layer after the accumulator"""
+LAYER_SIZE = 32
+
+"""Names of the arrays of a network weights file"""
+WEIGHT_NAMES = [
+    "feature_weights",
+    "feature_bias",
+    "hidden_weights",
+    "hidden_bias",
+    "output_weights",
+    "output_bias",
+]
+
+
+def _build_feature_indices() -> Dict[Color, Dict[PieceName, List[Tuple[int, int]]]]:
+    """Build the feature index of a piece on a square from both perspectives.
+
+    From white's perspective a piece is the feature of its plane and square, the same index as
+    encode_bitboards. From black's perspective the colors are swapped and the board is mirrored
+    vertically, so both perspectives see their own pieces as white pieces moving up the board.
+
+    Returns:
+        Dict[Color, Dict[PieceName, List[Tuple[int, int]]]]: The white and black perspective
+            feature indices indexed by color, piece name and square index.
+    """
+    planes = {key: plane for plane, key in enumerate(PLANES)}
+    indices = {}
+    for color in Color:
+        enemy = Color.BLACK if color == Color.WHITE else Color.WHITE
+        indices[color] = {}
+        for name in PieceName:
+            indices[color][name] = [
+                (
+                    planes[(color, name)] * NUM_OF_SQUARES + square,
+                    planes[(enemy, name)] * NUM_OF_SQUARES + (square ^ 56),
+                )
+                for square in range(NUM_OF_SQUARES)
+            ]
+    return indices
+
+
+"""White and black perspective feature index of a piece, indexed by color, piece name and square"""
+FEATURE_INDICES = _build_feature_indices()
+
+
+@dataclass
+class NnueNetwork:
+    """NNUE Network
+
+    A small efficiently updatable neural network. The 768 piece-square features of each
+    perspective feed a shared accumulator layer, the side to move and the other side's
+    accumulators are concatenated and passed through a clipped ReLU hidden layer to a single
+    output in centipawns from the point of view of the team to move.
+    """
+
+    feature_weights: np.ndarray
+    feature_bias: np.ndarray
+    hidden_weights: np.ndarray
+    hidden_bias: np.ndarray
+    output_weights: np.ndarray
+    output_bias: np.ndarray
+
+    @classmethod
+    def load(cls, file_path: str) -> "NnueNetwork":
+        """Load the network weights from a NumPy .npz file.
+
+        Args:
+            file_path (str): The path of the weights file.
+
+        Returns:
+            NnueNetwork: The network.
+        """
+        with np.load(file_path) as weights:
+            return cls(*(weights[name].astype(np.float32) for name in WEIGHT_NAMES))
+
+    def save(self, file_path: str) -> None:
+        """Save the network weights to a NumPy .npz file.
+
+        Args:
+            file_path (str): The path of the weights file.
+        """
+        np.savez(file_path, **{name: getattr(self, name) for name in WEIGHT_NAMES})
+
+    @classmethod
+    def random(
+        cls, hidden_size: int = HIDDEN_SIZE, layer_size: int = LAYER_SIZE, seed: int = 0
+    ) -> "NnueNetwork":
+        """Create a network with small random weights, e.g. as the starting point of training.
+
+        Args:
+            hidden_size (int, optional): The number of accumulator neurons. Defaults to HIDDEN_SIZE.
+            layer_size (int, optional): The number of hidden neurons. Defaults to LAYER_SIZE.
+            seed (int, optional): The random seed. Defaults to 0.
+
+        Returns:
+            NnueNetwork: The network.
+        """
+        rng = np.random.default_rng(seed)
+        return cls(
+            rng.normal(0, 0.1, (NUM_OF_FEATURES, hidden_size)).astype(np.float32),
+            np.zeros(hidden_size, dtype=np.float32),
+            rng.normal(0, 0.1, (2 * hidden_size, layer_size)).astype(np.float32),
+            np.zeros(layer_size, dtype=np.float32),
+            rng.normal(0, 10, layer_size).astype(np.float32),
+            np.zeros((), dtype=np.float32),
+        )
+
+    def forward(self, accumulators: np.ndarray) -> np.ndarray:
+        """Run the layers after the accumulator.
+
+        Args:
+            accumulators (np.ndarray): The (..., 2 * hidden_size) side to move and other side
+                accumulators.
+
+        Returns:
+            np.ndarray: The (...) outputs in centipawns from the point of view of the team to move.
+        """
+        hidden = np.clip(accumulators, 0, 1) @ self.hidden_weights + self.hidden_bias
+        return np.clip(hidden, 0, 1) @ self.output_weights + self.output_bias
+
+
+@dataclass
+class Accumulator:
+    """NNUE Accumulator
+
+    The accumulator keeps the first layer of the network for both perspectives. The chess
+    engine adds and subtracts the feature weights of every piece it puts on or takes off a
+    square, and the values are pushed and popped with the moves made and unmade by the engine,
+    so the first layer is never recalculated inside the search.
+    """
+
+    network: NnueNetwork
+    values: np.ndarray = field(init=False, repr=False)
+    _stack: List[np.ndarray] = field(default_factory=list, repr=False)
+
+    def refresh(self, pieces: Iterable[Piece]) -> None:
+        """Recalculate the accumulator from scratch.
+
+        Args:
+            pieces (Iterable[Piece]): Every piece on the board.
+        """
+        self.values = self.calculate(pieces)
+        self._stack.clear()
+
+    def calculate(self, pieces: Iterable[Piece]) -> np.ndarray:
+        """Calculate the accumulator values of the given pieces.
+
+        Args:
+            pieces (Iterable[Piece]): Every piece on the board.
+
+        Returns:
+            np.ndarray: The (2, hidden_size) white and black perspective values.
+        """
+        indices = [
+            FEATURE_INDICES[piece.color][piece.name][piece.square] for piece in pieces
+        ]
+        values = np.tile(self.network.feature_bias, (2, 1))
+        if indices:
+            weights = self.network.feature_weights
+            white, black = np.array(indices).T
+            values[0] += weights[white].sum(axis=0)
+            values[1] += weights[black].sum(axis=0)
+        return values
+
+    def update(self, piece: Piece, square: int, sign: int) -> None:
+        """Add or subtract the features of a piece on a square.
+
+        Args:
+            piece (Piece): The chess piece.
+            square (int): The square index of the piece.
+            sign (int): 1 if the piece is placed on the square, -1 if it is removed.
+        """
+        white, black = FEATURE_INDICES[piece.color][piece.name][square]
+        weights = self.network.feature_weights
+        if sign > 0:
+            self.values[0] += weights[white]
+            self.values[1] += weights[black]
+        else:
+            self.values[0] -= weights[white]
+            self.values[1] -= weights[black]
+
+    def push(self) -> None:
+        """Save the current values before a move is made."""
+        self._stack.append(self.values.copy())
+
+    def pop(self) -> None:
+        """Restore the values saved before the last move was made."""
+        self.values = self._stack.pop()
+
+    def evaluate(self, turn: Color) -> int:
+        """Evaluate the position of the accumulator.
+
+        Args:
+            turn (Color): The team to move.
+
+        Returns:
+            int: The score in centipawns from the point of view of the team to move.
+        """
+        side, other = (0, 1) if turn == Color.WHITE else (1, 0)
+        inputs = np.concatenate([self.values[side], self.values[other]])
+        return int(self.network.forward(inputs))
+
+
+@dataclass
+class NnueEvaluator:
+    """NNUE Evaluation
+
+    Evaluates positions with a network. The first time a chess engine is evaluated an
+    accumulator is attached to it, afterwards the engine keeps it up to date.
+    """
+
+    network: NnueNetwork
+
+    @classmethod
+    def load(cls, file_path: str) -> "NnueEvaluator":
+        """Create an evaluator with the network weights of a NumPy .npz file.
+
+        Args:
+            file_path (str): The path of the weights file.
+
+        Returns:
+            NnueEvaluator: The evaluator.
+        """
+        return cls(NnueNetwork.load(file_path))
+
+    def evaluate(self, engine: ChessEngine) -> int:
+        """Evaluate the current position of the chess engine.
+
+        Args:
+            engine (ChessEngine): The chess engine.
+
+        Returns:
+            int: The score in centipawns from the point of view of the team to move.
+        """
+        accumulator = engine.get_accumulator()
+        if accumulator is None or accumulator.network is not self.network:
+            accumulator = Accumulator(self.network)
+            engine.set_accumulator(accumulator)
+        return accumulator.evaluate(engine.get_turn())
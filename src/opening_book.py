@@ -0,0 +1,193 @@
+import mmap
+import os
+import random
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.chess_engine import ChessEngine
+from src.constants import START_FEN, Color
+from src.exceptions import InvalidBookFile
+from src.move import Move, decode_move, encode_move
+from src.utils.pgn import PgnReader, parse_san
+
+"""Book entry layout, 16 bytes little-endian, sorted by key and then by descending weight"""
+ENTRY_DTYPE = np.dtype(
+    [("key", "<u8"), ("move", "<u2"), ("weight", "<u2"), ("count", "<u4")]
+)
+
+"""Plies of each game added to the book"""
+BOOK_PLIES = 20
+
+"""Weight a move earns from a win, a draw (or unknown result) and a loss of the team making it"""
+WIN_WEIGHT, DRAW_WEIGHT, LOSS_WEIGHT = 2, 1, 0
+
+"""Largest weight of an entry"""
+MAX_WEIGHT = 0xFFFF
+
+
+def build_book(
+    pgn_paths: Iterable[str],
+    output: BinaryIO,
+    max_plies: int = BOOK_PLIES,
+    min_count: int = 1,
+) -> int:
+    """Build an opening book from PGN files.
+
+    Every move of the first plies of every game is counted under the Zobrist hash of the
+    position it was played in and weighted by the result for the team that played it. Moves
+    only ever played in lost games have no weight and are left out. Only the first plies of a
+    game are resolved and played, the rest of its movetext is skipped.
+
+    Args:
+        pgn_paths (Iterable[str]): The paths of the PGN files.
+        output (BinaryIO): The binary stream the sorted entries are written to.
+        max_plies (int, optional): The plies of each game added to the book. Defaults to
+            BOOK_PLIES.
+        min_count (int, optional): The number of games a move must be played in to be added.
+            Defaults to 1.
+
+    Raises:
+        InvalidSan: Raises InvalidSan if a game contains an illegal move.
+
+    Returns:
+        int: The number of entries written.
+    """
+    entries: Dict[Tuple[int, int], List[int]] = {}
+    engine = ChessEngine()
+    for pgn_path in pgn_paths:
+        for headers, sans in PgnReader(pgn_path).read_movetext():
+            engine.set_fen(headers.get("FEN", START_FEN))
+            result = headers.get("Result", "*")
+            for san in sans[:max_plies]:
+                move = parse_san(engine, san)
+                if result in ("1-0", "0-1"):
+                    wins = (result == "1-0") == (engine.get_turn() == Color.WHITE)
+                    weight = WIN_WEIGHT if wins else LOSS_WEIGHT
+                else:
+                    weight = DRAW_WEIGHT
+                key = (engine.get_hash(), encode_move(move))
+                entry = entries.setdefault(key, [0, 0])
+                entry[0] += weight
+                entry[1] += 1
+                engine.make_move(move)
+
+    table = np.array(
+        [
+            (key, move, min(weight, MAX_WEIGHT), count)
+            for (key, move), (weight, count) in entries.items()
+            if weight > 0 and count >= min_count
+        ],
+        dtype=ENTRY_DTYPE,
+    )
+    table = table[np.lexsort((-table["weight"].astype(np.int32), table["key"]))]
+    output.write(table.tobytes())
+    return len(table)
+
+
+@dataclass
+class OpeningBook:
+    """Opening Book
+
+    Looks up the book moves of a position by its Zobrist hash in a table built by build_book.
+    The table is memory mapped and binary searched, so only the few pages a lookup touches are
+    read from disk and the book is never loaded into Python objects.
+    """
+
+    file_path: str
+    _file: BinaryIO = field(init=False, repr=False)
+    _data: mmap.mmap = field(default=None, init=False, repr=False)
+    _entries: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Post initialization.
+
+        Raises:
+            InvalidBookFile: Raises InvalidBookFile if the file size is not a whole number of
+                entries.
+        """
+        self._file = open(self.file_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size % ENTRY_DTYPE.itemsize:
+            self._file.close()
+            raise InvalidBookFile(self.file_path)
+        if size == 0:
+            self._entries = np.zeros(0, dtype=ENTRY_DTYPE)
+        else:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._entries = np.frombuffer(self._data, dtype=ENTRY_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> "OpeningBook":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap and close the book file."""
+        self._entries = np.zeros(0, dtype=ENTRY_DTYPE)
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._file.close()
+
+    def get_entries(self, key: int) -> np.ndarray:
+        """Find the entries of a position hash.
+
+        Args:
+            key (int): The Zobrist hash of the position.
+
+        Returns:
+            np.ndarray: A copy of the ENTRY_DTYPE entries of the position, highest weight first,
+                so it stays valid after the book is closed.
+        """
+        keys = self._entries["key"]
+        key = np.uint64(key)
+        start = int(np.searchsorted(keys, key, side="left"))
+        end = int(np.searchsorted(keys, key, side="right"))
+        return self._entries[start:end].copy()
+
+    def get_moves(self, engine: ChessEngine) -> List[Tuple[Move, int]]:
+        """Get the book moves of the current position of a chess engine.
+
+        Moves that are not legal, e.g. from another position with the same hash, are left out.
+
+        Args:
+            engine (ChessEngine): The chess engine.
+
+        Returns:
+            List[Tuple[Move, int]]: The book moves and their weights, highest weight first.
+        """
+        entries = self.get_entries(engine.get_hash())
+        if not len(entries):
+            return []
+        legal_moves = engine.generate_moves()
+        moves = []
+        for code, weight in zip(entries["move"].tolist(), entries["weight"].tolist()):
+            move = decode_move(code)
+            if move in legal_moves:
+                moves.append((move, weight))
+        return moves
+
+    def choose_move(self, engine: ChessEngine, rng: random.Random = None) -> Move:
+        """Choose a book move of the current position at random, in proportion to the weights.
+
+        Args:
+            engine (ChessEngine): The chess engine.
+            rng (random.Random, optional): The random number generator. Defaults to None (the
+                random module).
+
+        Returns:
+            Move: The book move. If the position is not in the book return None.
+        """
+        moves = self.get_moves(engine)
+        if not moves:
+            return None
+        rng = rng or random
+        return rng.choices(
+            [move for move, _ in moves], weights=[weight for _, weight in moves]
+        )[0]
@@ -0,0 +1,336 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Tuple
+
+from src.chess_engine import ChessEngine
+from src.move import Move
+from src.search import MATE_SCORE, MAX_DEPTH, Search
+from src.transposition_table import TranspositionTable
+
+"""Bytes reserved at the start of the shared memory block for the stop flag"""
+HEADER_SIZE = 64
+
+"""Lazy SMP mode, every worker searches the whole position sharing one transposition table"""
+LAZY_SMP = "lazy-smp"
+
+"""Root splitting mode, every worker searches its own share of the root moves"""
+ROOT_SPLIT = "root-split"
+
+
+@dataclass
+class SharedFlag:
+    """Stop flag stored in the first byte of a shared memory buffer.
+
+    The flag has the is_set and set methods of threading.Event, so a search in another process
+    can use it as its stop event.
+    """
+
+    buffer: memoryview
+
+    def set(self) -> None:
+        """Set the flag."""
+        self.buffer[0] = 1
+
+    def is_set(self) -> bool:
+        """Determine if the flag is set.
+
+        Returns:
+            bool: True if the flag is set. Otherwise, False.
+        """
+        return bool(self.buffer[0])
+
+
+@dataclass
+class WorkerResult:
+    """Search result of one worker process."""
+
+    worker: int
+    best_move: Move
+    score: int
+    pv: List[Move]
+    depth: int
+    nodes: int
+    seconds: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class ParallelResult:
+    """Search result of a parallel search with the statistics of every worker."""
+
+    best_move: Move
+    score: int
+    pv: List[Move]
+    seconds: float
+    workers: List[WorkerResult] = field(default_factory=list)
+
+    @property
+    def nodes(self) -> int:
+        return sum(worker.nodes for worker in self.workers)
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+
+def _lazy_smp_worker(
+    fen: str,
+    memory_name: str,
+    worker: int,
+    depth: int,
+    time_limit: float,
+) -> WorkerResult:
+    """Search a position with a transposition table in shared memory.
+
+    Args:
+        fen (str): The FEN string of the position.
+        memory_name (str): The name of the shared memory block holding the stop flag and the
+            transposition table.
+        worker (int): The worker index.
+        depth (int): The maximum search depth in plies.
+        time_limit (float): The time budget in seconds.
+
+    Returns:
+        WorkerResult: The search result of the worker.
+    """
+    memory = SharedMemory(name=memory_name)
+    try:
+        return _search_worker(
+            fen,
+            worker,
+            depth,
+            time_limit,
+            table=TranspositionTable(buffer=memory.buf[HEADER_SIZE:]),
+            stop_event=SharedFlag(memory.buf[:HEADER_SIZE]),
+        )
+    finally:
+        memory.close()
+
+
+def _root_split_worker(
+    fen: str,
+    worker: int,
+    depth: int,
+    time_limit: float,
+    size_mb: int,
+    root_moves: List[Move],
+) -> WorkerResult:
+    """Search a share of the root moves of a position with a private transposition table.
+
+    Args:
+        fen (str): The FEN string of the position.
+        worker (int): The worker index.
+        depth (int): The maximum search depth in plies.
+        time_limit (float): The time budget in seconds.
+        size_mb (int): The size of the transposition table in megabytes.
+        root_moves (List[Move]): The root moves searched by the worker.
+
+    Returns:
+        WorkerResult: The search result of the worker.
+    """
+    return _search_worker(
+        fen,
+        worker,
+        depth,
+        time_limit,
+        table=TranspositionTable(size_mb=size_mb),
+        root_moves=root_moves,
+    )
+
+
+def _search_worker(
+    fen: str,
+    worker: int,
+    depth: int,
+    time_limit: float,
+    table: TranspositionTable,
+    stop_event: SharedFlag = None,
+    root_moves: List[Move] = None,
+) -> WorkerResult:
+    """Search a position rebuilt from its FEN string in a worker process.
+
+    Args:
+        fen (str): The FEN string of the position.
+        worker (int): The worker index.
+        depth (int): The maximum search depth in plies.
+        time_limit (float): The time budget in seconds.
+        table (TranspositionTable): The transposition table.
+        stop_event (SharedFlag, optional): Stops the search when set. Defaults to None.
+        root_moves (List[Move], optional): The root moves to search. Defaults to None (every
+            legal move).
+
+    Returns:
+        WorkerResult: The search result of the worker.
+    """
+    search = Search(ChessEngine.from_fen(fen), table=table, stop_event=stop_event)
+    start = time.perf_counter()
+    best_move, score, pv = search.search(depth, time_limit, root_moves)
+    return WorkerResult(
+        worker,
+        best_move,
+        score,
+        pv,
+        search.completed_depth,
+        search.nodes,
+        time.perf_counter() - start,
+    )
+
+
+def _best_root_split_result(results: List[WorkerResult]) -> WorkerResult:
+    """Pick the best result of the root splitting workers.
+
+    A worker stopped before completing depth 1 has not searched its fallback move, and scores
+    are only comparable between searches of the same depth. A mate ends the search of its
+    worker early, so it is preferred over any deeper search.
+
+    Args:
+        results (List[WorkerResult]): The results of every worker.
+
+    Returns:
+        WorkerResult: The mate, otherwise the best result of the deepest completed search.
+    """
+    searched = [result for result in results if result.depth > 0] or results
+    return max(
+        searched,
+        key=lambda result: (
+            result.score >= MATE_SCORE - MAX_DEPTH,
+            result.depth,
+            result.score,
+        ),
+    )
+
+
+@dataclass
+class ParallelSearch:
+    """Parallel Search
+
+    Searches a position with several worker processes, each rebuilding the position from its
+    FEN string. In Lazy SMP mode every worker searches the whole position and they share one
+    lockless transposition table in shared memory; odd workers search one ply deeper so the
+    workers fill the table with different parts of the tree. The search ends when the first
+    worker finishes, its result is returned and the other workers are stopped through a flag
+    in the shared memory. In root splitting mode the root moves are dealt out to the workers,
+    each searching its share with a private table, and the best result of the deepest
+    completed search is returned.
+    """
+
+    workers: int = field(default_factory=os.cpu_count)
+    size_mb: int = 16
+    mode: str = LAZY_SMP
+
+    def search(
+        self, fen: str, depth: int = None, time_limit: float = None
+    ) -> ParallelResult:
+        """Search the position of a FEN string for the best move.
+
+        Args:
+            fen (str): The FEN string of the position.
+            depth (int, optional): The maximum search depth in plies. Defaults to None (MAX_DEPTH).
+            time_limit (float, optional): The time budget in seconds. Defaults to None (no limit).
+
+        Raises:
+            ValueError: Raises ValueError if the search mode is unknown.
+
+        Returns:
+            ParallelResult: The best move, its score and principal variation and the statistics
+                of every worker.
+        """
+        start = time.perf_counter()
+        if self.mode == LAZY_SMP:
+            best, results = self._search_lazy_smp(fen, depth, time_limit)
+        elif self.mode == ROOT_SPLIT:
+            best, results = self._search_root_split(fen, depth, time_limit)
+        else:
+            raise ValueError(f"Unknown parallel search mode {self.mode}")
+        return ParallelResult(
+            best.best_move,
+            best.score,
+            best.pv,
+            time.perf_counter() - start,
+            sorted(results, key=lambda result: result.worker),
+        )
+
+    def _search_lazy_smp(
+        self, fen: str, depth: int, time_limit: float
+    ) -> Tuple[WorkerResult, List[WorkerResult]]:
+        """Search the position with every worker sharing one transposition table.
+
+        Args:
+            fen (str): The FEN string of the position.
+            depth (int): The maximum search depth in plies.
+            time_limit (float): The time budget in seconds.
+
+        Returns:
+            Tuple[WorkerResult, List[WorkerResult]]: The result of the first worker to finish,
+                the deepest one if several finish together, and the results of every worker.
+        """
+        memory = SharedMemory(
+            create=True, size=HEADER_SIZE + self.size_mb * 1024 * 1024
+        )
+        stop = SharedFlag(memory.buf[:HEADER_SIZE])
+        try:
+            with ProcessPoolExecutor(self.workers) as pool:
+                futures = [
+                    pool.submit(
+                        _lazy_smp_worker,
+                        fen,
+                        memory.name,
+                        worker,
+                        depth + worker % 2 if depth else None,
+                        time_limit,
+                    )
+                    for worker in range(self.workers)
+                ]
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                stop.set()
+                # several workers can finish at once, e.g. when the time limit is reached
+                first = max(
+                    (future.result() for future in done),
+                    key=lambda result: result.depth,
+                )
+                results = [future.result() for future in futures]
+        finally:
+            stop.buffer.release()
+            memory.close()
+            memory.unlink()
+        return first, results
+
+    def _search_root_split(
+        self, fen: str, depth: int, time_limit: float
+    ) -> Tuple[WorkerResult, List[WorkerResult]]:
+        """Search the position with the root moves dealt out to the workers.
+
+        Args:
+            fen (str): The FEN string of the position.
+            depth (int): The maximum search depth in plies.
+            time_limit (float): The time budget in seconds.
+
+        Returns:
+            Tuple[WorkerResult, List[WorkerResult]]: The best result of the deepest completed
+                search and the results of every worker.
+        """
+        moves = ChessEngine.from_fen(fen).generate_moves()
+        shares = [moves[worker :: self.workers] for worker in range(self.workers)]
+        # without legal moves a single worker reports the checkmate or stalemate
+        shares = [share for share in shares if share] or [None]
+        with ProcessPoolExecutor(self.workers) as pool:
+            futures = [
+                pool.submit(
+                    _root_split_worker,
+                    fen,
+                    worker,
+                    depth,
+                    time_limit,
+                    self.size_mb,
+                    share,
+                )
+                for worker, share in enumerate(shares)
+            ]
+            results = [future.result() for future in futures]
+        return _best_root_split_result(results), results
@@ -0,0 +1,150 @@
+from typing import Dict, List, Tuple
+
+from src.bitboard import NUM_OF_SQUARES
+from src.constants import PIECE_VALUE, Color, PieceName
+
+"""Centipawn value of each piece (the king is excluded from the material balance)"""
+CENTIPAWN_VALUE = {
+    name: 100 * value for name, value in PIECE_VALUE.items() if name != PieceName.KING
+}
+
+"""Game phase contributed by each piece, the phase is MAX_PHASE with all pieces on the board"""
+PHASE_WEIGHTS = {
+    PieceName.PAWN: 0,
+    PieceName.KNIGHT: 1,
+    PieceName.BISHOP: 1,
+    PieceName.ROOK: 2,
+    PieceName.QUEEN: 4,
+    PieceName.KING: 0,
+}
+
+"""Game phase of the starting position"""
+MAX_PHASE = 24
+
+# Piece-square tables from white's point of view, laid out like the board: the first row is
+# the eighth rank and square 0 is a8. Black's tables are mirrored vertically.
+# fmt: off
+
+"""Pawn piece-square table"""
+PAWN_TABLE = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    10, 10, 20, 30, 30, 20, 10, 10,
+    5, 5, 10, 25, 25, 10, 5, 5,
+    0, 0, 0, 20, 20, 0, 0, 0,
+    5, -5, -10, 0, 0, -10, -5, 5,
+    5, 10, 10, -20, -20, 10, 10, 5,
+    0, 0, 0, 0, 0, 0, 0, 0,
+]
+
+"""Knight piece-square table"""
+KNIGHT_TABLE = [
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20, 0, 0, 0, 0, -20, -40,
+    -30, 0, 10, 15, 15, 10, 0, -30,
+    -30, 5, 15, 20, 20, 15, 5, -30,
+    -30, 0, 15, 20, 20, 15, 0, -30,
+    -30, 5, 10, 15, 15, 10, 5, -30,
+    -40, -20, 0, 5, 5, 0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+]
+
+"""Bishop piece-square table"""
+BISHOP_TABLE = [
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 10, 10, 5, 0, -10,
+    -10, 5, 5, 10, 10, 5, 5, -10,
+    -10, 0, 10, 10, 10, 10, 0, -10,
+    -10, 10, 10, 10, 10, 10, 10, -10,
+    -10, 5, 0, 0, 0, 0, 5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+]
+
+"""Rook piece-square table"""
+ROOK_TABLE = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    5, 10, 10, 10, 10, 10, 10, 5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    0, 0, 0, 5, 5, 0, 0, 0,
+]
+
+"""Queen piece-square table"""
+QUEEN_TABLE = [
+    -20, -10, -10, -5, -5, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 5, 5, 5, 0, -10,
+    -5, 0, 5, 5, 5, 5, 0, -5,
+    0, 0, 5, 5, 5, 5, 0, -5,
+    -10, 5, 5, 5, 5, 5, 0, -10,
+    -10, 0, 5, 0, 0, 0, 0, -10,
+    -20, -10, -10, -5, -5, -10, -10, -20,
+]
+
+"""King piece-square table of the middlegame, the king shelters behind its pawns"""
+KING_MIDDLEGAME_TABLE = [
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+    20, 20, 0, 0, 0, 0, 20, 20,
+    20, 30, 10, 0, 0, 10, 30, 20,
+]
+
+"""King piece-square table of the endgame, the king heads for the center"""
+KING_ENDGAME_TABLE = [
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10, 0, 0, -10, -20, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -30, 0, 0, 0, 0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+]
+
+# fmt: on
+
+"""Middlegame and endgame piece-square tables of each piece"""
+PIECE_TABLES = {
+    PieceName.PAWN: (PAWN_TABLE, PAWN_TABLE),
+    PieceName.KNIGHT: (KNIGHT_TABLE, KNIGHT_TABLE),
+    PieceName.BISHOP: (BISHOP_TABLE, BISHOP_TABLE),
+    PieceName.ROOK: (ROOK_TABLE, ROOK_TABLE),
+    PieceName.QUEEN: (QUEEN_TABLE, QUEEN_TABLE),
+    PieceName.KING: (KING_MIDDLEGAME_TABLE, KING_ENDGAME_TABLE),
+}
+
+
+def _build_piece_square_scores() -> Dict[Color, Dict[PieceName, List[Tuple[int, int]]]]:
+    """Combine the material values and piece-square tables into signed scores.
+
+    Returns:
+        Dict[Color, Dict[PieceName, List[Tuple[int, int]]]]: The middlegame and endgame score of
+            a piece on each square, positive for white pieces and negative for black pieces,
+            indexed by color, piece name and square index.
+    """
+    scores = {}
+    for color in Color:
+        sign, mirror = (1, 0) if color == Color.WHITE else (-1, 56)
+        scores[color] = {}
+        for name, (middlegame, endgame) in PIECE_TABLES.items():
+            value = CENTIPAWN_VALUE.get(name, 0)
+            scores[color][name] = [
+                (
+                    sign * (value + middlegame[square ^ mirror]),
+                    sign * (value + endgame[square ^ mirror]),
+                )
+                for square in range(NUM_OF_SQUARES)
+            ]
+    return scores
+
+
+"""Signed middlegame and endgame score of a piece on a square, indexed by color, piece name and square index"""
+PIECE_SQUARE_SCORES = _build_piece_square_scores()
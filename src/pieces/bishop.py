@@ -1,24 +1,13 @@
-from typing import Tuple
-
-from src.constants import PieceName, Color
+from src.constants import PIECE_VALUE, Color, PieceName
+from src.pieces.move_tables import CAPTURE_TABLES, MOVE_TABLES, REACH_TABLES
 from src.pieces.piece import Piece
-from src.pieces.moves import (
-    MOVE_UP_RIGHT_DIAGONALLY,
-    MOVE_UP_LEFT_DIAGONALLY,
-    MOVE_DOWN_RIGHT_DIAGONALLY,
-    MOVE_DOWN_LEFT_DIAGONALLY,
-)
 
 
 class Bishop(Piece):
-    def __init__(self, color: Color, coordinates: Tuple[int, int]) -> None:
-        self.moves = [
-            MOVE_UP_RIGHT_DIAGONALLY,
-            MOVE_UP_LEFT_DIAGONALLY,
-            MOVE_DOWN_RIGHT_DIAGONALLY,
-            MOVE_DOWN_LEFT_DIAGONALLY,
-        ]
-        self.captures = self.moves
-        super().__init__(
-            PieceName.BISHOP, color, coordinates, self.moves, self.captures
-        )
+    __slots__ = ()
+
+    name = PieceName.BISHOP
+    value = PIECE_VALUE[PieceName.BISHOP]
+    _move_table = MOVE_TABLES[(PieceName.BISHOP, Color.WHITE)]
+    _capture_table = CAPTURE_TABLES[(PieceName.BISHOP, Color.WHITE)]
+    _reach_table = REACH_TABLES[(PieceName.BISHOP, Color.WHITE)]
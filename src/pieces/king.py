@@ -1,30 +1,13 @@
-from typing import Tuple
-
-from src.constants import Color, PieceName
+from src.constants import PIECE_VALUE, Color, PieceName
+from src.pieces.move_tables import CAPTURE_TABLES, MOVE_TABLES, REACH_TABLES
 from src.pieces.piece import Piece
-from src.pieces.moves import (
-    MOVE_UP_ONE,
-    MOVE_DOWN_ONE,
-    MOVE_LEFT_ONE,
-    MOVE_RIGHT_ONE,
-    MOVE_UP_RIGHT_DIAGONALLY_ONE,
-    MOVE_UP_LEFT_DIAGONALLY_ONE,
-    MOVE_DOWN_RIGHT_DIAGONALLY_ONE,
-    MOVE_DOWN_LEFT_DIAGONALLY_ONE,
-)
 
 
 class King(Piece):
-    def __init__(self, color: Color, coordinates: Tuple[int, int]) -> None:
-        self.moves = [
-            MOVE_UP_ONE,
-            MOVE_DOWN_ONE,
-            MOVE_LEFT_ONE,
-            MOVE_RIGHT_ONE,
-            MOVE_UP_RIGHT_DIAGONALLY_ONE,
-            MOVE_UP_LEFT_DIAGONALLY_ONE,
-            MOVE_DOWN_RIGHT_DIAGONALLY_ONE,
-            MOVE_DOWN_LEFT_DIAGONALLY_ONE,
-        ]
-        self.captures = self.moves
-        super().__init__(PieceName.KING, color, coordinates, self.moves, self.captures)
+    __slots__ = ()
+
+    name = PieceName.KING
+    value = PIECE_VALUE[PieceName.KING]
+    _move_table = MOVE_TABLES[(PieceName.KING, Color.WHITE)]
+    _capture_table = CAPTURE_TABLES[(PieceName.KING, Color.WHITE)]
+    _reach_table = REACH_TABLES[(PieceName.KING, Color.WHITE)]
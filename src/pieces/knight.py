@@ -1,32 +1,13 @@
-from typing import Tuple
-
-from src.constants import Color, PieceName
+from src.constants import PIECE_VALUE, Color, PieceName
+from src.pieces.move_tables import CAPTURE_TABLES, MOVE_TABLES, REACH_TABLES
 from src.pieces.piece import Piece
-from src.pieces.moves import (
-    MOVE_UP_TWO_LEFT_ONE,
-    MOVE_UP_TWO_RIGHT_ONE,
-    MOVE_DOWN_TWO_LEFT_ONE,
-    MOVE_DOWN_TWO_RIGHT_ONE,
-    MOVE_LEFT_TWO_UP_ONE,
-    MOVE_LEFT_TWO_DOWN_ONE,
-    MOVE_RIGHT_TWO_UP_ONE,
-    MOVE_RIGHT_TWO_DOWN_ONE,
-)
 
 
 class Knight(Piece):
-    def __init__(self, color: Color, coordinates: Tuple[int, int]) -> None:
-        self.moves = [
-            MOVE_UP_TWO_LEFT_ONE,
-            MOVE_UP_TWO_RIGHT_ONE,
-            MOVE_DOWN_TWO_LEFT_ONE,
-            MOVE_DOWN_TWO_RIGHT_ONE,
-            MOVE_LEFT_TWO_UP_ONE,
-            MOVE_LEFT_TWO_DOWN_ONE,
-            MOVE_RIGHT_TWO_UP_ONE,
-            MOVE_RIGHT_TWO_DOWN_ONE,
-        ]
-        self.captures = self.moves
-        super().__init__(
-            PieceName.KNIGHT, color, coordinates, self.moves, self.captures
-        )
+    __slots__ = ()
+
+    name = PieceName.KNIGHT
+    value = PIECE_VALUE[PieceName.KNIGHT]
+    _move_table = MOVE_TABLES[(PieceName.KNIGHT, Color.WHITE)]
+    _capture_table = CAPTURE_TABLES[(PieceName.KNIGHT, Color.WHITE)]
+    _reach_table = REACH_TABLES[(PieceName.KNIGHT, Color.WHITE)]
@@ -0,0 +1,149 @@
+from typing import Dict, List, Tuple
+
+from src.bitboard import COORDINATES, NUM_OF_SQUARES
+from src.constants import NUM_OF_COLS, NUM_OF_ROWS, Color, PieceName
+from src.pieces.moves import (
+    BISHOP_MOVES,
+    BLACK_PAWN_ADVANCES,
+    BLACK_PAWN_CAPTURES,
+    BLACK_PAWN_MOVES,
+    KING_MOVES,
+    KNIGHT_MOVES,
+    QUEEN_MOVES,
+    ROOK_MOVES,
+    WHITE_PAWN_ADVANCES,
+    WHITE_PAWN_CAPTURES,
+    WHITE_PAWN_MOVES,
+)
+
+"""Rays of a piece on a given square, each ray ordered outwards from the square"""
+Rays = Tuple[Tuple[Tuple[int, int], ...], ...]
+
+
+def _is_valid_coordinates(row: int, col: int) -> bool:
+    """Determine if the given coordinates are within the board's bounds.
+
+    Args:
+        row (int): The row of the coordinates.
+        col (int): The column of the coordinates.
+
+    Returns:
+        bool: True if the coordinates are within the board's bounds. Otherwise, False.
+    """
+    return 0 <= row < NUM_OF_ROWS and 0 <= col < NUM_OF_COLS
+
+
+def _build_rays(vectors: List[List[Tuple[int, int]]], square: int) -> Rays:
+    """Build the on-board rays for the given move vectors from the given square.
+
+    Args:
+        vectors (List[List[Tuple[int, int]]]): The move vectors, one list of offsets per direction.
+        square (int): The square index of the piece.
+
+    Returns:
+        Rays: The rays that stay within the board's bounds. Empty directions are dropped.
+    """
+    row, col = COORDINATES[square]
+    rays = []
+    for direction in vectors:
+        ray = []
+        for row_offset, col_offset in direction:
+            new_row = row + row_offset
+            new_col = col + col_offset
+            if not _is_valid_coordinates(new_row, new_col):
+                break
+            ray.append((new_row, new_col))
+        if ray:
+            rays.append(tuple(ray))
+    return tuple(rays)
+
+
+def _build_table(vectors: List[List[Tuple[int, int]]]) -> List[Rays]:
+    """Build the rays of the given move vectors for every square of the board.
+
+    Args:
+        vectors (List[List[Tuple[int, int]]]): The move vectors, one list of offsets per direction.
+
+    Returns:
+        List[Rays]: The rays indexed by square index.
+    """
+    return [_build_rays(vectors, square) for square in range(NUM_OF_SQUARES)]
+
+
+"""Move rays indexed by (piece name, color) and then by square index"""
+MOVE_TABLES: Dict[Tuple[PieceName, Color], List[Rays]] = {}
+
+"""Capture rays indexed by (piece name, color) and then by square index"""
+CAPTURE_TABLES: Dict[Tuple[PieceName, Color], List[Rays]] = {}
+
+for _color in Color:
+    for _name, _vectors in [
+        (PieceName.ROOK, ROOK_MOVES),
+        (PieceName.BISHOP, BISHOP_MOVES),
+        (PieceName.QUEEN, QUEEN_MOVES),
+        (PieceName.KING, KING_MOVES),
+        (PieceName.KNIGHT, KNIGHT_MOVES),
+    ]:
+        MOVE_TABLES[(_name, _color)] = CAPTURE_TABLES[(_name, _color)] = _build_table(
+            _vectors
+        )
+
+MOVE_TABLES[(PieceName.PAWN, Color.BLACK)] = _build_table(BLACK_PAWN_MOVES)
+MOVE_TABLES[(PieceName.PAWN, Color.WHITE)] = _build_table(WHITE_PAWN_MOVES)
+CAPTURE_TABLES[(PieceName.PAWN, Color.BLACK)] = _build_table(BLACK_PAWN_CAPTURES)
+CAPTURE_TABLES[(PieceName.PAWN, Color.WHITE)] = _build_table(WHITE_PAWN_CAPTURES)
+
+"""Single step pawn move rays (after the pawn has moved) indexed by color and then by square index"""
+PAWN_ADVANCE_TABLES: Dict[Color, List[Rays]] = {
+    Color.BLACK: _build_table(BLACK_PAWN_ADVANCES),
+    Color.WHITE: _build_table(WHITE_PAWN_ADVANCES),
+}
+
+
+def _build_reach_table(*tables: List[Rays]) -> List[int]:
+    """Build the bitmask of every square covered by the given ray tables for every square.
+
+    Args:
+        tables (List[Rays]): The ray tables of a piece indexed by square index.
+
+    Returns:
+        List[int]: The reach bitmasks indexed by square index.
+    """
+    reach_table = []
+    for square in range(NUM_OF_SQUARES):
+        mask = 0
+        for table in tables:
+            for ray in table[square]:
+                for row, col in ray:
+                    mask |= 1 << (row * NUM_OF_COLS + col)
+        reach_table.append(mask)
+    return reach_table
+
+
+"""Bitmask of every square whose occupancy can change a piece's moves, indexed by (piece name, color) and then by square index"""
+REACH_TABLES: Dict[Tuple[PieceName, Color], List[int]] = {
+    key: _build_reach_table(MOVE_TABLES[key], CAPTURE_TABLES[key])
+    for key in MOVE_TABLES
+}
+
+
+def _build_between_table() -> List[List[int]]:
+    """Build the bitmask of the squares strictly between every pair of aligned squares.
+
+    Returns:
+        List[List[int]]: The between bitmasks indexed by both square indices. Pairs of squares
+            that do not share a row, column or diagonal have an empty bitmask.
+    """
+    between_table = [[0] * NUM_OF_SQUARES for _ in range(NUM_OF_SQUARES)]
+    for square in range(NUM_OF_SQUARES):
+        for ray in MOVE_TABLES[(PieceName.QUEEN, Color.WHITE)][square]:
+            mask = 0
+            for row, col in ray:
+                other = row * NUM_OF_COLS + col
+                between_table[square][other] = mask
+                mask |= 1 << other
+    return between_table
+
+
+"""Bitmask of the squares strictly between two aligned squares, indexed by both square indices"""
+BETWEEN_MASKS: List[List[int]] = _build_between_table()
@@ -36,3 +36,42 @@ MOVE_LEFT_TWO_UP_ONE = [(-1, -2)]
 MOVE_LEFT_TWO_DOWN_ONE = [(1, -2)]
 MOVE_RIGHT_TWO_UP_ONE = [(-1, 2)]
 MOVE_RIGHT_TWO_DOWN_ONE = [(1, 2)]
+
+
+# piece move vectors (one list of offsets per direction)
+ROOK_MOVES = [MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT]
+BISHOP_MOVES = [
+    MOVE_UP_RIGHT_DIAGONALLY,
+    MOVE_UP_LEFT_DIAGONALLY,
+    MOVE_DOWN_RIGHT_DIAGONALLY,
+    MOVE_DOWN_LEFT_DIAGONALLY,
+]
+QUEEN_MOVES = ROOK_MOVES + BISHOP_MOVES
+KING_MOVES = [
+    MOVE_UP_ONE,
+    MOVE_DOWN_ONE,
+    MOVE_LEFT_ONE,
+    MOVE_RIGHT_ONE,
+    MOVE_UP_RIGHT_DIAGONALLY_ONE,
+    MOVE_UP_LEFT_DIAGONALLY_ONE,
+    MOVE_DOWN_RIGHT_DIAGONALLY_ONE,
+    MOVE_DOWN_LEFT_DIAGONALLY_ONE,
+]
+KNIGHT_MOVES = [
+    MOVE_UP_TWO_LEFT_ONE,
+    MOVE_UP_TWO_RIGHT_ONE,
+    MOVE_DOWN_TWO_LEFT_ONE,
+    MOVE_DOWN_TWO_RIGHT_ONE,
+    MOVE_LEFT_TWO_UP_ONE,
+    MOVE_LEFT_TWO_DOWN_ONE,
+    MOVE_RIGHT_TWO_UP_ONE,
+    MOVE_RIGHT_TWO_DOWN_ONE,
+]
+
+# pawn move vectors (the double move shares a direction with the single move so it is blocked too)
+BLACK_PAWN_MOVES = [MOVE_DOWN_ONE + MOVE_DOWN_TWO]
+BLACK_PAWN_ADVANCES = [MOVE_DOWN_ONE]
+BLACK_PAWN_CAPTURES = [MOVE_DOWN_RIGHT_DIAGONALLY_ONE, MOVE_DOWN_LEFT_DIAGONALLY_ONE]
+WHITE_PAWN_MOVES = [MOVE_UP_ONE + MOVE_UP_TWO]
+WHITE_PAWN_ADVANCES = [MOVE_UP_ONE]
+WHITE_PAWN_CAPTURES = [MOVE_UP_RIGHT_DIAGONALLY_ONE, MOVE_UP_LEFT_DIAGONALLY_ONE]
@@ -1,39 +1,52 @@
-from typing import List, Tuple
-
-from src.constants import Color, PieceName
-from src.pieces.moves import (
-    MOVE_DOWN_LEFT_DIAGONALLY_ONE,
-    MOVE_DOWN_ONE,
-    MOVE_DOWN_RIGHT_DIAGONALLY_ONE,
-    MOVE_DOWN_TWO,
-    MOVE_UP_LEFT_DIAGONALLY_ONE,
-    MOVE_UP_ONE,
-    MOVE_UP_RIGHT_DIAGONALLY_ONE,
-    MOVE_UP_TWO,
+from src.constants import PIECE_VALUE, Color, PieceName
+from src.pieces.move_tables import (
+    CAPTURE_TABLES,
+    MOVE_TABLES,
+    PAWN_ADVANCE_TABLES,
+    REACH_TABLES,
+    Rays,
 )
 from src.pieces.piece import Piece
 
+_BLACK_PAWN = (PieceName.PAWN, Color.BLACK)
+_WHITE_PAWN = (PieceName.PAWN, Color.WHITE)
+
 
 class Pawn(Piece):
-    def __init__(self, color: Color, coordinates: Tuple[int, int]) -> None:
-        if color == Color.BLACK:
-            self.moves = [MOVE_DOWN_ONE, MOVE_DOWN_TWO]
-            self.captures = [
-                MOVE_DOWN_RIGHT_DIAGONALLY_ONE,
-                MOVE_DOWN_LEFT_DIAGONALLY_ONE,
-            ]
-        elif color == Color.WHITE:
-            self.moves = [MOVE_UP_ONE, MOVE_UP_TWO]
-            self.captures = [
-                MOVE_UP_RIGHT_DIAGONALLY_ONE,
-                MOVE_UP_LEFT_DIAGONALLY_ONE,
-            ]
-        super().__init__(PieceName.PAWN, color, coordinates, self.moves, self.captures)
-
-    def get_possible_moves(self) -> List[List[Tuple[int, int]]]:
+    """Pawn
+
+    Unlike the other pieces, a pawn's rays depend on its color, so the shared tables of both
+    colors are kept on the class and picked by color.
+    """
+
+    __slots__ = ()
+
+    name = PieceName.PAWN
+    value = PIECE_VALUE[PieceName.PAWN]
+    _black_move_table = MOVE_TABLES[_BLACK_PAWN]
+    _white_move_table = MOVE_TABLES[_WHITE_PAWN]
+    _black_advance_table = PAWN_ADVANCE_TABLES[Color.BLACK]
+    _white_advance_table = PAWN_ADVANCE_TABLES[Color.WHITE]
+    _black_capture_table = CAPTURE_TABLES[_BLACK_PAWN]
+    _white_capture_table = CAPTURE_TABLES[_WHITE_PAWN]
+    _black_reach_table = REACH_TABLES[_BLACK_PAWN]
+    _white_reach_table = REACH_TABLES[_WHITE_PAWN]
+
+    def get_possible_moves(self) -> Rays:
+        if self.color is Color.WHITE:
+            if self.has_moved:
+                return self._white_advance_table[self.square]
+            return self._white_move_table[self.square]
         if self.has_moved:
-            if self.color == Color.BLACK:
-                self._moves = [MOVE_DOWN_ONE]
-            elif self.color == Color.WHITE:
-                self._moves = [MOVE_UP_ONE]
-        return super().get_possible_moves()
+            return self._black_advance_table[self.square]
+        return self._black_move_table[self.square]
+
+    def get_possible_captures(self) -> Rays:
+        if self.color is Color.WHITE:
+            return self._white_capture_table[self.square]
+        return self._black_capture_table[self.square]
+
+    def get_reach_mask(self) -> int:
+        if self.color is Color.WHITE:
+            return self._white_reach_table[self.square]
+        return self._black_reach_table[self.square]
@@ -1,29 +1,59 @@
-from dataclasses import dataclass
-from typing import List, Tuple, Set
+from itertools import count
+from typing import List, Set, Tuple
 
-from src.constants import (
-    NUM_OF_COLS,
-    NUM_OF_ROWS,
-    PIECE_VALUE,
-    Color,
-    PieceName,
-)
+from src.bitboard import COORDINATES
+from src.constants import NUM_OF_COLS, Color, PieceName
+from src.pieces.move_tables import Rays
 
+"""Source of the unique integer ids given to pieces as they are created"""
+_PIECE_IDS = count()
 
-@dataclass
-class Piece:
-    """Piece Base Class"""
-
-    name: PieceName
-    color: Color
-    coordinates: Tuple[int, int]
-    _moves: List[List[Tuple[int, int]]]
-    _captures: List[List[Tuple[int, int]]]
-    _valid_moves: Set[Tuple[int, int]] = None
-    has_moved: bool = False
 
-    def __post_init__(self) -> None:
-        self.value = PIECE_VALUE[self.name]
+class Piece:
+    """Piece Base Class
+
+    Pieces are slotted: the only per-piece state is the id, color, square index, has_moved
+    flag and the cached pseudo-legal and legal moves. The name, value and the precomputed ray and reach tables
+    are class-level attributes shared by every piece of the same type.
+
+    Pieces compare and hash by identity, so a piece keeps its hash while it moves and can stay
+    inside sets and dictionaries. The integer id keys the piece index of its team.
+    """
+
+    __slots__ = (
+        "piece_id",
+        "color",
+        "square",
+        "has_moved",
+        "_pseudo_moves",
+        "_valid_moves",
+    )
+
+    name: PieceName = None
+    value: int = None
+    _move_table: List[Rays] = None
+    _capture_table: List[Rays] = None
+    _reach_table: List[int] = None
+
+    def __init__(
+        self, color: Color, coordinates: Tuple[int, int], has_moved: bool = False
+    ) -> None:
+        row, col = coordinates
+        self.piece_id = next(_PIECE_IDS)
+        self.color = color
+        self.square = row * NUM_OF_COLS + col
+        self.has_moved = has_moved
+        self._pseudo_moves = None
+        self._valid_moves = None
+
+    @property
+    def coordinates(self) -> Tuple[int, int]:
+        return COORDINATES[self.square]
+
+    @coordinates.setter
+    def coordinates(self, coordinates: Tuple[int, int]) -> None:
+        row, col = coordinates
+        self.square = row * NUM_OF_COLS + col
 
     def get_moves(self) -> Set[Tuple[int, int]]:
         return self._valid_moves
@@ -31,91 +61,52 @@ class Piece:
     def set_moves(self, valid_moves: Set[Tuple[int, int]]) -> None:
         self._valid_moves = set(valid_moves)
 
-    def get_possible_moves(self) -> List[List[Tuple[int, int]]]:
+    def get_pseudo_moves(self) -> Set[Tuple[int, int]]:
+        """Get the cached pseudo-legal moves, which may leave the team's own king attacked.
+
+        Returns:
+            Set[Tuple[int, int]]: The set of pseudo-legal moves.
+        """
+        return self._pseudo_moves
+
+    def get_possible_moves(self) -> Rays:
         """Get possible moves given the piece's current coordinates and move vectors.
 
-        This method finds all the possible moves within the range of the board bounds.
-        This method does not find all the valid moves of a piece considering the placement
-        of friendly and enemy pieces.
+        This method looks up the precomputed rays of the piece's current square, all of which
+        are within the range of the board bounds. This method does not find all the valid moves
+        of a piece considering the placement of friendly and enemy pieces.
 
         Returns:
-            List[List[Tuple[int, int]]]: The list of possible move vectors given the piece's coordinates.
+            Rays: The possible move rays given the piece's coordinates.
         """
-        directions = []
-        row, col = self.coordinates
-        for direction in self._moves:
-            moves = []
-            for row_offset, col_offset in direction:
-                new_row = row + row_offset
-                new_col = col + col_offset
-                if self._is_valid_coordinates((new_row, new_col)):
-                    moves.append((new_row, new_col))
-            directions.append(moves)
-        return directions
-
-    def get_possible_captures(self) -> List[List[Tuple[int, int]]]:
+        return self._move_table[self.square]
+
+    def get_possible_captures(self) -> Rays:
         """Get possible captures given the piece's current coordinates and capture vectors.
 
-        This method is similar to Piece.get_possible_moves but performs the logic for the
+        This method is similar to Piece.get_possible_moves but performs the lookup for the
         capture vectors. The move and capture vectors ONLY differ for Pawns.
 
         Returns:
-            List[List[Tuple[int, int]]]: The list of possible capture vectors given the piece's coordinates.
-        """
-        directions = []
-        row, col = self.coordinates
-        for direction in self._captures:
-            captures = []
-            for row_offset, col_offset in direction:
-                new_row = row + row_offset
-                new_col = col + col_offset
-                if self._is_valid_coordinates((new_row, new_col)):
-                    captures.append((new_row, new_col))
-            directions.append(captures)
-        return directions
-
-    @staticmethod
-    def _is_valid_coordinates(coordinates: Tuple[int, int]) -> bool:
-        """Determine if the given coordinates are within the board's bounds.
-
-        Args:
-            coordinates (Tuple[int, int]): The given coordinates
-
-        Returns:
-            bool: True if the coordinates are within the board's bounds. Otherwise, False.
+            Rays: The possible capture rays given the piece's coordinates.
         """
-        row, col = coordinates
-        if 0 <= row < NUM_OF_ROWS and 0 <= col < NUM_OF_COLS:
-            return True
-        return False
+        return self._capture_table[self.square]
 
-    def __eq__(self, o: object) -> bool:
-        """Return whether piece object is equivalent to other object.
-
-        Args:
-            o (object): The other object.
+    def get_reach_mask(self) -> int:
+        """Get the bitmask of the squares whose occupancy can change the piece's valid moves.
 
         Returns:
-            bool: True if the objects are equal. Otherwise, False.
+            int: The bitmask of every square on the piece's move and capture rays.
         """
-        if isinstance(o, Piece):
-            if (
-                o.color == self.color
-                and o.name == self.name
-                and o.coordinates == self.coordinates
-            ):
-                return True
-        return False
-
-    def __hash__(self) -> int:
-        """Return hash of piece.
+        return self._reach_table[self.square]
+
+    def __repr__(self) -> str:
+        """Return the piece represented for debugging.
 
         Returns:
-            int: The hash of piece.
+            str: The class name, color and coordinates of the piece.
         """
-        return hash(
-            str(self.color.value) + str(self.name.value) + str(self.coordinates)
-        )
+        return f"{type(self).__name__}({self.color}, {self.coordinates})"
 
     def __str__(self) -> str:
         """Return the piece represented as a string.
@@ -1,30 +1,13 @@
-from typing import Tuple
-
-from src.constants import PieceName, Color
-from src.pieces.moves import (
-    MOVE_DOWN,
-    MOVE_DOWN_LEFT_DIAGONALLY,
-    MOVE_DOWN_RIGHT_DIAGONALLY,
-    MOVE_LEFT,
-    MOVE_RIGHT,
-    MOVE_UP,
-    MOVE_UP_LEFT_DIAGONALLY,
-    MOVE_UP_RIGHT_DIAGONALLY,
-)
+from src.constants import PIECE_VALUE, Color, PieceName
+from src.pieces.move_tables import CAPTURE_TABLES, MOVE_TABLES, REACH_TABLES
 from src.pieces.piece import Piece
 
 
 class Queen(Piece):
-    def __init__(self, color: Color, coordinates: Tuple[int, int]) -> None:
-        self.moves = [
-            MOVE_UP,
-            MOVE_DOWN,
-            MOVE_LEFT,
-            MOVE_RIGHT,
-            MOVE_UP_RIGHT_DIAGONALLY,
-            MOVE_UP_LEFT_DIAGONALLY,
-            MOVE_DOWN_RIGHT_DIAGONALLY,
-            MOVE_DOWN_LEFT_DIAGONALLY,
-        ]
-        self.captures = self.moves
-        super().__init__(PieceName.QUEEN, color, coordinates, self.moves, self.captures)
+    __slots__ = ()
+
+    name = PieceName.QUEEN
+    value = PIECE_VALUE[PieceName.QUEEN]
+    _move_table = MOVE_TABLES[(PieceName.QUEEN, Color.WHITE)]
+    _capture_table = CAPTURE_TABLES[(PieceName.QUEEN, Color.WHITE)]
+    _reach_table = REACH_TABLES[(PieceName.QUEEN, Color.WHITE)]
@@ -1,17 +1,13 @@
-from typing import Tuple
-
-from src.constants import Color, PieceName
+from src.constants import PIECE_VALUE, Color, PieceName
+from src.pieces.move_tables import CAPTURE_TABLES, MOVE_TABLES, REACH_TABLES
 from src.pieces.piece import Piece
-from src.pieces.moves import (
-    MOVE_UP,
-    MOVE_DOWN,
-    MOVE_LEFT,
-    MOVE_RIGHT,
-)
 
 
 class Rook(Piece):
-    def __init__(self, color: Color, coordinates: Tuple[int, int]) -> None:
-        self.moves = [MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT]
-        self.captures = self.moves
-        super().__init__(PieceName.ROOK, color, coordinates, self.moves, self.captures)
+    __slots__ = ()
+
+    name = PieceName.ROOK
+    value = PIECE_VALUE[PieceName.ROOK]
+    _move_table = MOVE_TABLES[(PieceName.ROOK, Color.WHITE)]
+    _capture_table = CAPTURE_TABLES[(PieceName.ROOK, Color.WHITE)]
+    _reach_table = REACH_TABLES[(PieceName.ROOK, Color.WHITE)]
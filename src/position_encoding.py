@@ -0,0 +1,391 @@
+from typing import BinaryIO, Iterable, Iterator, List, Tuple, Union
+
+import numpy as np
+
+from src.batch_evaluation import FEN_PLANES, PLANES
+from src.bitboard import COORDINATES, to_square
+from src.chess_engine import ChessEngine
+from src.constants import CASTLING_FEN, NUM_OF_COLS, NUM_OF_ROWS
+from src.exceptions import (
+    InvalidBitboards,
+    InvalidColumnUserInput,
+    InvalidCoordinatesUserInput,
+    InvalidFen,
+    InvalidRowUserInput,
+)
+from src.move import Move, decode_move, encode_move
+from src.utils.utils import convert_coordinates, format_coordinates
+
+"""Packed position layout, 32 bytes little-endian.
+
+The occupancy bitboard is followed by a 4-bit piece code (the PLANES index) for each occupied
+square in square order, the low nibble first. The flags hold the side to move in bit 0 (1 for
+black) and the castling rights bit flags in bits 1-4. The en passant field is the square index
+of the en passant square or 0 for none, square 0 can never be an en passant square.
+"""
+POSITION_DTYPE = np.dtype(
+    [
+        ("occupancy", "<u8"),
+        ("pieces", "u1", 16),
+        ("flags", "u1"),
+        ("en_passant", "u1"),
+        ("halfmove_clock", "u1"),
+        ("fullmove_number", "<u2"),
+        ("reserved", "u1", 3),
+    ]
+)
+
+"""Size of a packed position in bytes"""
+POSITION_SIZE = POSITION_DTYPE.itemsize
+
+"""Maximum number of pieces of a packed position"""
+MAX_PIECES = 32
+
+"""Packed move list layout, a move count followed by the encode_move codes"""
+MOVE_DTYPE = np.dtype("<u2")
+
+"""Piece code of an empty square when the piece codes are spread over the board"""
+EMPTY = len(PLANES)
+
+"""FEN piece character of each piece code"""
+PLANE_CHARS = {plane: char for char, plane in FEN_PLANES.items()}
+
+
+def pack_fen(fen: str) -> bytes:
+    """Pack the position of a FEN string.
+
+    Args:
+        fen (str): The FEN string of the position.
+
+    Raises:
+        InvalidFen: Raises InvalidFen if the FEN string cannot be parsed, has more than
+            MAX_PIECES pieces or has a clock that does not fit the packed position.
+
+    Returns:
+        bytes: The POSITION_SIZE bytes of the packed position.
+    """
+    fields = fen.split()
+    if len(fields) < 4 or fields[1] not in ("w", "b"):
+        raise InvalidFen(fen)
+    placement, turn, castling, en_passant = fields[:4]
+
+    record = np.zeros((), dtype=POSITION_DTYPE)
+    occupancy, codes, row, col = 0, [], 0, 0
+    for char in placement + "/":
+        if char == "/":
+            if col != NUM_OF_COLS:
+                raise InvalidFen(fen)
+            row, col = row + 1, 0
+        elif char.isdigit():
+            col += int(char)
+        elif char in FEN_PLANES and col < NUM_OF_COLS:
+            occupancy |= 1 << to_square((row, col))
+            codes.append(FEN_PLANES[char])
+            col += 1
+        else:
+            raise InvalidFen(fen)
+    if len(codes) > MAX_PIECES or row != NUM_OF_ROWS:
+        raise InvalidFen(fen)
+    codes += [0] * (MAX_PIECES - len(codes))
+
+    rights = sum(right for right, char in CASTLING_FEN.items() if char in castling)
+    record["occupancy"] = occupancy
+    record["pieces"] = [low | high << 4 for low, high in zip(codes[::2], codes[1::2])]
+    record["flags"] = (turn == "b") | rights << 1
+    try:
+        if en_passant != "-":
+            row, col = convert_coordinates(en_passant)
+            record["en_passant"] = to_square((row, col))
+        halfmove_clock = int(fields[4]) if len(fields) > 4 else 0
+        fullmove_number = int(fields[5]) if len(fields) > 5 else 1
+    except (
+        ValueError,
+        InvalidColumnUserInput,
+        InvalidCoordinatesUserInput,
+        InvalidRowUserInput,
+    ):
+        raise InvalidFen(fen)
+    if halfmove_clock < 0 or fullmove_number < 0:
+        raise InvalidFen(fen)
+    record["halfmove_clock"] = min(halfmove_clock, 255)
+    record["fullmove_number"] = min(fullmove_number, 65535)
+    return record.tobytes()
+
+
+def pack_engine(engine: ChessEngine) -> bytes:
+    """Pack the current position of a chess engine.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+
+    Returns:
+        bytes: The POSITION_SIZE bytes of the packed position.
+    """
+    return pack_fen(engine.to_fen())
+
+
+def pack_fens(fens: Iterable[str]) -> np.ndarray:
+    """Pack the positions of a batch of FEN strings.
+
+    Each FEN string is parsed in Python, use pack_bitboards to pack positions that are
+    already bitboards without per-position Python objects.
+
+    Args:
+        fens (Iterable[str]): The FEN strings.
+
+    Returns:
+        np.ndarray: The (N,) POSITION_DTYPE packed positions, .tobytes() gives the file format.
+    """
+    data = b"".join(pack_fen(fen) for fen in fens)
+    return np.frombuffer(bytearray(data), dtype=POSITION_DTYPE)
+
+
+def unpack_fen(data: Union[bytes, memoryview, np.void]) -> str:
+    """Unpack a packed position to a FEN string, e.g. to set a chess engine to it.
+
+    Args:
+        data (Union[bytes, memoryview, np.void]): The packed position.
+
+    Returns:
+        str: The FEN string of the position.
+    """
+    record = np.frombuffer(bytes(data), dtype=POSITION_DTYPE)[0]
+    codes = _piece_codes(record["pieces"][np.newaxis])[0]
+    occupancy = int(record["occupancy"])
+
+    rows, count = [], 0
+    for row in range(NUM_OF_ROWS):
+        fen_row, empty = "", 0
+        for col in range(NUM_OF_COLS):
+            if occupancy >> to_square((row, col)) & 1:
+                if empty:
+                    fen_row, empty = fen_row + str(empty), 0
+                fen_row += PLANE_CHARS[int(codes[count])]
+                count += 1
+            else:
+                empty += 1
+        rows.append(fen_row + str(empty) if empty else fen_row)
+
+    flags = int(record["flags"])
+    castling = "".join(
+        char for right, char in CASTLING_FEN.items() if flags >> 1 & right
+    )
+    en_passant = int(record["en_passant"])
+    if en_passant:
+        en_passant = format_coordinates(COORDINATES[en_passant])
+    return " ".join(
+        [
+            "/".join(rows),
+            "b" if flags & 1 else "w",
+            castling or "-",
+            en_passant or "-",
+            str(int(record["halfmove_clock"])),
+            str(int(record["fullmove_number"])),
+        ]
+    )
+
+
+def read_positions(buffer: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+    """View a buffer of packed positions as an array without copying it.
+
+    Args:
+        buffer (Union[bytes, bytearray, memoryview]): The packed positions, e.g. a memory map.
+
+    Returns:
+        np.ndarray: The (N,) POSITION_DTYPE packed positions.
+    """
+    return np.frombuffer(buffer, dtype=POSITION_DTYPE)
+
+
+def load_positions(file_path: str) -> np.ndarray:
+    """Memory map a file of packed positions.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        np.ndarray: The (N,) read-only POSITION_DTYPE packed positions, read from disk on access.
+    """
+    return np.memmap(file_path, dtype=POSITION_DTYPE, mode="r")
+
+
+def _piece_codes(pieces: np.ndarray) -> np.ndarray:
+    """Split the packed piece codes of a batch of positions into one code per byte.
+
+    Args:
+        pieces (np.ndarray): The (N, 16) uint8 packed piece codes.
+
+    Returns:
+        np.ndarray: The (N, 32) uint8 piece codes in square order.
+    """
+    codes = np.empty(pieces.shape[:-1] + (MAX_PIECES,), dtype=np.uint8)
+    codes[..., 0::2] = pieces & 0x0F
+    codes[..., 1::2] = pieces >> 4
+    return codes
+
+
+def unpack_boards(records: np.ndarray) -> np.ndarray:
+    """Spread the piece codes of a batch of packed positions over the board.
+
+    Args:
+        records (np.ndarray): The (N,) POSITION_DTYPE packed positions.
+
+    Returns:
+        np.ndarray: The (N, 64) uint8 piece code of every square, EMPTY for an empty square.
+    """
+    occupancy = np.ascontiguousarray(records["occupancy"], dtype="<u8")
+    occupied = np.unpackbits(
+        occupancy.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little"
+    ).astype(bool)
+    # the k-th occupied square holds the k-th piece code
+    index = np.cumsum(occupied, axis=1) - 1
+    codes = _piece_codes(records["pieces"])
+    board = np.take_along_axis(codes, np.clip(index, 0, MAX_PIECES - 1), axis=1)
+    board[~occupied] = EMPTY
+    return board
+
+
+def unpack_bitboards(records: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Unpack the piece bitboards and the team to move of a batch of packed positions.
+
+    The result is in the format of engine_bitboards and fen_bitboards, so the positions can be
+    passed straight to BatchEvaluator.evaluate or encode_bitboards.
+
+    Args:
+        records (np.ndarray): The (N,) POSITION_DTYPE packed positions.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (N, 12) uint64 bitboards indexed by position and
+            plane, and the (N,) side to move, 1 for white and -1 for black.
+    """
+    board = unpack_boards(records)
+    planes = board[:, np.newaxis, :] == np.arange(len(PLANES))[:, np.newaxis]
+    bitboards = np.packbits(planes, axis=2, bitorder="little")
+    bitboards = np.ascontiguousarray(bitboards).view("<u8")[..., 0].astype(np.uint64)
+    turns = np.where(records["flags"] & 1, -1, 1).astype(np.int8)
+    return bitboards, turns
+
+
+def pack_bitboards(
+    bitboards: np.ndarray,
+    turns: np.ndarray,
+    castling: np.ndarray = None,
+    en_passant: np.ndarray = None,
+    halfmove_clock: np.ndarray = None,
+    fullmove_number: np.ndarray = None,
+) -> np.ndarray:
+    """Pack a batch of positions from their piece bitboards, the inverse of unpack_bitboards.
+
+    Args:
+        bitboards (np.ndarray): The (N, 12) uint64 bitboards indexed by position and plane.
+        turns (np.ndarray): The (N,) side to move, 1 for white and -1 for black.
+        castling (np.ndarray, optional): The (N,) castling rights bit flags. Defaults to None
+            (no castling rights).
+        en_passant (np.ndarray, optional): The (N,) en passant square index or 0 for none.
+            Defaults to None (no en passant squares).
+        halfmove_clock (np.ndarray, optional): The (N,) halfmove clocks. Defaults to None (0).
+        fullmove_number (np.ndarray, optional): The (N,) fullmove numbers. Defaults to None
+            (1).
+
+    Raises:
+        InvalidBitboards: Raises InvalidBitboards if two pieces of a position share a square
+            or a position has more than MAX_PIECES pieces.
+
+    Returns:
+        np.ndarray: The (N,) POSITION_DTYPE packed positions, .tobytes() gives the file format.
+    """
+    bitboards = np.ascontiguousarray(bitboards, dtype="<u8").reshape(-1, len(PLANES))
+    count = len(bitboards)
+    planes = np.unpackbits(
+        bitboards.view(np.uint8).reshape(count, len(PLANES), 8),
+        axis=2,
+        bitorder="little",
+    ).astype(bool)
+    pieces_per_square = planes.sum(axis=1)
+    occupied = pieces_per_square > 0
+    invalid = (pieces_per_square > 1).any(axis=1) | (occupied.sum(axis=1) > MAX_PIECES)
+    if invalid.any():
+        raise InvalidBitboards(int(np.argmax(invalid)))
+
+    # the k-th occupied square holds the k-th piece code, empty squares write to a spare slot
+    board = planes.argmax(axis=1).astype(np.uint8)
+    index = np.where(occupied, np.cumsum(occupied, axis=1) - 1, MAX_PIECES)
+    codes = np.zeros((count, MAX_PIECES + 1), dtype=np.uint8)
+    codes[np.arange(count)[:, np.newaxis], index] = board
+
+    occupancy = np.packbits(occupied, axis=1, bitorder="little").view("<u8")
+    records = np.zeros(count, dtype=POSITION_DTYPE)
+    records["occupancy"] = occupancy[:, 0]
+    records["pieces"] = codes[:, 0:MAX_PIECES:2] | codes[:, 1:MAX_PIECES:2] << 4
+    flags = (np.asarray(turns) < 0).astype(np.uint8)
+    if castling is not None:
+        flags |= np.asarray(castling, dtype=np.uint8) << 1
+    records["flags"] = flags
+    if en_passant is not None:
+        records["en_passant"] = en_passant
+    if halfmove_clock is not None:
+        records["halfmove_clock"] = np.minimum(halfmove_clock, 255)
+    records["fullmove_number"] = (
+        1 if fullmove_number is None else np.minimum(fullmove_number, 65535)
+    )
+    return records
+
+
+def pack_moves(moves: List[Move]) -> np.ndarray:
+    """Pack a move list with encode_move.
+
+    Args:
+        moves (List[Move]): The moves.
+
+    Returns:
+        np.ndarray: The (N,) uint16 packed moves.
+    """
+    return np.array([encode_move(move) for move in moves], dtype=MOVE_DTYPE)
+
+
+def unpack_moves(codes: np.ndarray) -> List[Move]:
+    """Unpack a move list packed by pack_moves.
+
+    Args:
+        codes (np.ndarray): The (N,) uint16 packed moves.
+
+    Returns:
+        List[Move]: The moves.
+    """
+    return [decode_move(code) for code in codes.tolist()]
+
+
+def write_game(output: BinaryIO, fen: str, moves: List[Move]) -> None:
+    """Write a game as its packed start position, its number of moves and its packed moves.
+
+    Args:
+        output (BinaryIO): The binary stream to write to.
+        fen (str): The FEN string of the start position.
+        moves (List[Move]): The moves of the game.
+    """
+    output.write(pack_fen(fen))
+    output.write(np.array([len(moves)], dtype=MOVE_DTYPE).tobytes())
+    output.write(pack_moves(moves).tobytes())
+
+
+def read_games(
+    buffer: Union[bytes, bytearray, memoryview],
+) -> Iterator[Tuple[np.void, np.ndarray]]:
+    """Lazily read the games of a buffer written by write_game without copying them.
+
+    Args:
+        buffer (Union[bytes, bytearray, memoryview]): The packed games, e.g. a memory map.
+
+    Yields:
+        Tuple[np.void, np.ndarray]: The POSITION_DTYPE packed start position and the (N,)
+            uint16 packed moves of each game.
+    """
+    view = memoryview(buffer).cast("B")
+    offset = 0
+    while offset < len(view):
+        position = np.frombuffer(view, POSITION_DTYPE, 1, offset)[0]
+        offset += POSITION_SIZE
+        count = int(np.frombuffer(view, MOVE_DTYPE, 1, offset)[0])
+        offset += MOVE_DTYPE.itemsize
+        yield position, np.frombuffer(view, MOVE_DTYPE, count, offset)
+        offset += count * MOVE_DTYPE.itemsize
@@ -0,0 +1,305 @@
+import time
+from dataclasses import dataclass, field
+from threading import Event
+from typing import Callable, List, Tuple
+
+from src.chess_engine import ChessEngine
+from src.constants import PieceName
+from src.evaluation import Evaluator
+from src.move import Move
+from src.move_ordering import MoveOrdering
+from src.static_exchange import is_tactical, mvv_lva, static_exchange
+from src.transposition_table import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+)
+
+"""Score of checkmating the enemy king (mate scores are MATE_SCORE minus the ply of the mate)"""
+MATE_SCORE = 30000
+
+"""Score bound larger than any reachable score"""
+INFINITY = 32000
+
+"""Maximum search depth when only a time limit is given"""
+MAX_DEPTH = 64
+
+"""Number of nodes searched between two checks of the deadline and the stop event (a node
+takes long enough in Python that checking often keeps the search quick to stop)"""
+NODES_PER_TIME_CHECK = 16
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search tree when the time budget is spent."""
+
+
+@dataclass
+class Search:
+    """Alpha-Beta Negamax Search
+
+    The search runs an iterative deepening alpha-beta negamax over the legal moves of the
+    positions of the given chess engine, making and unmaking moves in place. At the end of
+    the main search a quiescence search resolves the pending captures and promotions so
+    positions are only evaluated when they are quiet.
+
+    The search can be stopped from another thread or process with the stop event, and
+    on_iteration is called with the depth, score and principal variation of every completed
+    iteration.
+    """
+
+    engine: ChessEngine
+    table: TranspositionTable = field(default_factory=TranspositionTable)
+    evaluator: Evaluator = field(default_factory=Evaluator)
+    ordering: MoveOrdering = field(default_factory=MoveOrdering)
+    stop_event: Event = field(default=None, repr=False)
+    on_iteration: Callable[[int, int, List[Move]], None] = field(
+        default=None, repr=False
+    )
+    nodes: int = 0
+    completed_depth: int = 0
+    _deadline: float = field(default=None, repr=False)
+    _root_moves: List[Move] = field(default=None, repr=False)
+
+    def search(
+        self,
+        depth: int = None,
+        time_limit: float = None,
+        root_moves: List[Move] = None,
+    ) -> Tuple[Move, int, List[Move]]:
+        """Search the current position for the best move.
+
+        The search deepens one ply at a time until the given depth is completed, the time
+        limit is spent or the stop event is set. When the search is stopped early the result
+        of the deepest completed iteration is returned.
+
+        Args:
+            depth (int, optional): The maximum search depth in plies. Defaults to None (MAX_DEPTH).
+            time_limit (float, optional): The time budget in seconds. Defaults to None (no limit).
+            root_moves (List[Move], optional): Only search these moves of the current position.
+                Defaults to None (every legal move).
+
+        Returns:
+            Tuple[Move, int, List[Move]]: The best move, its score in centipawns from the point of
+                view of the team to move and the principal variation.
+        """
+        max_depth = depth or MAX_DEPTH
+        self.nodes = 0
+        self.completed_depth = 0
+        self._root_moves = root_moves
+        self._deadline = time.perf_counter() + time_limit if time_limit else None
+        self.table.new_search()
+        self.ordering.new_search()
+
+        moves = root_moves or self.engine.generate_moves()
+        best_move, best_score, best_pv = (moves[0] if moves else None), 0, []
+        for iteration_depth in range(1, max_depth + 1):
+            pv = []
+            try:
+                score = self._negamax(iteration_depth, -INFINITY, INFINITY, 0, pv)
+            except SearchTimeout:
+                break
+            # without legal moves there is no pv, only the checkmate or stalemate score
+            best_score = score
+            if pv:
+                best_move, best_pv = pv[0], pv
+            self.completed_depth = iteration_depth
+            if self.on_iteration:
+                self.on_iteration(iteration_depth, score, best_pv)
+            if abs(score) >= MATE_SCORE - MAX_DEPTH:
+                break
+
+        return best_move, best_score, best_pv
+
+    def _negamax(
+        self,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+        pv: List[Move],
+    ) -> int:
+        """Score the current position with a fail-soft alpha-beta negamax search.
+
+        Args:
+            depth (int): The remaining search depth in plies.
+            alpha (int): The lower bound of the search window.
+            beta (int): The upper bound of the search window.
+            ply (int): The distance from the root in plies.
+            pv (List[Move]): Filled with the principal variation from this position.
+
+        Raises:
+            SearchTimeout: Raises SearchTimeout if the time budget is spent.
+
+        Returns:
+            int: The score of the position from the point of view of the team to move.
+        """
+        if depth == 0:
+            return self._quiescence(alpha, beta, ply)
+        self._count_node()
+
+        engine = self.engine
+        key = engine.get_hash()
+        entry = self.table.probe(key)
+        table_move = None
+        if entry:
+            entry_depth, entry_score, bound, table_move = entry
+            if ply > 0 and entry_depth >= depth:
+                entry_score = _score_from_table(entry_score, ply)
+                if (
+                    bound == EXACT
+                    or (bound == LOWER_BOUND and entry_score >= beta)
+                    or (bound == UPPER_BOUND and entry_score <= alpha)
+                ):
+                    return entry_score
+
+        original_alpha = alpha
+        best_score, best_move = -INFINITY, None
+        for move in self.ordering.order_moves(engine, ply, table_move):
+            if ply == 0 and self._root_moves and move not in self._root_moves:
+                continue
+            child_pv = []
+            undo = engine.make_move(move)
+            try:
+                score = -self._negamax(
+                    depth - 1,
+                    -beta,
+                    -alpha,
+                    ply + 1,
+                    child_pv,
+                )
+            finally:
+                # also unwinds the position when the search times out
+                engine.unmake_move(undo)
+
+            if score > best_score:
+                best_score, best_move = score, move
+            if score > alpha:
+                alpha = score
+                pv[:] = [move] + child_pv
+                if alpha >= beta:
+                    self.ordering.update(engine, move, ply, depth)
+                    break
+
+        if best_move is None:
+            # checkmate if in check, otherwise stalemate
+            team = engine.get_team(engine.get_turn())
+            return -(MATE_SCORE - ply) if engine.is_check(team) else 0
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.table.store(key, depth, _score_to_table(best_score, ply), bound, best_move)
+        return best_score
+
+    def _quiescence(self, alpha: int, beta: int, ply: int) -> int:
+        """Score the current position by searching captures and promotions until it is quiet.
+
+        Unless the team to move is in check it may stand pat on the static evaluation instead
+        of capturing. Captures are searched by MVV-LVA and captures that lose material by static
+        exchange evaluation are pruned. In check every evasion is searched.
+
+        Args:
+            alpha (int): The lower bound of the search window.
+            beta (int): The upper bound of the search window.
+            ply (int): The distance from the root in plies.
+
+        Raises:
+            SearchTimeout: Raises SearchTimeout if the time budget is spent.
+
+        Returns:
+            int: The score of the position from the point of view of the team to move.
+        """
+        self._count_node()
+
+        engine = self.engine
+        moves = engine.generate_moves()
+        in_check = engine.is_check(engine.get_team(engine.get_turn()))
+        if not moves:
+            return -(MATE_SCORE - ply) if in_check else 0
+        if ply >= MAX_DEPTH:
+            return self.evaluate()
+
+        best_score = -INFINITY
+        if in_check:
+            moves.sort(
+                key=lambda move: (
+                    mvv_lva(engine, move) if is_tactical(engine, move) else -INFINITY
+                ),
+                reverse=True,
+            )
+        else:
+            best_score = self.evaluate()
+            if best_score >= beta:
+                return best_score
+            alpha = max(alpha, best_score)
+            # under-promotions are left to the main search
+            moves = [
+                move
+                for move in moves
+                if move.promotion in (None, PieceName.QUEEN)
+                and is_tactical(engine, move)
+            ]
+            moves.sort(key=lambda move: mvv_lva(engine, move), reverse=True)
+
+        for move in moves:
+            if not in_check and static_exchange(engine, move) < 0:
+                continue
+            undo = engine.make_move(move)
+            try:
+                score = -self._quiescence(-beta, -alpha, ply + 1)
+            finally:
+                engine.unmake_move(undo)
+
+            if score > best_score:
+                best_score = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+        return best_score
+
+    def _count_node(self) -> None:
+        """Count a searched node and check the deadline and stop event every few nodes.
+
+        The deadline and the stop event are checked every NODES_PER_TIME_CHECK nodes.
+
+        Raises:
+            SearchTimeout: Raises SearchTimeout if the time budget is spent or the search is
+                stopped.
+        """
+        self.nodes += 1
+        if self.nodes % NODES_PER_TIME_CHECK == 0 and (
+            (self._deadline is not None and time.perf_counter() >= self._deadline)
+            or (self.stop_event is not None and self.stop_event.is_set())
+        ):
+            raise SearchTimeout
+
+    def evaluate(self) -> int:
+        """Evaluate the current position with the static evaluator.
+
+        Returns:
+            int: The score in centipawns from the point of view of the team to move.
+        """
+        return self.evaluator.evaluate(self.engine)
+
+
+def _score_to_table(score: int, ply: int) -> int:
+    """Convert a mate score relative to the root into one relative to the stored position."""
+    if score >= MATE_SCORE - MAX_DEPTH:
+        return score + ply
+    if score <= -(MATE_SCORE - MAX_DEPTH):
+        return score - ply
+    return score
+
+
+def _score_from_table(score: int, ply: int) -> int:
+    """Convert a stored mate score relative to its position into one relative to the root."""
+    if score >= MATE_SCORE - MAX_DEPTH:
+        return score - ply
+    if score <= -(MATE_SCORE - MAX_DEPTH):
+        return score + ply
+    return score
@@ -0,0 +1,236 @@
+from typing import Dict, List
+
+from src.bitboard import NUM_OF_SQUARES, to_square
+from src.chess_engine import ChessEngine
+from src.constants import PIECE_VALUE, Color, PieceName
+from src.move import Move
+from src.pieces.move_tables import CAPTURE_TABLES, MOVE_TABLES, REACH_TABLES
+
+"""Centipawn value of each piece in an exchange"""
+EXCHANGE_VALUE = {name: 100 * value for name, value in PIECE_VALUE.items()}
+
+"""Piece names from the least to the most valuable, the order attackers join an exchange"""
+ATTACKER_ORDER = sorted(PieceName, key=lambda name: PIECE_VALUE[name])
+
+
+def _build_ray_squares(name: PieceName) -> List[List[List[int]]]:
+    """Build the rays of a sliding piece as square indices.
+
+    Args:
+        name (PieceName): The name of the sliding piece.
+
+    Returns:
+        List[List[List[int]]]: The rays ordered outwards from the square, indexed by square index.
+    """
+    return [
+        [[to_square(coordinates) for coordinates in ray] for ray in rays]
+        for rays in MOVE_TABLES[(name, Color.WHITE)]
+    ]
+
+
+"""Rook rays as square indices, indexed by square index"""
+ROOK_RAYS = _build_ray_squares(PieceName.ROOK)
+
+"""Bishop rays as square indices, indexed by square index"""
+BISHOP_RAYS = _build_ray_squares(PieceName.BISHOP)
+
+
+def _build_pawn_attacker_masks() -> Dict[Color, List[int]]:
+    """Build the squares a pawn of each color attacks a square from.
+
+    A pawn attacks a square from the squares a pawn of the other color on it would capture.
+
+    Returns:
+        Dict[Color, List[int]]: The attacker bitmasks indexed by color and then by square index.
+    """
+    masks = {}
+    for color, enemy in [(Color.WHITE, Color.BLACK), (Color.BLACK, Color.WHITE)]:
+        masks[color] = []
+        for square in range(NUM_OF_SQUARES):
+            mask = 0
+            for ray in CAPTURE_TABLES[(PieceName.PAWN, enemy)][square]:
+                for coordinates in ray:
+                    mask |= 1 << to_square(coordinates)
+            masks[color].append(mask)
+    return masks
+
+
+"""Squares a pawn of each color attacks a square from, indexed by color and square index"""
+PAWN_ATTACKER_MASKS = _build_pawn_attacker_masks()
+
+"""Squares a knight attacks a square from, indexed by square index"""
+KNIGHT_MASKS = REACH_TABLES[(PieceName.KNIGHT, Color.WHITE)]
+
+"""Squares a king attacks a square from, indexed by square index"""
+KING_MASKS = REACH_TABLES[(PieceName.KING, Color.WHITE)]
+
+
+def captured_name(engine: ChessEngine, move: Move) -> PieceName:
+    """Get the name of the piece captured by a move.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+        move (Move): The move.
+
+    Returns:
+        PieceName: The name of the captured piece. If the move is not a capture return None.
+    """
+    captured = engine.get_piece(move.dest)
+    if captured:
+        return captured.name
+    if move.dest == engine.get_en_passant():
+        if engine.get_piece(move.src).name == PieceName.PAWN:
+            return PieceName.PAWN
+    return None
+
+
+def is_tactical(engine: ChessEngine, move: Move) -> bool:
+    """Determine if a move is a capture or a promotion.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+        move (Move): The move.
+
+    Returns:
+        bool: True if the move captures a piece or promotes a pawn. Otherwise, False.
+    """
+    return move.promotion is not None or captured_name(engine, move) is not None
+
+
+def mvv_lva(engine: ChessEngine, move: Move) -> int:
+    """Score a capture by most valuable victim, then least valuable attacker.
+
+    Promotions count the value the pawn gains as part of the victim.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+        move (Move): The capture or promotion.
+
+    Returns:
+        int: The score, higher scores should be searched first.
+    """
+    victim = captured_name(engine, move)
+    value = PIECE_VALUE[victim] if victim else 0
+    if move.promotion:
+        value += PIECE_VALUE[move.promotion] - PIECE_VALUE[PieceName.PAWN]
+    return value * 10000 - PIECE_VALUE[engine.get_piece(move.src).name]
+
+
+def attackers_to(engine: ChessEngine, square: int, occupied: int) -> int:
+    """Find the pieces of both teams attacking a square through the given occupancy.
+
+    Sliding pieces are found by walking the rays from the square up to the first occupied
+    square, so removing a piece from the occupancy reveals the pieces behind it.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+        square (int): The square index.
+        occupied (int): The bitmask of the occupied squares.
+
+    Returns:
+        int: The bitmask of the squares of the attacking pieces.
+    """
+    return _attackers_to(_get_bitboards(engine), square, occupied)
+
+
+def _get_bitboards(engine: ChessEngine) -> Dict[Color, Dict[PieceName, int]]:
+    """Copy the piece bitboards of both teams so an exchange can look them up cheaply.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+
+    Returns:
+        Dict[Color, Dict[PieceName, int]]: The bitboards indexed by color and piece name.
+    """
+    board = engine.get_board()
+    return {
+        color: {name: board.get_bitboard(color, name) for name in PieceName}
+        for color in Color
+    }
+
+
+def _attackers_to(
+    bitboards: Dict[Color, Dict[PieceName, int]], square: int, occupied: int
+) -> int:
+    """Find the pieces of both teams attacking a square through the given occupancy.
+
+    Args:
+        bitboards (Dict[Color, Dict[PieceName, int]]): The bitboards indexed by color and
+            piece name.
+        square (int): The square index.
+        occupied (int): The bitmask of the occupied squares.
+
+    Returns:
+        int: The bitmask of the squares of the attacking pieces.
+    """
+    white, black = bitboards[Color.WHITE], bitboards[Color.BLACK]
+    attackers = (
+        PAWN_ATTACKER_MASKS[Color.WHITE][square] & white[PieceName.PAWN]
+        | PAWN_ATTACKER_MASKS[Color.BLACK][square] & black[PieceName.PAWN]
+        | KNIGHT_MASKS[square] & (white[PieceName.KNIGHT] | black[PieceName.KNIGHT])
+        | KING_MASKS[square] & (white[PieceName.KING] | black[PieceName.KING])
+    )
+    queens = white[PieceName.QUEEN] | black[PieceName.QUEEN]
+    for rays, sliders in [
+        (ROOK_RAYS, white[PieceName.ROOK] | black[PieceName.ROOK] | queens),
+        (BISHOP_RAYS, white[PieceName.BISHOP] | black[PieceName.BISHOP] | queens),
+    ]:
+        for ray in rays[square]:
+            for other in ray:
+                if occupied >> other & 1:
+                    attackers |= sliders & 1 << other
+                    break
+    return attackers & occupied
+
+
+def static_exchange(engine: ChessEngine, move: Move) -> int:
+    """Evaluate the material won or lost by the exchange a capture starts on its dest square.
+
+    Both teams recapture with their least valuable attacker and may stop the exchange when
+    continuing would lose material. Pins and checks are ignored.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+        move (Move): The capture or promotion.
+
+    Returns:
+        int: The material balance of the exchange in centipawns for the team making the move.
+    """
+    board = engine.get_board()
+    bitboards = _get_bitboards(engine)
+    piece = engine.get_piece(move.src)
+    square = to_square(move.dest)
+    occupied = board.get_occupancy() & ~(1 << to_square(move.src))
+
+    victim = captured_name(engine, move)
+    gains = [EXCHANGE_VALUE[victim] if victim else 0]
+    attacker_value = EXCHANGE_VALUE[piece.name]
+    if move.promotion:
+        gains[0] += EXCHANGE_VALUE[move.promotion] - EXCHANGE_VALUE[PieceName.PAWN]
+        attacker_value = EXCHANGE_VALUE[move.promotion]
+    if victim and engine.get_piece(move.dest) is None:
+        # en passant, the captured pawn is beside the dest square
+        occupied &= ~(1 << to_square((move.src[0], move.dest[1])))
+
+    color = Color.BLACK if piece.color == Color.WHITE else Color.WHITE
+    while True:
+        attackers = _attackers_to(bitboards, square, occupied)
+        attackers &= board.get_occupancy(color)
+        if not attackers:
+            break
+        for name in ATTACKER_ORDER:
+            least = attackers & bitboards[color][name]
+            if least:
+                break
+        gains.append(attacker_value - gains[-1])
+        if max(-gains[-2], gains[-1]) < 0:
+            # the capture cannot change the outcome, neither side profits from continuing
+            gains.pop()
+            break
+        occupied ^= least & -least
+        attacker_value = EXCHANGE_VALUE[name]
+        color = Color.BLACK if color == Color.WHITE else Color.WHITE
+
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+    return gains[0]
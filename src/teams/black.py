@@ -50,6 +50,3 @@ class Black(Team):
             PieceName.KING: set([King(Color.BLACK, BLACK_KING_E8)]),
         }
     )
-
-    def __post_init__(self) -> None:
-        super().__init__(self.color, self.pieces)
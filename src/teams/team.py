@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, Literal, Set, Tuple
+from typing import Dict, Literal, Set, Tuple, ValuesView
 
 from src.constants import Color, PieceName
 from src.pieces.king import King
@@ -8,7 +8,12 @@ from src.pieces.piece import Piece
 
 @dataclass
 class Team:
-    """Chess Team Base Class"""
+    """Chess Team Base Class
+
+    Besides the per-type piece sets, the team keeps an index of its pieces keyed by piece id
+    so membership tests, additions, removals and iteration over all pieces are O(1) per piece
+    and never rebuild a collection.
+    """
 
     color: Literal[Color.BLACK, Color.WHITE]
     pieces: Dict[PieceName, Set[Piece]] = field(
@@ -21,21 +26,45 @@ class Team:
             PieceName.KING: set(),
         }
     )
+    _index: Dict[int, Piece] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._index = {
+            piece.piece_id: piece
+            for pieces_set in self.pieces.values()
+            for piece in pieces_set
+        }
 
     def remove_piece(self, piece: Piece) -> None:
+        """Remove a chess piece from the team.
+
+        Args:
+            piece (Piece): The chess piece.
+        """
         self.pieces[piece.name].remove(piece)
+        del self._index[piece.piece_id]
+
+    def has_piece(self, piece: Piece) -> bool:
+        """Return whether the chess piece belongs to the team.
 
-    def get_all_pieces(self) -> Set[Piece]:
+        Args:
+            piece (Piece): The chess piece.
+
+        Returns:
+            bool: True if the piece is on the team. Otherwise, False.
+        """
+        return piece.piece_id in self._index
+
+    def get_all_pieces(self) -> ValuesView[Piece]:
         """Get all chess pieces on the same team.
 
+        The returned view is live: it reflects later additions and removals and must not be
+        iterated while pieces are added to or removed from the team.
+
         Returns:
-            Set[Piece]: The set of chess pieces.
+            ValuesView[Piece]: A view of the chess pieces.
         """
-        pieces = set()
-        for pieces_set in self.pieces.values():
-            for piece in pieces_set:
-                pieces.add(piece)
-        return pieces
+        return self._index.values()
 
     def get_king(self) -> King:
         """Get the king.
@@ -43,9 +72,8 @@ class Team:
         Returns:
             King: The king piece.
         """
-        king = self.pieces.get(PieceName.KING).pop()
-        self.pieces.get(PieceName.KING).add(king)
-        return king
+        for king in self.pieces[PieceName.KING]:
+            return king
 
     def get_piece(self, coordinates: Tuple[int, int]) -> Piece:
         """Get piece by its coordinates.
@@ -78,6 +106,7 @@ class Team:
             pieces (Dict[PieceName, Set[Piece]]): The pieces dictionary of all the chess pieces on a given team.
         """
         self.pieces = pieces
+        self.__post_init__()
 
     def add_piece(self, piece: Piece) -> None:
         """Add a chess piece to the pieces dictionary.
@@ -86,6 +115,7 @@ class Team:
             piece (Piece): The chess piece.
         """
         self.pieces[piece.name].add(piece)
+        self._index[piece.piece_id] = piece
 
     def get_moves(self) -> Set[Tuple[Piece, Tuple[int, int]]]:
         """Get all the valid moves for the given team.
@@ -53,6 +53,3 @@ class White(Team):
             PieceName.KING: set([King(Color.WHITE, WHITE_KING_E1)]),
         }
     )
-
-    def __post_init__(self) -> None:
-        super().__init__(self.color, self.pieces)
@@ -0,0 +1,135 @@
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from src.move import Move, decode_move, encode_move
+
+"""Bound types of a stored score"""
+EXACT = 1
+LOWER_BOUND = 2
+UPPER_BOUND = 3
+
+"""Size of an entry in bytes (64-bit key and 64-bit packed data)"""
+ENTRY_SIZE = 16
+
+"""Entries per bucket (a depth-preferred slot followed by an always-replace slot)"""
+BUCKET_ENTRIES = 2
+
+"""Number of search generations before the age wraps around"""
+GENERATIONS = 64
+
+# layout of the packed data word
+_SCORE_OFFSET = 1 << 15
+_DEPTH_SHIFT = 16
+_BOUND_SHIFT = 24
+_GENERATION_SHIFT = 26
+_MOVE_SHIFT = 32
+
+
+@dataclass
+class TranspositionTable:
+    """Transposition Table
+
+    A fixed-size hash table of search results keyed by Zobrist hash. Entries live in a flat
+    buffer of unsigned 64-bit words, two words per entry (key, packed data) and two entries
+    per bucket, so there is no per-entry Python object. The packed data word holds the score
+    (16 bits), depth (8 bits), bound type (2 bits), search generation (6 bits) and best
+    move (16 bits).
+
+    The first slot of a bucket keeps the deepest entry of the current search while the second
+    slot is always replaced. Entries left over from previous searches are replaced first.
+
+    The key word holds the key XORed with the data word, so an entry torn by two processes
+    writing the same slot of a shared buffer at once no longer matches its key and is ignored.
+    """
+
+    size_mb: int = 16
+    buffer: memoryview = field(default=None, repr=False)
+    _generation: int = 0
+
+    def __post_init__(self) -> None:
+        """Post initialization."""
+        if self.buffer is None:
+            self.buffer = memoryview(bytearray(self.size_mb * 1024 * 1024))
+        self._bytes = self.buffer.cast("B")
+        self._table = self._bytes.cast("Q")
+        self._num_buckets = len(self._table) // (2 * BUCKET_ENTRIES)
+
+    def new_search(self) -> None:
+        """Age every stored entry by starting a new search generation."""
+        self._generation = (self._generation + 1) % GENERATIONS
+
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        zeros = bytes(min(len(self._bytes), 1024 * 1024))
+        for start in range(0, len(self._bytes), len(zeros)):
+            end = min(start + len(zeros), len(self._bytes))
+            self._bytes[start:end] = zeros[: end - start]
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, Move]]:
+        """Look up the search result of a position.
+
+        Args:
+            key (int): The Zobrist hash of the position.
+
+        Returns:
+            Optional[Tuple[int, int, int, Move]]: The depth, score, bound type and best move
+                (None if no move was stored) of the position. None if the position is not stored.
+        """
+        table = self._table
+        index = key % self._num_buckets * 2 * BUCKET_ENTRIES
+        for slot in range(index, index + 2 * BUCKET_ENTRIES, 2):
+            data = table[slot + 1]
+            if data and table[slot] ^ data == key:
+                move = data >> _MOVE_SHIFT
+                return (
+                    data >> _DEPTH_SHIFT & 0xFF,
+                    (data & 0xFFFF) - _SCORE_OFFSET,
+                    data >> _BOUND_SHIFT & 0x3,
+                    decode_move(move) if move else None,
+                )
+        return None
+
+    def store(self, key: int, depth: int, score: int, bound: int, move: Move) -> None:
+        """Store the search result of a position.
+
+        Args:
+            key (int): The Zobrist hash of the position.
+            depth (int): The depth the position was searched to.
+            score (int): The score of the position.
+            bound (int): The bound type of the score (EXACT, LOWER_BOUND or UPPER_BOUND).
+            move (Move): The best move of the position. None if there is no best move.
+        """
+        table = self._table
+        index = key % self._num_buckets * 2 * BUCKET_ENTRIES
+        data = (
+            (encode_move(move) if move else 0) << _MOVE_SHIFT
+            | self._generation << _GENERATION_SHIFT
+            | bound << _BOUND_SHIFT
+            | depth << _DEPTH_SHIFT
+            | score + _SCORE_OFFSET
+        )
+
+        preferred = table[index + 1]
+        if (
+            not preferred
+            or table[index] ^ preferred == key
+            or preferred >> _GENERATION_SHIFT & 0x3F != self._generation
+            or depth >= preferred >> _DEPTH_SHIFT & 0xFF
+        ):
+            table[index], table[index + 1] = key ^ data, data
+        else:
+            table[index + 2], table[index + 3] = key ^ data, data
+
+    def hashfull(self) -> int:
+        """Estimate how full the table is from a sample of its first buckets.
+
+        Returns:
+            int: The permille of sampled entries that belong to the current search.
+        """
+        sample = min(1000, self._num_buckets * BUCKET_ENTRIES)
+        used = 0
+        for slot in range(1, 2 * sample, 2):
+            data = self._table[slot]
+            if data and data >> _GENERATION_SHIFT & 0x3F == self._generation:
+                used += 1
+        return used * 1000 // sample
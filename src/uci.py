@@ -0,0 +1,417 @@
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, TextIO
+
+from src.chess_engine import ChessEngine
+from src.constants import PIECES, START_FEN, Color
+from src.exceptions import InvalidBookFile, InvalidFen, InvalidUciMove
+from src.move import Move
+from src.move_ordering import MoveOrdering
+from src.opening_book import OpeningBook
+from src.search import MATE_SCORE, MAX_DEPTH, Search
+from src.transposition_table import TranspositionTable
+from src.utils.utils import convert_coordinates, format_coordinates
+
+"""Name reported to the GUI"""
+ENGINE_NAME = "chess-ai"
+
+"""Author reported to the GUI"""
+ENGINE_AUTHOR = "jwallace145"
+
+"""Default, minimum and maximum size of the transposition table in megabytes"""
+HASH_MB = (16, 1, 1024)
+
+"""Moves left in the game assumed when the GUI does not send movestogo"""
+DEFAULT_MOVES_TO_GO = 30
+
+"""Milliseconds kept in reserve for the communication with the GUI"""
+MOVE_OVERHEAD_MS = 50
+
+"""Keywords of the go command, searchmoves ends at the first of them"""
+GO_KEYWORDS = {
+    "searchmoves",
+    "ponder",
+    "wtime",
+    "btime",
+    "winc",
+    "binc",
+    "movestogo",
+    "depth",
+    "nodes",
+    "mate",
+    "movetime",
+    "infinite",
+}
+
+
+def parse_uci_move(engine: ChessEngine, text: str) -> Move:
+    """Convert a move in UCI notation e.g. e7e8q to a legal move of the current position.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+        text (str): The move in UCI notation.
+
+    Raises:
+        InvalidUciMove: Raises InvalidUciMove if the text is not a legal move.
+
+    Returns:
+        Move: The move.
+    """
+    if len(text) not in (4, 5) or (len(text) == 5 and text[4].lower() not in PIECES):
+        raise InvalidUciMove(text)
+    try:
+        src, dest = convert_coordinates(text[:2]), convert_coordinates(text[2:4])
+    except Exception:
+        raise InvalidUciMove(text)
+    promotion = PIECES[text[4].lower()] if len(text) == 5 else None
+    move = Move(src, dest, promotion)
+    if move not in engine.generate_moves():
+        raise InvalidUciMove(text)
+    return move
+
+
+def format_uci_move(move: Move) -> str:
+    """Convert a move to UCI notation e.g. e7e8q.
+
+    Args:
+        move (Move): The move.
+
+    Returns:
+        str: The move in UCI notation.
+    """
+    promotion = ""
+    if move.promotion is not None:
+        promotion = next(key for key, name in PIECES.items() if name == move.promotion)
+    return format_coordinates(move.src) + format_coordinates(move.dest) + promotion
+
+
+def format_score(score: int) -> str:
+    """Convert a search score to the score of a UCI info line.
+
+    Args:
+        score (int): The score in centipawns from the point of view of the team to move.
+
+    Returns:
+        str: "cp <centipawns>" or "mate <moves>", negative if the team to move is mated.
+    """
+    if score >= MATE_SCORE - MAX_DEPTH:
+        return f"mate {(MATE_SCORE - score + 1) // 2}"
+    if score <= -(MATE_SCORE - MAX_DEPTH):
+        return f"mate {-((MATE_SCORE + score + 1) // 2)}"
+    return f"cp {score}"
+
+
+def allocate_time(time_left: int, increment: int = 0, moves_to_go: int = None) -> float:
+    """Allocate the time budget of a move from the clock of the team to move.
+
+    Args:
+        time_left (int): The time left on the clock in milliseconds.
+        increment (int, optional): The increment per move in milliseconds. Defaults to 0.
+        moves_to_go (int, optional): The moves left until the next time control. Defaults to
+            None (DEFAULT_MOVES_TO_GO).
+
+    Returns:
+        float: The time budget in seconds.
+    """
+    available = max(time_left - MOVE_OVERHEAD_MS, 1)
+    budget = available / (moves_to_go or DEFAULT_MOVES_TO_GO) + increment * 3 // 4
+    return min(budget, available / 2 if moves_to_go != 1 else available) / 1000
+
+
+@dataclass
+class UciEngine:
+    """UCI Engine
+
+    Speaks the Universal Chess Interface on a pair of text streams, stdin and stdout by
+    default. Searches run on a background thread so commands are read and answered while the
+    engine is thinking, info lines are written after every completed iteration and stop ends
+    the search within a few nodes.
+
+    With go infinite or go ponder the bestmove is held back until stop or ponderhit arrives,
+    as the protocol requires. On ponderhit the time budget of the go command starts to run.
+    Otherwise, when the position is in the opening book set with the BookFile option, a book
+    move is played without searching.
+    """
+
+    input: TextIO = field(default=sys.stdin, repr=False)
+    output: TextIO = field(default=sys.stdout, repr=False)
+    engine: ChessEngine = field(default_factory=ChessEngine)
+    book: OpeningBook = field(default=None, repr=False)
+    search: Search = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _stop: threading.Event = field(default_factory=threading.Event, repr=False)
+    _release: threading.Event = field(default_factory=threading.Event, repr=False)
+    _thread: threading.Thread = field(default=None, repr=False)
+    _timer: threading.Timer = field(default=None, repr=False)
+    _ponder_time: float = field(default=None, repr=False)
+    _start: float = field(default=0.0, repr=False)
+
+    def __post_init__(self) -> None:
+        """Post initialization."""
+        self.search = Search(
+            self.engine,
+            table=TranspositionTable(size_mb=HASH_MB[0]),
+            stop_event=self._stop,
+            on_iteration=self._send_info,
+        )
+
+    def run(self) -> None:
+        """Read and execute commands until quit or the end of the input."""
+        for line in self.input:
+            if not self.execute(line):
+                break
+        self._stop_search()
+
+    def execute(self, line: str) -> bool:
+        """Execute a single command.
+
+        Args:
+            line (str): The command line.
+
+        Returns:
+            bool: False if the command is quit. Otherwise, True.
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+        if command == "quit":
+            return False
+        if command == "uci":
+            self._send(f"id name {ENGINE_NAME}")
+            self._send(f"id author {ENGINE_AUTHOR}")
+            default, low, high = HASH_MB
+            self._send(
+                f"option name Hash type spin default {default} min {low} max {high}"
+            )
+            self._send("option name BookFile type string default <empty>")
+            self._send("uciok")
+        elif command == "isready":
+            self._send("readyok")
+        elif command == "ucinewgame":
+            self._stop_search()
+            self.search.table.clear()
+            self.search.ordering = MoveOrdering()
+        elif command == "setoption":
+            self._set_option(args)
+        elif command == "position":
+            self._set_position(args)
+        elif command == "go":
+            self._go(args)
+        elif command == "stop":
+            self._stop_search()
+        elif command == "ponderhit":
+            self._ponderhit()
+        return True
+
+    def _set_option(self, args: List[str]) -> None:
+        """Execute setoption name <name> value <value>.
+
+        Args:
+            args (List[str]): The arguments of the command.
+        """
+        if "name" not in args or "value" not in args:
+            return
+        name = " ".join(args[args.index("name") + 1 : args.index("value")])
+        value = " ".join(args[args.index("value") + 1 :])
+        if name.lower() == "hash" and value.isdigit():
+            self._stop_search()
+            low, high = HASH_MB[1:]
+            size_mb = min(max(int(value), low), high)
+            self.search.table = TranspositionTable(size_mb=size_mb)
+        elif name.lower() == "bookfile":
+            if self.book is not None:
+                self.book.close()
+                self.book = None
+            if value and value != "<empty>":
+                try:
+                    self.book = OpeningBook(value)
+                except (OSError, InvalidBookFile) as error:
+                    self._send(f"info string {error}")
+
+    def _set_position(self, args: List[str]) -> None:
+        """Execute position [startpos | fen <fen>] moves <move1> ... <moveN>.
+
+        An invalid FEN string is reported and the previous position is kept. An illegal move
+        is reported and the moves before it are kept.
+
+        Args:
+            args (List[str]): The arguments of the command.
+        """
+        self._stop_search()
+        moves = args.index("moves") if "moves" in args else len(args)
+        fen = " ".join(args[1:moves]) if args and args[0] == "fen" else START_FEN
+        try:
+            self.engine.set_fen(fen)
+        except InvalidFen as error:
+            # set_fen leaves the previous position unchanged
+            self._send(f"info string {error}")
+            return
+        for text in args[moves + 1 :]:
+            try:
+                self.engine.make_move(parse_uci_move(self.engine, text))
+            except InvalidUciMove as error:
+                self._send(f"info string {error}")
+                break
+
+    def _go(self, args: List[str]) -> None:
+        """Execute go and start searching on the background thread.
+
+        Args:
+            args (List[str]): The arguments of the command.
+        """
+        self._stop_search()
+        options = _parse_go(args)
+        if self.book is not None and not options.keys() & {
+            "ponder",
+            "infinite",
+            "searchmoves",
+        }:
+            # a book move is answered at once, without spending any of the time budget
+            book_move = self.book.choose_move(self.engine)
+            if book_move is not None:
+                self._send(f"bestmove {format_uci_move(book_move)}")
+                return
+
+        root_moves = []
+        for text in options.get("searchmoves", []):
+            try:
+                root_moves.append(parse_uci_move(self.engine, text))
+            except InvalidUciMove:
+                pass
+
+        time_limit = None
+        if "movetime" in options:
+            time_limit = max(options["movetime"] - MOVE_OVERHEAD_MS, 1) / 1000
+        else:
+            white = self.engine.get_turn() == Color.WHITE
+            time_left = options.get("wtime" if white else "btime")
+            if time_left is not None:
+                time_limit = allocate_time(
+                    time_left,
+                    options.get("winc" if white else "binc", 0),
+                    options.get("movestogo"),
+                )
+
+        self._stop.clear()
+        self._release.clear()
+        self._ponder_time = None
+        if "ponder" in options:
+            # the clock starts on ponderhit, until then the search is unlimited
+            self._ponder_time, time_limit = time_limit, None
+        elif "infinite" not in options:
+            self._release.set()
+
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._search,
+            args=(options.get("depth"), time_limit, root_moves or None),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _search(self, depth: int, time_limit: float, root_moves: List[Move]) -> None:
+        """Search the current position and send the best move, run on the background thread.
+
+        Args:
+            depth (int): The maximum search depth in plies.
+            time_limit (float): The time budget in seconds.
+            root_moves (List[Move]): The root moves to search.
+        """
+        best_move, _, pv = self.search.search(depth, time_limit, root_moves)
+        # infinite and ponder searches wait for stop or ponderhit before answering
+        self._release.wait()
+        if best_move is None:
+            self._send("bestmove 0000")
+        elif len(pv) > 1:
+            self._send(
+                f"bestmove {format_uci_move(best_move)} ponder {format_uci_move(pv[1])}"
+            )
+        else:
+            self._send(f"bestmove {format_uci_move(best_move)}")
+
+    def _ponderhit(self) -> None:
+        """Execute ponderhit, the opponent played the expected move so the clock starts."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        if self._ponder_time is not None:
+            self._timer = threading.Timer(self._ponder_time, self._stop.set)
+            self._timer.daemon = True
+            self._timer.start()
+        self._release.set()
+
+    def _stop_search(self) -> None:
+        """Stop the running search and wait for it to send its best move."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._thread is not None:
+            self._stop.set()
+            self._release.set()
+            self._thread.join()
+            self._thread = None
+
+    def _send_info(self, depth: int, score: int, pv: List[Move]) -> None:
+        """Send the info line of a completed search iteration.
+
+        Args:
+            depth (int): The depth of the iteration in plies.
+            score (int): The score from the point of view of the team to move.
+            pv (List[Move]): The principal variation.
+        """
+        elapsed = time.perf_counter() - self._start
+        nodes = self.search.nodes
+        nps = int(nodes / elapsed) if elapsed else 0
+        self._send(
+            f"info depth {depth} score {format_score(score)} nodes {nodes} nps {nps} "
+            f"time {int(elapsed * 1000)} hashfull {self.search.table.hashfull()} "
+            f"pv {' '.join(format_uci_move(move) for move in pv)}".rstrip()
+        )
+
+    def _send(self, line: str) -> None:
+        """Write a line to the GUI, one line at a time from any thread.
+
+        Args:
+            line (str): The line.
+        """
+        with self._lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+
+def _parse_go(args: List[str]) -> Dict[str, object]:
+    """Parse the arguments of the go command.
+
+    Args:
+        args (List[str]): The arguments of the command.
+
+    Returns:
+        Dict[str, object]: The numeric options as integers, searchmoves as a list of moves in
+            UCI notation and ponder and infinite as True.
+    """
+    options = {}
+    index = 0
+    while index < len(args):
+        keyword = args[index]
+        index += 1
+        if keyword in ("ponder", "infinite"):
+            options[keyword] = True
+        elif keyword == "searchmoves":
+            moves = []
+            while index < len(args) and args[index] not in GO_KEYWORDS:
+                moves.append(args[index])
+                index += 1
+            options[keyword] = moves
+        elif keyword in GO_KEYWORDS and index < len(args):
+            try:
+                options[keyword] = int(args[index])
+            except ValueError:
+                pass
+            index += 1
+    return options
+
+
+if __name__ == "__main__":
+    UciEngine().run()
@@ -0,0 +1,24 @@
+import argparse
+
+from src.opening_book import BOOK_PLIES, build_book
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build an opening book from PGN files")
+    parser.add_argument("pgn", nargs="+", help="PGN files")
+    parser.add_argument("--output", required=True, help="book file")
+    parser.add_argument(
+        "--plies", type=int, default=BOOK_PLIES, help="plies of each game"
+    )
+    parser.add_argument(
+        "--min-count", type=int, default=1, help="games a move must be played in"
+    )
+    args = parser.parse_args()
+
+    with open(args.output, "wb") as output:
+        entries = build_book(args.pgn, output, args.plies, args.min_count)
+    print(f"{entries} entries written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,13 @@
 from dataclasses import dataclass, field
 
 from src.board import Board
-from src.chess_engine import ChessEngine
+from src.chess_engine import PIECE_CONSTRUCTORS, ChessEngine
 from src.constants import NUM_OF_COLS, NUM_OF_ROWS, Color
-from src.pieces.bishop import Bishop
-from src.pieces.king import King
-from src.pieces.knight import Knight
-from src.pieces.pawn import Pawn
-from src.pieces.queen import Queen
-from src.pieces.rook import Rook
 from src.teams.black import Black
 from src.teams.team import Team
 from src.teams.white import White
 from collections import defaultdict
 
-PIECE_CONSTRUCTORS = {
-    "p": Pawn,
-    "r": Rook,
-    "n": Knight,
-    "b": Bishop,
-    "q": Queen,
-    "k": King,
-}
-
 
 @dataclass
 class ChessBoardReader:
@@ -64,8 +49,6 @@ class ChessBoardReader:
                 if square != "--":
                     team, piece = square
                     if team == Color.BLACK.value:
-                        if team + piece == "BQ":
-                            print("black queen")
                         self._black.add_piece(
                             PIECE_CONSTRUCTORS[piece.lower()](Color.BLACK, (row, col)),
                         )
@@ -74,6 +57,8 @@ class ChessBoardReader:
                             PIECE_CONSTRUCTORS[piece.lower()](Color.WHITE, (row, col)),
                         )
 
-        chess_engine = ChessEngine(Board(), self._black, self._white)
+        chess_engine = ChessEngine(
+            Board(), self._black, self._white, _turn=current_team
+        )
 
         return chess_engine
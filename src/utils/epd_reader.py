@@ -0,0 +1,123 @@
+import mmap
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple
+
+from src.chess_engine import ChessEngine
+
+
+@dataclass
+class EpdRecord:
+    """EPD Record
+
+    The position of an EPD (or FEN) line as a FEN string together with the line's operations,
+    e.g. {"bm": ["Nf3"], "id": ["WAC.001"]}.
+    """
+
+    fen: str
+    operations: Dict[str, List[str]] = field(default_factory=dict)
+
+
+@dataclass
+class EpdReader:
+    """Streaming EPD/FEN Reader
+
+    Reads an EPD or FEN file through a read-only memory map and parses one line at a time, so
+    memory use does not depend on the size of the file.
+    """
+
+    file_path: str
+
+    def read_records(self) -> Iterator[EpdRecord]:
+        """Lazily read the records of the file.
+
+        Yields:
+            EpdRecord: The record of each non-empty, non-comment line.
+        """
+        with open(self.file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for line in iter(data.readline, b""):
+                    line = line.strip()
+                    if line and not line.startswith(b"#"):
+                        yield parse_epd(line.decode("utf-8", errors="replace"))
+
+    def read_positions(
+        self, chess_engine: ChessEngine = None
+    ) -> Iterator[Tuple[ChessEngine, EpdRecord]]:
+        """Lazily load the positions of the file into a single reused chess engine.
+
+        The same chess engine is yielded for every record, so it must not be kept across
+        iterations.
+
+        Args:
+            chess_engine (ChessEngine, optional): The chess engine to load positions into.
+                Defaults to None (a new chess engine).
+
+        Yields:
+            Tuple[ChessEngine, EpdRecord]: The chess engine set to each position and its record.
+        """
+        for record in self.read_records():
+            if chess_engine is None:
+                chess_engine = ChessEngine.from_fen(record.fen)
+            else:
+                chess_engine.set_fen(record.fen)
+            yield chess_engine, record
+
+
+def parse_epd(line: str) -> EpdRecord:
+    """Parse an EPD line or a FEN line.
+
+    An EPD line holds the four position fields followed by semicolon terminated operations.
+    The halfmove clock and fullmove number come from the hmvc and fmvn operations or, for a
+    FEN line, from the fifth and sixth fields.
+
+    Args:
+        line (str): The EPD or FEN line.
+
+    Returns:
+        EpdRecord: The parsed record.
+    """
+    fields = line.split(None, 4)
+    rest = fields[4] if len(fields) > 4 else ""
+
+    halfmove_clock, fullmove_number = "0", "1"
+    counters = rest.split(None, 2)
+    if len(counters) >= 2 and counters[0].isdigit() and counters[1].isdigit():
+        halfmove_clock, fullmove_number = counters[:2]
+        rest = counters[2] if len(counters) > 2 else ""
+
+    operations = _parse_operations(rest)
+    halfmove_clock = operations.get("hmvc", [halfmove_clock])[0]
+    fullmove_number = operations.get("fmvn", [fullmove_number])[0]
+    fen = " ".join(fields[:4] + [halfmove_clock, fullmove_number])
+    return EpdRecord(fen, operations)
+
+
+def _parse_operations(text: str) -> Dict[str, List[str]]:
+    """Parse semicolon terminated EPD operations, keeping quoted operands whole.
+
+    Args:
+        text (str): The operations part of an EPD line.
+
+    Returns:
+        Dict[str, List[str]]: The operands of each opcode.
+    """
+    operations = {}
+    tokens, token, quoted = [], "", False
+    for char in text + ";":
+        if char == '"':
+            quoted = not quoted
+        elif quoted:
+            token += char
+        elif char.isspace() or char == ";":
+            if token:
+                tokens.append(token)
+                token = ""
+            if char == ";" and tokens:
+                operations[tokens[0]] = tokens[1:]
+                tokens = []
+        else:
+            token += char
+    return operations
@@ -0,0 +1,64 @@
+import argparse
+
+from src.match import EngineConfig, Match
+from src.utils.epd_reader import EpdReader
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Engine versus engine match")
+    parser.add_argument("--games", type=int, default=100, help="number of games")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--openings", help="EPD or FEN file of opening positions")
+    parser.add_argument("--pgn", help="PGN file the games are written to")
+    parser.add_argument(
+        "--max-plies", type=int, default=300, help="ply limit of a game"
+    )
+    for side in ("first", "second"):
+        parser.add_argument(f"--{side}-name", default=side, help=f"{side} engine name")
+        parser.add_argument(
+            f"--{side}-depth", type=int, default=None, help=f"{side} engine depth"
+        )
+        parser.add_argument(
+            f"--{side}-time",
+            type=float,
+            default=0.1,
+            help=f"{side} engine seconds per move",
+        )
+        parser.add_argument(f"--{side}-nnue", help=f"{side} engine NNUE weights file")
+    args = parser.parse_args()
+
+    configs = [
+        EngineConfig(
+            getattr(args, f"{side}_name"),
+            depth=getattr(args, f"{side}_depth"),
+            move_time=getattr(args, f"{side}_time"),
+            nnue_weights=getattr(args, f"{side}_nnue"),
+        )
+        for side in ("first", "second")
+    ]
+    match = Match(*configs, games=args.games, max_plies=args.max_plies)
+    if args.workers:
+        match.workers = args.workers
+    if args.openings:
+        match.openings = [
+            record.fen for record in EpdReader(args.openings).read_records()
+        ]
+
+    output = open(args.pgn, "w") if args.pgn else None
+    try:
+        result = match.play(output)
+    finally:
+        if output is not None:
+            output.close()
+
+    elo, margin = result.elo()
+    print(
+        f"{result.first} vs {result.second}: +{result.wins} -{result.losses} "
+        f"={result.draws}  score {result.score:.3f}  elo {elo:+.1f} +/- {margin:.1f}"
+    )
+    for name in (result.first, result.second):
+        print(f"  {name:<12} {result.nodes_per_second(name):>10.0f} nps")
+
+
+if __name__ == "__main__":
+    main()
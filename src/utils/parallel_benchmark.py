@@ -0,0 +1,40 @@
+import argparse
+
+from src.constants import START_FEN
+from src.parallel_search import LAZY_SMP, ROOT_SPLIT, ParallelResult, ParallelSearch
+
+
+def _print_result(name: str, result: ParallelResult) -> None:
+    print(
+        f"{name:<12} best {result.best_move}  score {result.score:>6}  "
+        f"{result.seconds:8.2f}s  {result.nodes_per_second:>10.0f} nps"
+    )
+    for worker in result.workers:
+        print(
+            f"  worker {worker.worker:<3} depth {worker.depth:>3}  nodes {worker.nodes:>10}  "
+            f"{worker.nodes_per_second:>10.0f} nps"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Parallel search speedup benchmark")
+    parser.add_argument("--fen", default=START_FEN, help="position to search")
+    parser.add_argument("--depth", type=int, default=4, help="search depth")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument(
+        "--mode", choices=[LAZY_SMP, ROOT_SPLIT], default=LAZY_SMP, help="search mode"
+    )
+    args = parser.parse_args()
+
+    baseline = ParallelSearch(workers=1, mode=args.mode).search(args.fen, args.depth)
+    _print_result("1 worker", baseline)
+    parallel = ParallelSearch(mode=args.mode)
+    if args.workers:
+        parallel.workers = args.workers
+    result = parallel.search(args.fen, args.depth)
+    _print_result(f"{parallel.workers} workers", result)
+    print(f"speedup {baseline.seconds / result.seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
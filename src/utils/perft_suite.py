@@ -0,0 +1,110 @@
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+from src.chess_engine import ChessEngine
+from src.constants import START_FEN
+
+
+@dataclass
+class PerftPosition:
+    """Perft Reference Position"""
+
+    name: str
+    fen: str
+    nodes: Dict[int, int]
+
+
+@dataclass
+class PerftResult:
+    """Perft Benchmark Result"""
+
+    name: str
+    depth: int
+    nodes: int
+    expected: int
+    seconds: float
+
+    @property
+    def passed(self) -> bool:
+        return self.nodes == self.expected
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else float("inf")
+
+
+"""Reference positions with their known leaf node counts by depth"""
+PERFT_POSITIONS = [
+    PerftPosition(
+        name="start position",
+        fen=START_FEN,
+        nodes={1: 20, 2: 400, 3: 8902, 4: 197281},
+    ),
+    PerftPosition(
+        name="kiwipete",
+        fen="r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        nodes={1: 48, 2: 2039, 3: 97862},
+    ),
+    PerftPosition(
+        name="position 3",
+        fen="8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        nodes={1: 14, 2: 191, 3: 2812, 4: 43238},
+    ),
+    PerftPosition(
+        name="position 4",
+        fen="r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        nodes={1: 6, 2: 264, 3: 9467},
+    ),
+    PerftPosition(
+        name="position 5",
+        fen="rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+        nodes={1: 44, 2: 1486, 3: 62379},
+    ),
+]
+
+
+def run_perft_suite(
+    max_depth: int, positions: List[PerftPosition] = PERFT_POSITIONS
+) -> List[PerftResult]:
+    """Run perft on the reference positions and time every depth.
+
+    Args:
+        max_depth (int): The maximum depth to run for each position.
+        positions (List[PerftPosition], optional): The reference positions. Defaults to PERFT_POSITIONS.
+
+    Returns:
+        List[PerftResult]: The result of every position and depth.
+    """
+    results = []
+    for position in positions:
+        chess_engine = ChessEngine.from_fen(position.fen)
+        for depth, expected in sorted(position.nodes.items()):
+            if depth > max_depth:
+                break
+            start = time.perf_counter()
+            nodes = chess_engine.perft(depth)
+            seconds = time.perf_counter() - start
+            results.append(PerftResult(position.name, depth, nodes, expected, seconds))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Perft move generation benchmark")
+    parser.add_argument("--depth", type=int, default=3, help="maximum perft depth")
+    args = parser.parse_args()
+
+    failed = 0
+    for result in run_perft_suite(args.depth):
+        status = "ok" if result.passed else f"FAILED (expected {result.expected})"
+        print(
+            f"{result.name:<20} depth {result.depth}  nodes {result.nodes:>10}  "
+            f"{result.seconds:8.2f}s  {result.nodes_per_second:>10.0f} nps  {status}"
+        )
+        failed += not result.passed
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
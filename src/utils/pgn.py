@@ -0,0 +1,341 @@
+import mmap
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, TextIO, Tuple
+
+from src.chess_engine import ChessEngine
+from src.constants import COLUMNS, NUM_OF_ROWS, START_FEN, Color, PieceName
+from src.exceptions import InvalidSan
+from src.move import Move
+from src.utils.utils import convert_coordinates, format_coordinates
+
+"""Tags written first and in this order, the PGN seven tag roster"""
+SEVEN_TAG_ROSTER = ["Event", "Site", "Date", "Round", "White", "Black", "Result"]
+
+"""Maximum length of a movetext line"""
+LINE_LENGTH = 79
+
+"""Game termination markers"""
+RESULTS = {"1-0", "0-1", "1/2-1/2", "*"}
+
+"""Tag pair e.g. [White "Carlsen, Magnus"]"""
+TAG_PATTERN = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+
+"""Movetext tokens, comments and variations are delimited by single character tokens"""
+TOKEN_PATTERN = re.compile(r"[{}();]|[^\s{}();]+")
+
+"""Move number prefix of a movetext token e.g. 12. or 12..."""
+MOVE_NUMBER_PATTERN = re.compile(r"^\d+\.+")
+
+"""Standard algebraic notation of a move other than castling"""
+SAN_PATTERN = re.compile(
+    r"^([NBRQK])?([a-h])?([1-8])?x?([a-h][1-8])(?:=?([NBRQnbrq]))?$"
+)
+
+
+@dataclass
+class PgnGame:
+    """PGN Game
+
+    The tag pairs of a game and its moves, played from the FEN tag position or the start
+    position.
+    """
+
+    headers: Dict[str, str] = field(default_factory=dict)
+    moves: List[Move] = field(default_factory=list)
+
+    @property
+    def fen(self) -> str:
+        return self.headers.get("FEN", START_FEN)
+
+    @property
+    def result(self) -> str:
+        return self.headers.get("Result", "*")
+
+
+def format_san(engine: ChessEngine, move: Move) -> str:
+    """Convert a legal move of the current position to standard algebraic notation e.g. Nbd7.
+
+    Args:
+        engine (ChessEngine): The chess engine, in the position the move is made from.
+        move (Move): The move.
+
+    Returns:
+        str: The move in standard algebraic notation.
+    """
+    piece = engine.get_piece(move.src)
+    if piece.name == PieceName.KING and abs(move.dest[1] - move.src[1]) == 2:
+        san = "O-O" if move.dest[1] > move.src[1] else "O-O-O"
+    else:
+        capture = engine.get_piece(move.dest) is not None
+        if piece.name == PieceName.PAWN:
+            capture = move.src[1] != move.dest[1]
+            san = format_coordinates(move.src)[0] if capture else ""
+        else:
+            san = piece.name.value + _disambiguation(engine, move)
+        san += ("x" if capture else "") + format_coordinates(move.dest)
+        if move.promotion is not None:
+            san += "=" + move.promotion.value
+
+    undo = engine.make_move(move)
+    if engine.is_check(engine.get_team(engine.get_turn())):
+        san += "+" if engine.generate_moves() else "#"
+    engine.unmake_move(undo)
+    return san
+
+
+def _disambiguation(engine: ChessEngine, move: Move) -> str:
+    """Get the src file, rank or square that tells a piece move apart from the same move of
+    another piece of the same kind.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+        move (Move): The move of a piece other than a pawn.
+
+    Returns:
+        str: The file, the rank, the square or an empty string if the move is unambiguous.
+    """
+    name = engine.get_piece(move.src).name
+    others = [
+        other.src
+        for other in engine.generate_moves()
+        if other.dest == move.dest
+        and other.src != move.src
+        and engine.get_piece(other.src).name == name
+    ]
+    if not others:
+        return ""
+    square = format_coordinates(move.src)
+    if all(src[1] != move.src[1] for src in others):
+        return square[0]
+    if all(src[0] != move.src[0] for src in others):
+        return square[1]
+    return square
+
+
+def write_game(output: TextIO, game: PgnGame, engine: ChessEngine = None) -> None:
+    """Write a game in PGN format.
+
+    The moves are replayed on the chess engine to convert them to standard algebraic notation.
+
+    Args:
+        output (TextIO): The text stream to write to.
+        game (PgnGame): The game.
+        engine (ChessEngine, optional): The chess engine to replay the moves on. Defaults to
+            None (a new chess engine).
+    """
+    engine = _set_position(engine, game.fen)
+    headers = {tag: game.headers.get(tag, "?") for tag in SEVEN_TAG_ROSTER}
+    headers["Result"] = game.result
+    headers.update(game.headers)
+    for tag, value in headers.items():
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        output.write(f'[{tag} "{escaped}"]\n')
+    output.write("\n")
+
+    tokens = []
+    for index, move in enumerate(game.moves):
+        san = format_san(engine, move)
+        # a move number is kept on the same line as its move
+        if engine.get_turn() == Color.WHITE:
+            san = f"{engine.get_fullmove_number()}. {san}"
+        elif index == 0:
+            san = f"{engine.get_fullmove_number()}... {san}"
+        tokens.append(san)
+        engine.make_move(move)
+    tokens.append(game.result)
+
+    line = ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > LINE_LENGTH:
+            output.write(line + "\n")
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    output.write(line + "\n\n")
+
+
+def parse_san(engine: ChessEngine, san: str) -> Move:
+    """Convert a move in standard algebraic notation to a legal move of the current position.
+
+    Check, checkmate and annotation suffixes are ignored and castling may be written with
+    zeros. The move is resolved against the legal moves, so the disambiguation only has to
+    be as precise as the position requires.
+
+    Args:
+        engine (ChessEngine): The chess engine.
+        san (str): The move in standard algebraic notation e.g. Nbd7, exd5 or e8=Q+.
+
+    Raises:
+        InvalidSan: Raises InvalidSan if the text is not exactly one legal move.
+
+    Returns:
+        Move: The move.
+    """
+    text = san.rstrip("+#!?").replace("0", "O")
+    moves = engine.generate_moves()
+    if text in ("O-O", "O-O-O"):
+        king = engine.get_team(engine.get_turn()).get_king().coordinates
+        col = king[1] + (2 if text == "O-O" else -2)
+        candidates = [move for move in moves if move == Move(king, (king[0], col))]
+    else:
+        match = SAN_PATTERN.match(text)
+        if match is None:
+            raise InvalidSan(san, engine.to_fen())
+        name, file, rank, dest, promotion = match.groups()
+        name = PieceName(name) if name else PieceName.PAWN
+        dest = convert_coordinates(dest)
+        promotion = PieceName(promotion.upper()) if promotion else None
+        candidates = [
+            move
+            for move in moves
+            if move.dest == dest
+            and move.promotion == promotion
+            and engine.get_piece(move.src).name == name
+            and (file is None or move.src[1] == COLUMNS[file])
+            and (rank is None or move.src[0] == NUM_OF_ROWS - int(rank))
+        ]
+    if len(candidates) != 1:
+        raise InvalidSan(san, engine.to_fen())
+    return candidates[0]
+
+
+@dataclass
+class PgnReader:
+    """Streaming PGN Reader
+
+    Reads a PGN file through a read-only memory map one line at a time, so memory use depends
+    on the longest game rather than the size of the file. Comments, variations and numeric
+    annotation glyphs are skipped, only the tag pairs and the main line are read.
+    """
+
+    file_path: str
+
+    def read_movetext(self) -> Iterator[Tuple[Dict[str, str], List[str]]]:
+        """Lazily read the tag pairs and the main line moves of each game, without checking the
+        moves.
+
+        Yields:
+            Tuple[Dict[str, str], List[str]]: The tag pairs and the moves in standard algebraic
+                notation of each game.
+        """
+        headers, sans, in_movetext = {}, [], False
+        in_comment, depth = False, 0
+        for line in self._read_lines():
+            if not in_comment and depth == 0:
+                if line.startswith("%"):
+                    continue
+                if line.startswith("["):
+                    if in_movetext:
+                        # a game without a termination marker
+                        yield headers, sans
+                        headers, sans, in_movetext = {}, [], False
+                    match = TAG_PATTERN.match(line)
+                    if match:
+                        tag, value = match.groups()
+                        headers[tag] = re.sub(r"\\(.)", r"\1", value)
+                    continue
+
+            for token in TOKEN_PATTERN.findall(line):
+                if in_comment:
+                    in_comment = token != "}"
+                elif token == "{":
+                    in_comment = True
+                elif token == ";":
+                    break
+                elif token == "(":
+                    depth += 1
+                elif token == ")":
+                    depth = max(depth - 1, 0)
+                elif depth == 0 and not token.startswith("$"):
+                    in_movetext = True
+                    if token in RESULTS:
+                        headers.setdefault("Result", token)
+                        yield headers, sans
+                        headers, sans, in_movetext = {}, [], False
+                        continue
+                    token = MOVE_NUMBER_PATTERN.sub("", token)
+                    if token:
+                        sans.append(token)
+
+        if in_movetext or headers:
+            yield headers, sans
+
+    def read_games(self, chess_engine: ChessEngine = None) -> Iterator[PgnGame]:
+        """Lazily read the games of the file, resolving their moves on a single reused chess
+        engine.
+
+        Args:
+            chess_engine (ChessEngine, optional): The chess engine to replay the games on.
+                Defaults to None (a new chess engine).
+
+        Raises:
+            InvalidSan: Raises InvalidSan if a game contains an illegal move.
+
+        Yields:
+            PgnGame: Each game, the chess engine is left in its final position.
+        """
+        for headers, sans in self.read_movetext():
+            game = PgnGame(headers)
+            chess_engine = _set_position(chess_engine, game.fen)
+            for san in sans:
+                move = parse_san(chess_engine, san)
+                chess_engine.make_move(move)
+                game.moves.append(move)
+            yield game
+
+    def read_positions(
+        self, chess_engine: ChessEngine = None
+    ) -> Iterator[Tuple[ChessEngine, Dict[str, str], Move]]:
+        """Lazily replay the games of the file on a single reused chess engine.
+
+        The same chess engine is yielded for every move, so it must not be kept across
+        iterations. The move is made after the caller resumes the iteration.
+
+        Args:
+            chess_engine (ChessEngine, optional): The chess engine to replay the games on.
+                Defaults to None (a new chess engine).
+
+        Raises:
+            InvalidSan: Raises InvalidSan if a game contains an illegal move.
+
+        Yields:
+            Tuple[ChessEngine, Dict[str, str], Move]: The chess engine in the position before
+                each move, the tag pairs of the game and the move.
+        """
+        for headers, sans in self.read_movetext():
+            chess_engine = _set_position(chess_engine, headers.get("FEN", START_FEN))
+            for san in sans:
+                move = parse_san(chess_engine, san)
+                yield chess_engine, headers, move
+                chess_engine.make_move(move)
+
+    def _read_lines(self) -> Iterator[str]:
+        """Lazily read the stripped lines of the file.
+
+        Yields:
+            str: Each line.
+        """
+        with open(self.file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for line in iter(data.readline, b""):
+                    yield line.decode("utf-8", errors="replace").strip()
+
+
+def _set_position(chess_engine: ChessEngine, fen: str) -> ChessEngine:
+    """Set a chess engine to a position, creating the chess engine if there is none yet.
+
+    Args:
+        chess_engine (ChessEngine): The chess engine or None.
+        fen (str): The FEN string of the position.
+
+    Returns:
+        ChessEngine: The chess engine.
+    """
+    if chess_engine is None:
+        return ChessEngine.from_fen(fen)
+    chess_engine.set_fen(fen)
+    return chess_engine
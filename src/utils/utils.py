@@ -37,3 +37,16 @@ def convert_coordinates(coordinates: str) -> Tuple[int, int]:
     row = -1 * int(row) + NUM_OF_ROWS
 
     return (row, col)
+
+
+def format_coordinates(coordinates: Tuple[int, int]) -> str:
+    """Convert row, col coordinates e.g. (4, 4) to coordinates of syntax e.g. e4.
+
+    Args:
+        coordinates (Tuple[int, int]): The coordinates in row, col format.
+
+    Returns:
+        str: The coordinates in string format.
+    """
+    row, col = coordinates
+    return f"{'abcdefgh'[col]}{NUM_OF_ROWS - row}"
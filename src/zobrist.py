@@ -0,0 +1,95 @@
+import random
+from typing import Dict, List, Tuple
+
+from src.bitboard import NUM_OF_SQUARES, iter_squares
+from src.board import Board
+from src.constants import CASTLING, NUM_OF_COLS, Color, PieceName
+
+"""Seed of the Zobrist keys (fixed so position hashes are stable across processes and runs)"""
+ZOBRIST_SEED = 20211017
+
+_random = random.Random(ZOBRIST_SEED)
+
+"""Zobrist keys indexed by color, piece name and square index"""
+PIECE_KEYS: Dict[Color, Dict[PieceName, List[int]]] = {
+    color: {
+        name: [_random.getrandbits(64) for _ in range(NUM_OF_SQUARES)]
+        for name in PieceName
+    }
+    for color in Color
+}
+
+"""Zobrist key toggled when black is to move"""
+BLACK_TO_MOVE_KEY = _random.getrandbits(64)
+
+"""Zobrist keys indexed by castling rights bit flags"""
+CASTLING_KEYS: List[int] = [0] * (1 << len(CASTLING))
+for _bit in range(len(CASTLING)):
+    _key = _random.getrandbits(64)
+    for _rights in range(len(CASTLING_KEYS)):
+        if _rights >> _bit & 1:
+            CASTLING_KEYS[_rights] ^= _key
+
+"""Zobrist keys of the en passant square indexed by its column"""
+EN_PASSANT_KEYS: List[int] = [_random.getrandbits(64) for _ in range(NUM_OF_COLS)]
+
+
+def en_passant_key(board: Board, turn: Color, en_passant: Tuple[int, int]) -> int:
+    """Get the Zobrist key of the en passant square.
+
+    The key is only hashed in when a pawn of the team to move stands beside the pawn that can
+    be captured en passant, so positions reached with and without a double pawn step that no
+    pawn can capture hash the same.
+
+    Args:
+        board (Board): The chess board.
+        turn (Color): The color of the team to move.
+        en_passant (Tuple[int, int]): The en passant square. None if there is none.
+
+    Returns:
+        int: The en passant key of the column, or 0 if no pawn can capture en passant.
+    """
+    if en_passant is None:
+        return 0
+    row, col = en_passant
+    pawn_row = row + 1 if turn == Color.WHITE else row - 1
+    pawns = board.get_bitboard(turn, PieceName.PAWN)
+    for pawn_col in [col - 1, col + 1]:
+        if (
+            0 <= pawn_col < NUM_OF_COLS
+            and pawns >> (pawn_row * NUM_OF_COLS + pawn_col) & 1
+        ):
+            return EN_PASSANT_KEYS[col]
+    return 0
+
+
+def hash_position(
+    board: Board,
+    turn: Color,
+    castling_rights: int,
+    en_passant: Tuple[int, int] = None,
+) -> int:
+    """Compute the Zobrist hash of a position from scratch.
+
+    ChessEngine keeps its hash up to date incrementally. This method is used to set the
+    initial hash and to cross-check the incremental hash in debug mode.
+
+    Args:
+        board (Board): The chess board.
+        turn (Color): The color of the team to move.
+        castling_rights (int): The castling rights bit flags.
+        en_passant (Tuple[int, int], optional): The en passant square. Defaults to None.
+
+    Returns:
+        int: The 64-bit Zobrist hash of the position.
+    """
+    key = CASTLING_KEYS[castling_rights]
+    if turn == Color.BLACK:
+        key ^= BLACK_TO_MOVE_KEY
+    key ^= en_passant_key(board, turn, en_passant)
+    for color in Color:
+        for name in PieceName:
+            keys = PIECE_KEYS[color][name]
+            for square in iter_squares(board.get_bitboard(color, name)):
+                key ^= keys[square]
+    return key
@@ -414,8 +414,7 @@ def white_is_in_checkmate(context) -> None:
         context: The context of the given step
     """
     white: White = context.white
-    black: Black = context.black
     chess_engine: ChessEngine = context.chess_engine
 
-    assert chess_engine.is_check(white, black) is True
+    assert chess_engine.is_check(white) is True
     assert chess_engine.is_checkmate(white) is True
@@ -0,0 +1,39 @@
+from src.bitboard import to_square
+from src.chess_engine import ChessEngine
+from src.constants import Color
+
+# 1. e4 e5 2. Qh5 Nc6 3. Bc4 Nf6 4. Qxf7#
+SCHOLARS_MATE_FEN = "r1bqkb1r/pppp1Qpp/2n2n2/4p3/2B1P3/8/PPPP1PPP/RNB1K1NR b KQkq - 0 4"
+
+# the black knight on e7 is pinned by the rook on e1, 1. d4 Qa6+ checks the white king
+PIN_AND_CHECK_FEN = "4k3/4n3/8/q7/8/8/3P4/4RK2 w - - 0 1"
+
+
+def test_attack_map_counts_attackers() -> None:
+    chess_engine = ChessEngine()
+    attack_map = chess_engine.get_attack_map(Color.WHITE)
+    # f3 is attacked by the g1 knight and the e2 and g2 pawns
+    assert attack_map.count_attackers(to_square((5, 5))) == 3
+    assert not attack_map.is_attacked(to_square((4, 4)))
+
+
+def test_pins_and_checkers() -> None:
+    chess_engine = ChessEngine.from_fen(PIN_AND_CHECK_FEN, debug=True)
+    pins = chess_engine.get_pins(Color.BLACK)
+    assert list(pins) == [to_square((1, 4))]
+    assert pins[to_square((1, 4))] >> to_square((7, 4)) & 1
+
+    assert chess_engine.get_checkers(Color.WHITE) == 0
+    chess_engine.move((6, 3), (4, 3))
+    chess_engine.move((3, 0), (2, 0))
+    assert chess_engine.get_checkers(Color.WHITE) == 1 << to_square((2, 0))
+    assert chess_engine.is_check(chess_engine.get_team(Color.WHITE))
+    assert not chess_engine.is_checkmate(chess_engine.get_team(Color.WHITE))
+
+
+def test_scholars_mate_is_checkmate() -> None:
+    chess_engine = ChessEngine.from_fen(SCHOLARS_MATE_FEN)
+    black = chess_engine.get_team(Color.BLACK)
+    assert chess_engine.is_check(black)
+    assert chess_engine.is_checkmate(black)
+    assert not chess_engine.is_checkmate(chess_engine.get_team(Color.WHITE))
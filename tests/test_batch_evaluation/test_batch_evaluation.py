@@ -0,0 +1,52 @@
+import numpy as np
+
+from src.batch_evaluation import (
+    FEATURE_WEIGHTS,
+    BatchEvaluator,
+    encode_bitboards,
+    engine_bitboards,
+    fen_bitboards,
+)
+from src.chess_engine import ChessEngine
+from src.constants import Color
+from src.evaluation import MOBILITY_WEIGHTS
+from src.utils.perft_suite import PERFT_POSITIONS
+
+FENS = [position.fen for position in PERFT_POSITIONS]
+
+
+def test_fen_and_engine_bitboards_match() -> None:
+    engines = [ChessEngine.from_fen(fen) for fen in FENS]
+    fen_boards, fen_turns = fen_bitboards(FENS)
+    engine_boards, engine_turns = engine_bitboards(engines)
+    assert fen_boards.shape == (len(FENS), 12)
+    assert (fen_boards == engine_boards).all()
+    assert (fen_turns == engine_turns).all()
+
+
+def test_encoding_is_one_hot() -> None:
+    bitboards, _ = fen_bitboards(FENS[:1])
+    features = encode_bitboards(bitboards)
+    assert features.shape == (1, 768)
+    assert features.sum() == 32
+    # the white pawn plane holds the second row from the bottom
+    assert features.reshape(1, 12, 64)[0, 0, 48:56].all()
+
+
+def test_scores_match_engine_running_scores() -> None:
+    bitboards, _ = fen_bitboards(FENS)
+    scores = encode_bitboards(bitboards).astype(np.float32) @ FEATURE_WEIGHTS
+    for fen, row in zip(FENS, scores.astype(np.int32)):
+        assert tuple(row) == ChessEngine.from_fen(fen).get_scores()
+
+
+def test_mobility_counts_pseudo_legal_moves() -> None:
+    mobility = BatchEvaluator().mobility(fen_bitboards(FENS)[0])
+    for fen, score in zip(FENS, mobility):
+        chess_engine = ChessEngine.from_fen(fen)
+        expected = 0
+        for color, sign in [(Color.WHITE, 1), (Color.BLACK, -1)]:
+            for piece in chess_engine.get_team(color).get_all_pieces():
+                weight = MOBILITY_WEIGHTS.get(piece.name, 0)
+                expected += sign * weight * len(piece.get_pseudo_moves())
+        assert score == expected
@@ -0,0 +1,43 @@
+from src.board import Board
+from src.bitboard import iter_squares, popcount, to_square
+from src.chess_engine import ChessEngine
+from src.constants import Color, PieceName
+from src.pieces.knight import Knight
+from src.pieces.pawn import Pawn
+
+
+def test_start_position_bitboards() -> None:
+    board = ChessEngine()._board
+    assert popcount(board.get_occupancy()) == 32
+    assert popcount(board.get_occupancy(Color.WHITE)) == 16
+    assert set(iter_squares(board.get_bitboard(Color.BLACK, PieceName.KING))) == {
+        to_square((0, 4))
+    }
+    assert set(iter_squares(board.get_bitboard(Color.WHITE, PieceName.KNIGHT))) == {
+        to_square((7, 1)),
+        to_square((7, 6)),
+    }
+
+
+def test_move_piece_updates_bitboards() -> None:
+    board = Board()
+    knight = Knight(Color.WHITE, (7, 1))
+    board.put_piece(knight, (7, 1))
+    board.move_piece(knight, (5, 2))
+    assert board.is_vacant((7, 1))
+    assert not board.is_vacant((5, 2))
+    assert board.get_piece((5, 2)) is knight
+    assert board.get_bitboard(Color.WHITE, PieceName.KNIGHT) == 1 << to_square((5, 2))
+
+
+def test_capture_piece_updates_bitboards() -> None:
+    board = Board()
+    knight = Knight(Color.WHITE, (5, 2))
+    pawn = Pawn(Color.BLACK, (3, 3))
+    board.put_piece(knight, (5, 2))
+    board.put_piece(pawn, (3, 3))
+    assert board.is_capture(knight, (3, 3))
+    assert board.move_piece(knight, (3, 3)) is pawn
+    assert board.get_bitboard(Color.BLACK, PieceName.PAWN) == 0
+    assert board.get_occupancy(Color.BLACK) == 0
+    assert board.get_occupancy() == 1 << to_square((3, 3))
@@ -0,0 +1,94 @@
+from src.chess_engine import ChessEngine
+from src.constants import Color, PieceName
+from src.move import Move
+from src.pieces.queen import Queen
+
+# 1. e4 d5 2. exd5 Qxd5 3. Nc3 Qa5 4. d4 Nf6 5. Bd2 Bf5 6. Bc4 e6 7. Qf3 Bxc2
+SCANDINAVIAN_MOVES = [
+    ((6, 4), (4, 4)),
+    ((1, 3), (3, 3)),
+    ((4, 4), (3, 3)),
+    ((0, 3), (3, 3)),
+    ((7, 1), (5, 2)),
+    ((3, 3), (3, 0)),
+    ((6, 3), (4, 3)),
+    ((0, 6), (2, 5)),
+    ((7, 2), (6, 3)),
+    ((0, 2), (3, 5)),
+    ((7, 5), (4, 2)),
+    ((1, 4), (2, 4)),
+    ((7, 3), (5, 5)),
+    ((3, 5), (6, 2)),
+]
+
+
+def test_incremental_moves_match_full_recalculation() -> None:
+    chess_engine = ChessEngine(debug=True)
+    for src, dest in SCANDINAVIAN_MOVES:
+        chess_engine.move(src, dest)
+    assert chess_engine.get_piece((6, 2)).get_moves() == {
+        (5, 3),
+        (4, 4),
+        (3, 5),
+        (2, 6),
+        (5, 1),
+        (4, 0),
+        (7, 3),
+        (7, 1),
+    }
+
+
+def test_move_returns_captured_piece() -> None:
+    chess_engine = ChessEngine(debug=True)
+    for src, dest in SCANDINAVIAN_MOVES[:2]:
+        chess_engine.move(src, dest)
+    captured = chess_engine.move((4, 4), (3, 3))
+    assert str(captured) == "BP"
+    assert not chess_engine._black.has_piece(captured)
+
+
+def _snapshot(chess_engine: ChessEngine) -> dict:
+    return {
+        piece.coordinates: (str(piece), piece.has_moved, frozenset(piece.get_moves()))
+        for team in [chess_engine._black, chess_engine._white]
+        for piece in team.get_all_pieces()
+    }
+
+
+def test_unmake_move_restores_position() -> None:
+    chess_engine = ChessEngine(debug=True)
+    for src, dest in SCANDINAVIAN_MOVES[:-1]:
+        chess_engine.move(src, dest)
+    before = _snapshot(chess_engine)
+    board_before = chess_engine._board.get_occupancy()
+
+    for team in [chess_engine._black, chess_engine._white]:
+        for src, dest in team.get_moves():
+            undo = chess_engine.make_move(Move(src, dest))
+            chess_engine.unmake_move(undo)
+            assert _snapshot(chess_engine) == before
+            assert chess_engine._board.get_occupancy() == board_before
+
+
+def test_moved_piece_stays_in_team_index() -> None:
+    chess_engine = ChessEngine()
+    pawn = chess_engine.get_piece((6, 4))
+    chess_engine.move((6, 4), (4, 4))
+    assert pawn in chess_engine._white.get_pieces(PieceName.PAWN)
+    assert chess_engine._white.has_piece(pawn)
+    assert len(chess_engine._white.get_all_pieces()) == 16
+
+
+def test_put_piece_removes_replaced_piece() -> None:
+    chess_engine = ChessEngine(debug=True)
+    pawn = chess_engine.get_piece((1, 3))
+    queen = Queen(Color.WHITE, (1, 3))
+    chess_engine.put_piece(chess_engine._white, queen, (1, 3))
+    assert chess_engine.get_piece((1, 3)) is queen
+    assert not chess_engine._black.has_piece(pawn)
+    assert len(chess_engine._black.get_all_pieces()) == 15
+    assert chess_engine.is_check(chess_engine._black)
+    assert (
+        chess_engine.get_hash()
+        == ChessEngine.from_fen(chess_engine.to_fen()).get_hash()
+    )
@@ -0,0 +1,45 @@
+from src.utils.epd_reader import EpdReader, parse_epd
+
+EPD_FILE = "./tests/test_epd_reader/positions.epd"
+
+
+def test_read_records() -> None:
+    records = EpdReader(EPD_FILE).read_records()
+    first = next(records)
+    assert first.fen == ("2rr3k/pp3pp1/1nnqbN1p/3pN3/2pP4/2P3Q1/PPB4P/R4RK1 w - - 0 1")
+    assert first.operations == {"bm": ["Qg6"], "id": ["WAC.001"]}
+
+    second = next(records)
+    assert second.fen.endswith(" b - - 3 41")
+    assert second.operations["bm"] == ["Rxb2"]
+
+    third = next(records)
+    assert third.fen == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+    assert third.operations == {}
+    assert next(records, None) is None
+
+
+def test_read_positions_reuses_engine() -> None:
+    engines, fens = set(), []
+    for chess_engine, record in EpdReader(EPD_FILE).read_positions():
+        engines.add(id(chess_engine))
+        fens.append(chess_engine.to_fen())
+        assert chess_engine.to_fen() == record.fen
+    assert len(engines) == 1
+    assert len(fens) == 3
+
+
+def test_parse_epd_quoted_operands() -> None:
+    record = parse_epd('8/8/8/8/8/8/8/K6k w - - c0 "a; b"; pv Ka2 Kg2;')
+    assert record.operations == {"c0": ["a; b"], "pv": ["Ka2", "Kg2"]}
+
+
+def test_read_records_non_ascii_operands(tmp_path) -> None:
+    path = tmp_path / "positions.epd"
+    path.write_bytes(
+        '8/8/8/8/8/8/8/K6k w - - c0 "Réti"; id "1";\n'.encode("utf-8")
+        + b'8/8/8/8/8/8/8/K6k b - - c0 "\xff"; id "2";\n'
+    )
+    records = list(EpdReader(str(path)).read_records())
+    assert records[0].operations["c0"] == ["Réti"]
+    assert records[1].operations == {"c0": ["\ufffd"], "id": ["2"]}
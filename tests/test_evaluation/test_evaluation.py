@@ -0,0 +1,60 @@
+from src.bitboard import to_square
+from src.chess_engine import ChessEngine
+from src.constants import Color, PieceName
+from src.evaluation import PASSED_PAWN_BONUS, Evaluator, _score_pawns
+from src.move import Move
+
+# kiwipete, a middlegame position with castling, en passant and promotion moves
+KIWIPETE_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+# every pawn is passed and isolated, the black g pawns are doubled
+PAWN_STRUCTURE_FEN = "4k3/6p1/6p1/4P3/8/8/P7/4K3 w - - 0 1"
+
+
+def test_start_position_is_balanced() -> None:
+    assert Evaluator().evaluate(ChessEngine()) == 0
+
+
+def test_running_scores_match_recalculation() -> None:
+    chess_engine = ChessEngine.from_fen(KIWIPETE_FEN, debug=True)
+    scores = chess_engine.get_scores()
+    for move in chess_engine.generate_moves():
+        undo = chess_engine.make_move(move)
+        assert chess_engine.get_scores() == chess_engine._calculate_scores()
+        chess_engine.unmake_move(undo)
+        assert chess_engine.get_scores() == scores
+
+
+def test_evaluation_is_from_team_to_move() -> None:
+    chess_engine = ChessEngine()
+    evaluator = Evaluator()
+    chess_engine.make_move(Move((6, 4), (4, 4)))
+    # black to move, white has the better development after 1. e4
+    assert evaluator.evaluate(chess_engine) < 0
+
+
+def test_pawn_structure() -> None:
+    chess_engine = ChessEngine.from_fen(PAWN_STRUCTURE_FEN)
+    board = chess_engine.get_board()
+    white_pawns = board.get_bitboard(Color.WHITE, PieceName.PAWN)
+    black_pawns = board.get_bitboard(Color.BLACK, PieceName.PAWN)
+    # a2 has not advanced yet, e5 advanced three ranks
+    assert _score_pawns(Color.WHITE, white_pawns, black_pawns) == (0, 5)
+    # g6 advanced one rank
+    assert _score_pawns(Color.BLACK, black_pawns, white_pawns) == (-25, -40)
+
+
+def test_passed_pawn_bonus_edges() -> None:
+    # a lone pawn is isolated, so every score includes the isolated pawn penalty
+    for color, row, advanced in [
+        (Color.WHITE, 6, 0),
+        (Color.WHITE, 1, 5),
+        (Color.BLACK, 6, 5),
+        # pawns on a back row score as the nearest rank of the table
+        (Color.WHITE, 0, 5),
+        (Color.WHITE, 7, 0),
+        (Color.BLACK, 0, 0),
+    ]:
+        mg_bonus, eg_bonus = PASSED_PAWN_BONUS[advanced]
+        pawns = 1 << to_square((row, 3))
+        assert _score_pawns(color, pawns, 0) == (mg_bonus - 10, eg_bonus - 15)
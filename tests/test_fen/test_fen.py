@@ -0,0 +1,84 @@
+import pytest
+
+from src.chess_engine import ChessEngine
+from src.constants import START_FEN, Color
+from src.exceptions import InvalidFen
+
+KIWIPETE_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        START_FEN,
+        KIWIPETE_FEN,
+        "r3k2r/8/8/8/8/8/8/R3K2R b Kq - 5 20",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3",
+    ],
+)
+def test_fen_round_trip(fen: str) -> None:
+    assert ChessEngine.from_fen(fen, debug=True).to_fen() == fen
+
+
+def test_start_fen_matches_start_position() -> None:
+    chess_engine = ChessEngine.from_fen(START_FEN)
+    assert chess_engine.get_hash() == ChessEngine().get_hash()
+    assert chess_engine.get_piece((1, 3)).get_moves() == {(2, 3), (3, 3)}
+
+
+def test_fen_tracks_moves() -> None:
+    chess_engine = ChessEngine()
+    chess_engine.move((6, 4), (4, 4))
+    assert (
+        chess_engine.to_fen()
+        == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+    )
+    chess_engine.move((0, 6), (2, 5))
+    chess_engine.move((7, 4), (6, 4))
+    assert (
+        chess_engine.to_fen()
+        == "rnbqkb1r/pppppppp/5n2/8/4P3/8/PPPPKPPP/RNBQ1BNR b kq - 2 2"
+    )
+
+
+def test_set_fen_reuses_engine() -> None:
+    chess_engine = ChessEngine()
+    board = chess_engine._board
+    chess_engine.set_fen(KIWIPETE_FEN)
+    assert chess_engine._board is board
+    assert chess_engine.get_turn() == Color.WHITE
+    assert chess_engine.get_piece((6, 3)).has_moved is False
+    assert chess_engine.get_piece((3, 3)).has_moved is True
+    chess_engine.set_fen(START_FEN)
+    assert chess_engine.get_hash() == ChessEngine().get_hash()
+
+
+def test_invalid_fen() -> None:
+    with pytest.raises(InvalidFen):
+        ChessEngine.from_fen("rnbqkbnr/pppppppp/8 w")
+    with pytest.raises(InvalidFen):
+        ChessEngine.from_fen("rnbqkxnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq x9 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - a 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 b",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",
+        "rnbqkbnr/ppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbq1bnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQ - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w ZZ!! - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KKqq - 0 1",
+        "P3k3/8/8/8/8/8/8/4K3 w - - 0 1",
+        "4k3/8/8/8/8/8/8/p3K3 b - - 0 1",
+    ],
+)
+def test_invalid_fen_keeps_position(fen: str) -> None:
+    chess_engine = ChessEngine.from_fen(KIWIPETE_FEN)
+    with pytest.raises(InvalidFen):
+        chess_engine.set_fen(fen)
+    assert chess_engine.to_fen() == KIWIPETE_FEN
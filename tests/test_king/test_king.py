@@ -37,8 +37,9 @@ def test_king_capture(chess_board_reader: ChessBoardReader) -> None:
     )
     black_king_moves = chess_engine.get_piece((0, 4)).get_moves()
     white_king_moves = chess_engine.get_piece((7, 4)).get_moves()
-    assert black_king_moves == {(1, 4), (0, 3), (0, 5), (1, 3), (1, 5)}
-    assert white_king_moves == {(6, 4), (7, 3), (7, 5), (6, 3), (6, 5)}
+    # the kings cannot step onto the back row squares attacked by the enemy pawns
+    assert black_king_moves == {(1, 4), (1, 3), (1, 5)}
+    assert white_king_moves == {(6, 4), (6, 3), (6, 5)}
 
 
 def test_cannot_move_king_into_check(chess_board_reader: ChessBoardReader) -> None:
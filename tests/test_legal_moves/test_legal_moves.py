@@ -0,0 +1,92 @@
+from src.chess_engine import ChessEngine
+from src.constants import Color, PieceName
+from src.move import Move
+from src.utils.chess_board_reader import ChessBoardReader
+
+WHITE_KINGSIDE_CASTLE = "./tests/chessboards/white-kingside-castle.txt"
+
+
+def _snapshot(chess_engine: ChessEngine) -> tuple:
+    return (
+        chess_engine.to_fen(),
+        chess_engine.get_hash(),
+        set(chess_engine.generate_moves()),
+    )
+
+
+def test_white_kingside_castle(chess_board_reader: ChessBoardReader) -> None:
+    chess_engine = chess_board_reader.read_chess_board(WHITE_KINGSIDE_CASTLE)
+    chess_engine.debug = True
+    assert chess_engine.get_piece((7, 4)).get_moves() == {(7, 5), (7, 6), (6, 4)}
+
+    before = _snapshot(chess_engine)
+    undo = chess_engine.make_move(Move((7, 4), (7, 6)))
+    assert str(chess_engine.get_piece((7, 5))) == "WR"
+    assert chess_engine.to_fen().startswith(
+        "rnbqkb1r/ppp2ppp/5n2/3pp3/2B1P3/5N2/PPPP1PPP/RNBQ1RK1 b kq"
+    )
+    chess_engine.unmake_move(undo)
+    assert _snapshot(chess_engine) == before
+
+
+def test_cannot_castle_through_check() -> None:
+    # the rook on e7 checks the king, so the king can neither castle nor stay on the e-file
+    chess_engine = ChessEngine.from_fen("4k3/4r3/8/8/8/8/8/R3K2R w KQ - 0 1")
+    assert chess_engine.get_piece((7, 4)).get_moves() == {
+        (7, 3),
+        (7, 5),
+        (6, 3),
+        (6, 5),
+    }
+
+    chess_engine.set_fen("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1")
+    assert {(7, 2), (7, 6)} <= chess_engine.get_piece((7, 4)).get_moves()
+
+    # the rook on d8 attacks d1, which the king crosses when castling queenside
+    chess_engine.set_fen("3rk3/8/8/8/8/8/8/R3K2R w KQ - 0 1")
+    assert (7, 2) not in chess_engine.get_piece((7, 4)).get_moves()
+
+
+def test_en_passant() -> None:
+    chess_engine = ChessEngine.from_fen("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", debug=True)
+    assert (2, 3) in chess_engine.get_piece((3, 4)).get_moves()
+
+    before = _snapshot(chess_engine)
+    undo = chess_engine.make_move(Move((3, 4), (2, 3)))
+    assert undo.captured.coordinates == (3, 3)
+    assert chess_engine.get_piece((3, 3)) is None
+    assert chess_engine.to_fen() == "4k3/8/3P4/8/8/8/8/4K3 b - - 0 1"
+    chess_engine.unmake_move(undo)
+    assert _snapshot(chess_engine) == before
+
+
+def test_en_passant_discovered_check() -> None:
+    # capturing en passant would take both pawns off the row between the king and the rook
+    chess_engine = ChessEngine.from_fen("8/8/8/KPp4r/8/8/8/7k w - c6 0 1")
+    assert chess_engine.get_piece((3, 1)).get_moves() == {(2, 1)}
+
+
+def test_promotion() -> None:
+    chess_engine = ChessEngine.from_fen("8/P6k/8/8/8/8/8/K7 w - - 0 1", debug=True)
+    promotions = [move for move in chess_engine.generate_moves() if move.promotion]
+    assert len(promotions) == 4
+
+    before = _snapshot(chess_engine)
+    undo = chess_engine.make_move(Move((1, 0), (0, 0), PieceName.KNIGHT))
+    knight = chess_engine.get_piece((0, 0))
+    assert knight.name == PieceName.KNIGHT
+    assert knight in chess_engine.get_team(Color.WHITE).get_pieces(PieceName.KNIGHT)
+    assert chess_engine.get_team(Color.WHITE).get_pieces(PieceName.PAWN) == set()
+    chess_engine.unmake_move(undo)
+    assert _snapshot(chess_engine) == before
+
+
+def test_checkmate_and_stalemate() -> None:
+    chess_engine = ChessEngine.from_fen("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+    black = chess_engine.get_team(Color.BLACK)
+    assert chess_engine.generate_moves() == []
+    assert chess_engine.is_stalemate(black)
+    assert not chess_engine.is_checkmate(black)
+
+    chess_engine.set_fen("7k/6Q1/6K1/8/8/8/8/8 b - - 0 1")
+    assert chess_engine.is_checkmate(black)
@@ -0,0 +1,70 @@
+import io
+
+import pytest
+
+from src.match import (
+    DRAW,
+    WHITE_WINS,
+    EngineConfig,
+    Match,
+    MatchResult,
+    play_game,
+)
+
+# the white rook mates on the back rank
+BACK_RANK_MATE_FEN = "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+# only the kings are left
+BARE_KINGS_FEN = "8/8/4k3/8/8/3K4/8/8 w - - 0 1"
+
+
+def test_play_game_checkmate() -> None:
+    game = play_game(
+        EngineConfig("first", depth=2),
+        EngineConfig("second", depth=1),
+        BACK_RANK_MATE_FEN,
+    )
+    assert game.result == WHITE_WINS
+    assert game.termination == "checkmate"
+    assert game.score("first") == 1.0 and game.score("second") == 0.0
+    assert game.nodes["first"] > 0 and game.nodes["second"] == 0
+
+
+def test_play_game_insufficient_material() -> None:
+    game = play_game(
+        EngineConfig("first", depth=1), EngineConfig("second", depth=1), BARE_KINGS_FEN
+    )
+    assert (game.result, game.termination) == (DRAW, "insufficient material")
+    assert game.moves == []
+
+
+def test_elo() -> None:
+    result = MatchResult("first", "second", wins=30, losses=10, draws=60)
+    elo, margin = result.elo()
+    assert result.score == 0.6
+    assert elo == pytest.approx(70.4, abs=0.1)
+    assert 30 < margin < 50
+    assert MatchResult("first", "second", draws=10).elo() == (0.0, 0.0)
+
+
+def test_match_writes_pgn() -> None:
+    match = Match(
+        EngineConfig("first", depth=1),
+        EngineConfig("second", depth=1),
+        games=2,
+        workers=1,
+        max_plies=4,
+    )
+    output = io.StringIO()
+    result = match.play(output)
+    assert result.games == 2
+    assert result.draws == 2
+    assert result.nodes_per_second("first") > 0
+    pgn = output.getvalue()
+    assert pgn.count('[Event "Engine Match"]') == 2
+    assert '[White "second"]' in pgn and '[Termination "adjudication"]' in pgn
+
+
+def test_match_requires_different_names() -> None:
+    with pytest.raises(ValueError):
+        Match(EngineConfig("engine"), EngineConfig("engine"))
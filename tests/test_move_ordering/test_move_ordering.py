@@ -0,0 +1,48 @@
+from src.chess_engine import ChessEngine
+from src.constants import Color
+from src.move import Move
+from src.move_ordering import MoveOrdering
+from src.utils.utils import convert_coordinates
+
+# exd5 wins a pawn, Qxd5 loses the queen to cxd5
+CAPTURES_FEN = "4k3/8/2p5/3p4/4P3/8/8/3QK3 w - - 0 1"
+
+
+def _move(src: str, dest: str) -> Move:
+    return Move(convert_coordinates(src), convert_coordinates(dest))
+
+
+def test_every_legal_move_is_ordered_once() -> None:
+    chess_engine = ChessEngine.from_fen(CAPTURES_FEN)
+    table_move = _move("e1", "f2")
+    ordered = list(MoveOrdering().order_moves(chess_engine, 0, table_move))
+    assert sorted(ordered) == sorted(chess_engine.generate_moves())
+    assert ordered[0] == table_move
+
+
+def test_stages() -> None:
+    chess_engine = ChessEngine.from_fen(CAPTURES_FEN)
+    ordering = MoveOrdering()
+    killer = _move("d1", "a4")
+    ordering.update(chess_engine, killer, 1, 3)
+    ordering.update(chess_engine, _move("d1", "h5"), 2, 4)
+    # captures and promotions are not recorded
+    ordering.update(chess_engine, _move("e4", "d5"), 1, 3)
+
+    ordered = list(ordering.order_moves(chess_engine, 1, _move("a1", "a2")))
+    assert ordered[0] == _move("e4", "d5")
+    assert ordered[1] == killer
+    assert ordered[2] == _move("d1", "h5")
+    assert ordered[-1] == _move("d1", "d5")
+    assert ordering.get_killers(1) == [killer]
+    assert ordering.get_history(Color.WHITE, killer) == 9
+
+
+def test_new_search_ages_history() -> None:
+    chess_engine = ChessEngine.from_fen(CAPTURES_FEN)
+    ordering = MoveOrdering()
+    move = _move("d1", "a4")
+    ordering.update(chess_engine, move, 0, 4)
+    ordering.new_search()
+    assert ordering.get_killers(0) == []
+    assert ordering.get_history(Color.WHITE, move) == 8
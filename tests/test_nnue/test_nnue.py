@@ -0,0 +1,42 @@
+import numpy as np
+
+from src.chess_engine import ChessEngine
+from src.nnue import Accumulator, NnueEvaluator, NnueNetwork
+from src.search import Search
+
+# kiwipete, a middlegame position with castling, en passant and promotion moves
+KIWIPETE_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def test_network_weights_round_trip(tmp_path) -> None:
+    network = NnueNetwork.random(hidden_size=16, layer_size=4)
+    file_path = str(tmp_path / "network.npz")
+    network.save(file_path)
+    loaded = NnueNetwork.load(file_path)
+    assert np.array_equal(loaded.feature_weights, network.feature_weights)
+    assert np.array_equal(loaded.output_bias, network.output_bias)
+
+
+def test_start_position_is_symmetric() -> None:
+    chess_engine = ChessEngine()
+    chess_engine.set_accumulator(Accumulator(NnueNetwork.random()))
+    values = chess_engine.get_accumulator().values
+    # both perspectives see the same mirrored position
+    assert np.allclose(values[0], values[1], atol=1e-5)
+
+
+def test_accumulator_is_updated_incrementally() -> None:
+    # debug mode cross-checks the accumulator with a full recalculation after every move
+    chess_engine = ChessEngine.from_fen(KIWIPETE_FEN, debug=True)
+    chess_engine.set_accumulator(Accumulator(NnueNetwork.random(hidden_size=16)))
+    values = chess_engine.get_accumulator().values.copy()
+    assert chess_engine.perft(2) == 2039
+    assert np.array_equal(chess_engine.get_accumulator().values, values)
+
+
+def test_search_with_nnue_evaluator() -> None:
+    chess_engine = ChessEngine()
+    evaluator = NnueEvaluator(NnueNetwork.random(hidden_size=16))
+    best_move, _, _ = Search(chess_engine, evaluator=evaluator).search(depth=2)
+    assert best_move in chess_engine.generate_moves()
+    assert chess_engine.get_accumulator().network is evaluator.network
@@ -0,0 +1,82 @@
+import io
+import random
+
+import numpy as np
+import pytest
+
+from src.chess_engine import ChessEngine
+from src.exceptions import InvalidBookFile
+from src.opening_book import ENTRY_DTYPE, OpeningBook, build_book
+from src.uci import UciEngine, parse_uci_move
+
+GAMES = """[Result "1-0"]
+
+1. e4 e5 2. Nf3 Nc6 1-0
+
+[Result "1/2-1/2"]
+
+1. e4 c5 1/2-1/2
+
+[Result "0-1"]
+
+1. d4 d5 0-1
+"""
+
+
+def _build(tmp_path, **kwargs) -> str:
+    pgn_path, book_path = tmp_path / "games.pgn", tmp_path / "book.bin"
+    pgn_path.write_text(GAMES)
+    with open(book_path, "wb") as output:
+        build_book([str(pgn_path)], output, **kwargs)
+    return str(book_path)
+
+
+def test_build_book(tmp_path) -> None:
+    book_path = _build(tmp_path, max_plies=3)
+    entries = np.fromfile(book_path, dtype=ENTRY_DTYPE)
+    # e5 and d4 were only played in lost games and Nc6 is past the ply limit
+    assert len(entries) == 4
+    assert np.all(np.diff(entries["key"].astype(np.float64)) >= 0)
+
+    engine = ChessEngine()
+    with OpeningBook(book_path) as book:
+        assert len(book) == 4
+        assert book.get_moves(engine) == [(parse_uci_move(engine, "e2e4"), 3)]
+        engine.make_move(parse_uci_move(engine, "e2e4"))
+        assert book.get_moves(engine) == [(parse_uci_move(engine, "c7c5"), 1)]
+        assert book.choose_move(engine, random.Random(0)) == parse_uci_move(
+            engine, "c7c5"
+        )
+        engine.make_move(parse_uci_move(engine, "c7c5"))
+        assert book.get_moves(engine) == []
+        assert book.choose_move(engine) is None
+
+
+def test_empty_book(tmp_path) -> None:
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with OpeningBook(str(path)) as book:
+        assert len(book) == 0
+        assert book.get_moves(ChessEngine()) == []
+
+
+def test_uci_book_move(tmp_path) -> None:
+    uci = UciEngine(output=io.StringIO())
+    uci.execute(f"setoption name BookFile value {_build(tmp_path)}")
+    uci.execute("position startpos")
+    uci.execute("go wtime 1000 btime 1000")
+    assert uci.output.getvalue().splitlines() == ["bestmove e2e4"]
+
+
+def test_close_with_entries_in_use(tmp_path) -> None:
+    book = OpeningBook(_build(tmp_path))
+    entries = book.get_entries(ChessEngine().get_hash())
+    book.close()
+    assert len(entries) == 1
+
+
+def test_truncated_book(tmp_path) -> None:
+    path = tmp_path / "truncated.bin"
+    path.write_bytes(b"\0" * (ENTRY_DTYPE.itemsize + 3))
+    with pytest.raises(InvalidBookFile):
+        OpeningBook(str(path))
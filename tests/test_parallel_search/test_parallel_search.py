@@ -0,0 +1,42 @@
+from src.chess_engine import ChessEngine
+from src.constants import START_FEN
+from src.parallel_search import (
+    LAZY_SMP,
+    ROOT_SPLIT,
+    ParallelSearch,
+    WorkerResult,
+    _best_root_split_result,
+)
+from src.search import MATE_SCORE
+
+# the white rook mates on the back rank
+BACK_RANK_MATE_FEN = "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+
+def test_lazy_smp() -> None:
+    result = ParallelSearch(workers=2, size_mb=1, mode=LAZY_SMP).search(
+        START_FEN, depth=2
+    )
+    assert result.best_move in ChessEngine().generate_moves()
+    assert [worker.worker for worker in result.workers] == [0, 1]
+    assert result.workers[0].depth == 2
+    assert result.nodes == sum(worker.nodes for worker in result.workers)
+
+
+def test_root_split_finds_mate() -> None:
+    result = ParallelSearch(workers=2, size_mb=1, mode=ROOT_SPLIT).search(
+        BACK_RANK_MATE_FEN, depth=2
+    )
+    assert result.best_move == ((7, 0), (0, 0), None)
+    assert result.score >= MATE_SCORE - 2
+    assert len(result.workers) == 2
+
+
+def test_root_split_prefers_deepest_searched_result() -> None:
+    moves = ChessEngine().generate_moves()
+    unsearched = WorkerResult(0, moves[0], 0, [], 0, 10, 1.0)
+    shallow = WorkerResult(1, moves[1], 50, [moves[1]], 1, 10, 1.0)
+    deep = WorkerResult(2, moves[2], -20, [moves[2]], 2, 10, 1.0)
+    assert _best_root_split_result([unsearched, shallow, deep]) is deep
+    mate = WorkerResult(3, moves[3], MATE_SCORE - 1, [moves[3]], 1, 10, 1.0)
+    assert _best_root_split_result([deep, mate]) is mate
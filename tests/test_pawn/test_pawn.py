@@ -21,3 +21,13 @@ def test_pawn_capture(chess_board_reader: ChessBoardReader) -> None:
     white_pawn_moves = chess_engine.get_piece((4, 0)).get_moves()
     assert (4, 0) in black_pawn_moves
     assert (3, 1) in white_pawn_moves
+
+
+def test_pawn_cannot_jump_blocking_piece(chess_board_reader: ChessBoardReader) -> None:
+    chess_engine = chess_board_reader.read_chess_board(
+        file_path=f"{CHESS_BOARDS_DIR}pawn-blocked-double-move.txt"
+    )
+    black_pawn_moves = chess_engine.get_piece((1, 0)).get_moves()
+    white_pawn_moves = chess_engine.get_piece((6, 0)).get_moves()
+    assert black_pawn_moves == set()
+    assert white_pawn_moves == set()
@@ -0,0 +1,20 @@
+from src.chess_engine import ChessEngine
+from src.utils.perft_suite import run_perft_suite
+
+
+def test_perft_start_position() -> None:
+    chess_engine = ChessEngine()
+    assert [chess_engine.perft(depth) for depth in range(4)] == [1, 20, 400, 8902]
+
+
+def test_divide_sums_to_perft() -> None:
+    divide = ChessEngine().divide(2)
+    assert len(divide) == 20
+    assert set(divide.values()) == {20}
+    assert sum(divide.values()) == 400
+
+
+def test_perft_suite() -> None:
+    results = run_perft_suite(max_depth=2)
+    assert results
+    assert all(result.passed for result in results)
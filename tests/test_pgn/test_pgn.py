@@ -0,0 +1,102 @@
+import io
+
+import pytest
+
+from src.chess_engine import ChessEngine
+from src.constants import PieceName
+from src.exceptions import InvalidSan
+from src.move import Move
+from src.utils.pgn import PgnGame, PgnReader, format_san, parse_san, write_game
+from src.utils.utils import convert_coordinates
+
+PGN_FILE = "./tests/test_pgn/games.pgn"
+
+
+def _move(src: str, dest: str, promotion: PieceName = None) -> Move:
+    return Move(convert_coordinates(src), convert_coordinates(dest), promotion)
+
+
+def test_format_san() -> None:
+    # both white rooks reach a3, both black knights reach d7 and the b7 pawn promotes
+    engine = ChessEngine.from_fen("8/1P3k2/1n3n2/8/R7/8/8/R3K2R w KQ - 0 1")
+    assert format_san(engine, _move("a1", "a3")) == "R1a3"
+    assert format_san(engine, _move("h1", "h7")) == "Rh7+"
+    assert format_san(engine, _move("e1", "g1")) == "O-O"
+    assert format_san(engine, _move("e1", "c1")) == "O-O-O"
+    assert format_san(engine, _move("b7", "b8", PieceName.QUEEN)) == "b8=Q"
+    engine.make_move(_move("a4", "a5"))
+    assert format_san(engine, _move("b6", "d7")) == "Nbd7"
+    assert format_san(engine, _move("f6", "d7")) == "Nfd7"
+
+
+def test_write_game() -> None:
+    game = PgnGame(
+        {"White": "first", "Black": "second", "Result": "0-1"},
+        [
+            _move("f2", "f3"),
+            _move("e7", "e5"),
+            _move("g2", "g4"),
+            _move("d8", "h4"),
+        ],
+    )
+    output = io.StringIO()
+    write_game(output, game)
+    assert output.getvalue().splitlines() == [
+        '[Event "?"]',
+        '[Site "?"]',
+        '[Date "?"]',
+        '[Round "?"]',
+        '[White "first"]',
+        '[Black "second"]',
+        '[Result "0-1"]',
+        "",
+        "1. f3 e5 2. g4 Qh4# 0-1",
+        "",
+    ]
+
+
+def test_parse_san() -> None:
+    engine = ChessEngine()
+    assert parse_san(engine, "Nf3") == _move("g1", "f3")
+    assert parse_san(engine, "e4!?") == _move("e2", "e4")
+    with pytest.raises(InvalidSan):
+        parse_san(engine, "e5")
+    with pytest.raises(InvalidSan):
+        parse_san(engine, "Nd2")
+
+
+def test_read_games() -> None:
+    games = PgnReader(PGN_FILE).read_games()
+    first = next(games)
+    assert first.headers["Event"] == 'Casual "Blitz"'
+    assert first.result == "1-0"
+    assert len(first.moves) == 16
+    assert first.moves[8] == _move("e1", "g1")
+
+    second = next(games)
+    assert second.fen == "8/1P3k2/8/8/8/8/8/4K3 w - - 0 1"
+    assert second.moves == [
+        _move("b7", "b8", PieceName.KNIGHT),
+        _move("f7", "f6"),
+        _move("e1", "d2"),
+    ]
+    assert next(games, None) is None
+
+
+def test_read_positions_reuses_engine() -> None:
+    engines, moves = set(), 0
+    for chess_engine, headers, move in PgnReader(PGN_FILE).read_positions():
+        engines.add(id(chess_engine))
+        assert move in chess_engine.generate_moves()
+        moves += 1
+    assert len(engines) == 1
+    assert moves == 19
+
+
+def test_write_and_read_round_trip(tmp_path) -> None:
+    games = list(PgnReader(PGN_FILE).read_games())
+    path = tmp_path / "games.pgn"
+    with open(path, "w") as output:
+        for game in games:
+            write_game(output, game)
+    assert list(PgnReader(str(path)).read_games()) == games
@@ -0,0 +1,114 @@
+import io
+
+import numpy as np
+import pytest
+
+from src.batch_evaluation import fen_bitboards
+from src.chess_engine import ChessEngine
+from src.constants import START_FEN
+from src.exceptions import InvalidBitboards, InvalidFen
+from src.position_encoding import (
+    POSITION_SIZE,
+    load_positions,
+    pack_bitboards,
+    pack_engine,
+    pack_fen,
+    pack_fens,
+    pack_moves,
+    read_games,
+    read_positions,
+    unpack_bitboards,
+    unpack_fen,
+    unpack_moves,
+    write_game,
+)
+
+FENS = [
+    START_FEN,
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "rnbqkbnr/ppp2ppp/4p3/3p4/3PP3/8/PPP2PPP/RNBQKBNR w KQkq d6 0 3",
+    "8/8/4k3/8/8/3K4/8/8 b - - 12 80",
+]
+
+
+def test_pack_fen_round_trip() -> None:
+    for fen in FENS:
+        data = pack_fen(fen)
+        assert len(data) == POSITION_SIZE == 32
+        assert unpack_fen(data) == fen
+    assert pack_engine(ChessEngine()) == pack_fen(START_FEN)
+
+
+def test_pack_fen_invalid() -> None:
+    with pytest.raises(InvalidFen):
+        pack_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1")
+    with pytest.raises(InvalidFen):
+        pack_fen("8/8/8/8/8/8/8/7X w - - 0 1")
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "8/8/4k3/8/8/3K4/8/8 x - - 0 1",
+        "8/8/4k3/8/8/3K4/8/8 w - i9 0 1",
+        "8/8/4k3/8/8/3K4/8/8 w - e33 0 1",
+        "8/8/4k3/8/8/3K4/8/8 w - - a 1",
+        "8/8/4k3/8/8/3K4/8/8 w - - 0 -1",
+        "9/7/8/8/8/8/8/K6k w - - 0 1",
+        "8/8/8/8/8/8/8/K6k/8 w - - 0 1",
+    ],
+)
+def test_pack_fen_invalid_fields(fen: str) -> None:
+    with pytest.raises(InvalidFen):
+        pack_fen(fen)
+
+
+def test_unpack_bitboards(tmp_path) -> None:
+    path = tmp_path / "positions.bin"
+    path.write_bytes(pack_fens(FENS).tobytes())
+    records = load_positions(str(path))
+    assert [unpack_fen(record) for record in records] == FENS
+
+    bitboards, turns = unpack_bitboards(records)
+    expected_bitboards, expected_turns = fen_bitboards(FENS)
+    assert np.array_equal(bitboards, expected_bitboards)
+    assert np.array_equal(turns, expected_turns)
+
+
+def test_pack_bitboards() -> None:
+    records = pack_fens(FENS)
+    bitboards, turns = unpack_bitboards(records)
+    packed = pack_bitboards(
+        bitboards,
+        turns,
+        castling=records["flags"] >> 1,
+        en_passant=records["en_passant"],
+        halfmove_clock=records["halfmove_clock"],
+        fullmove_number=records["fullmove_number"],
+    )
+    assert packed.tobytes() == records.tobytes()
+    assert unpack_fen(pack_bitboards(*fen_bitboards(FENS[3:]))[0]) == (
+        "8/8/4k3/8/8/3K4/8/8 b - - 0 1"
+    )
+
+    bitboards[1, 0] |= bitboards[1, 6]
+    with pytest.raises(InvalidBitboards):
+        pack_bitboards(bitboards, turns)
+
+
+def test_packed_games() -> None:
+    engine = ChessEngine()
+    moves = engine.generate_moves()[:1]
+    engine.make_move(moves[0])
+    moves.append(engine.generate_moves()[0])
+    assert unpack_moves(pack_moves(moves)) == moves
+
+    output = io.BytesIO()
+    write_game(output, START_FEN, moves)
+    write_game(output, FENS[3], [])
+    games = list(read_games(output.getbuffer()))
+    assert len(games) == 2
+    assert unpack_fen(games[0][0]) == START_FEN
+    assert unpack_moves(games[0][1]) == moves
+    assert unpack_fen(games[1][0]) == FENS[3] and len(games[1][1]) == 0
+    assert len(read_positions(pack_fens(FENS).tobytes())) == len(FENS)
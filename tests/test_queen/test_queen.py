@@ -74,5 +74,6 @@ def test_queen_capture(chess_board_reader: ChessBoardReader) -> None:
     chess_engine._board.print_board()
     black_queen_moves = chess_engine.get_piece((0, 3)).get_moves()
     white_queen_moves = chess_engine.get_piece((7, 3)).get_moves()
-    assert black_queen_moves == set([(0, 1), (0, 2), (1, 3), (2, 3), (1, 2)])
-    assert white_queen_moves == set([(7, 0), (7, 1), (7, 2), (6, 3), (5, 3)])
+    # both queens are pinned to their kings along the back rows
+    assert black_queen_moves == set([(0, 1), (0, 2)])
+    assert white_queen_moves == set([(7, 0), (7, 1), (7, 2)])
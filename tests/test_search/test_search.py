@@ -0,0 +1,66 @@
+import itertools
+import threading
+import time
+
+from src.chess_engine import ChessEngine
+from src.move import Move
+from src.search import MATE_SCORE, MAX_DEPTH, NODES_PER_TIME_CHECK, Search
+from src.utils.chess_board_reader import ChessBoardReader
+
+CHESS_BOARDS_DIR = "./tests/test_search/chessboards/"
+
+
+def test_search_finds_mate_in_one(chess_board_reader: ChessBoardReader) -> None:
+    chess_engine = chess_board_reader.read_chess_board(
+        file_path=f"{CHESS_BOARDS_DIR}back-rank-mate.txt"
+    )
+    best_move, score, pv = Search(chess_engine).search(depth=3)
+    assert best_move == Move((7, 0), (0, 0))
+    assert score >= MATE_SCORE - 3
+    assert pv[0] == best_move
+
+
+def test_search_captures_hanging_queen(chess_board_reader: ChessBoardReader) -> None:
+    chess_engine = chess_board_reader.read_chess_board(
+        file_path=f"{CHESS_BOARDS_DIR}hanging-queen.txt"
+    )
+    best_move, score, _ = Search(chess_engine).search(depth=2)
+    assert best_move == Move((5, 2), (3, 3))
+    # a knight up, the positional terms only shift the score around the material balance
+    assert 200 < score < 400
+
+
+def test_search_respects_time_limit(monkeypatch) -> None:
+    # a fake clock that ticks 1 ms per reading, so the deadline is reached after a fixed
+    # number of time checks however fast the machine is
+    clock = itertools.count()
+    monkeypatch.setattr(time, "perf_counter", lambda: next(clock) / 1000)
+    chess_engine = ChessEngine()
+    hash_before = chess_engine.get_hash()
+    search = Search(chess_engine)
+    best_move, _, pv = search.search(time_limit=0.5)
+    assert 0 < search.completed_depth < MAX_DEPTH
+    assert search.nodes <= 500 * NODES_PER_TIME_CHECK
+    assert best_move in ChessEngine().generate_moves()
+    assert pv and pv[0] == best_move
+    assert chess_engine.get_hash() == hash_before
+
+
+def test_search_stops_on_stop_event() -> None:
+    stop_event = threading.Event()
+    search = Search(
+        ChessEngine(),
+        stop_event=stop_event,
+        on_iteration=lambda depth, score, pv: depth == 2 and stop_event.set(),
+    )
+    best_move, _, pv = search.search()
+    assert search.completed_depth == 2
+    assert pv and pv[0] == best_move
+
+
+def test_quiescence_avoids_losing_capture() -> None:
+    # Qxd5 wins a pawn at depth 1 but cxd5 wins the queen back
+    chess_engine = ChessEngine.from_fen("4k3/8/2p5/3p4/8/8/8/3QK3 w - - 0 1")
+    best_move, score, _ = Search(chess_engine).search(depth=1)
+    assert best_move != Move((7, 3), (3, 3))
+    assert score < 900
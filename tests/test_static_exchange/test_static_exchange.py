@@ -0,0 +1,36 @@
+from src.chess_engine import ChessEngine
+from src.move import Move
+from src.static_exchange import mvv_lva, static_exchange
+from src.utils.utils import convert_coordinates
+
+# the rook wins the undefended e5 pawn
+UNDEFENDED_PAWN_FEN = "1k1r4/1pp4p/p7/4p3/8/P5P1/1PP4P/2K1R3 w - - 0 1"
+
+# Nxe5 loses the knight for a pawn, the x-rayed rook and queens join the exchange
+XRAY_EXCHANGE_FEN = "1k1r3q/1ppn3p/p4b2/4p3/8/P2N2P1/1PP1R1BP/2K1Q3 w - - 0 1"
+
+# the d5 pawn is defended by the c6 pawn and attacked by the e4 pawn and the queen
+DEFENDED_PAWN_FEN = "4k3/8/2p5/3p4/4P3/8/8/3QK3 w - - 0 1"
+
+
+def _move(src: str, dest: str) -> Move:
+    return Move(convert_coordinates(src), convert_coordinates(dest))
+
+
+def test_static_exchange() -> None:
+    chess_engine = ChessEngine.from_fen(UNDEFENDED_PAWN_FEN)
+    assert static_exchange(chess_engine, _move("e1", "e5")) == 100
+
+    chess_engine = ChessEngine.from_fen(XRAY_EXCHANGE_FEN)
+    assert static_exchange(chess_engine, _move("d3", "e5")) == -200
+
+    chess_engine = ChessEngine.from_fen(DEFENDED_PAWN_FEN)
+    assert static_exchange(chess_engine, _move("e4", "d5")) == 100
+    assert static_exchange(chess_engine, _move("d1", "d5")) == -800
+
+
+def test_mvv_lva_prefers_least_valuable_attacker() -> None:
+    chess_engine = ChessEngine.from_fen(DEFENDED_PAWN_FEN)
+    pawn_capture = mvv_lva(chess_engine, _move("e4", "d5"))
+    queen_capture = mvv_lva(chess_engine, _move("d1", "d5"))
+    assert pawn_capture > queen_capture
@@ -0,0 +1,51 @@
+from src.chess_engine import ChessEngine
+from src.move import Move
+from src.search import Search
+from src.transposition_table import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+)
+
+E2E4 = Move((6, 4), (4, 4))
+D2D4 = Move((6, 3), (4, 3))
+
+
+def test_store_and_probe() -> None:
+    table = TranspositionTable(size_mb=1)
+    assert len(table.buffer) == 1024 * 1024
+    table.store(0xDEADBEEF, 7, -1234, LOWER_BOUND, E2E4)
+    table.store(0xFEEDFACE, 3, 250, EXACT, None)
+    assert table.probe(0xDEADBEEF) == (7, -1234, LOWER_BOUND, E2E4)
+    assert table.probe(0xFEEDFACE) == (3, 250, EXACT, None)
+    assert table.probe(0xCAFEBABE) is None
+    table.clear()
+    assert table.probe(0xDEADBEEF) is None
+
+
+def test_depth_preferred_and_always_replace_slots() -> None:
+    table = TranspositionTable(size_mb=1)
+    buckets = table._num_buckets
+    deep, shallow, newer = 5, 5 + buckets, 5 + 2 * buckets
+
+    table.store(deep, 8, 10, EXACT, E2E4)
+    table.store(shallow, 2, 20, UPPER_BOUND, D2D4)
+    table.store(newer, 1, 30, EXACT, None)
+    assert table.probe(deep) == (8, 10, EXACT, E2E4)
+    assert table.probe(shallow) is None
+    assert table.probe(newer) == (1, 30, EXACT, None)
+
+    # entries of older searches are replaced regardless of their depth
+    table.new_search()
+    table.store(shallow, 2, 20, UPPER_BOUND, D2D4)
+    assert table.probe(shallow) == (2, 20, UPPER_BOUND, D2D4)
+    assert table.probe(deep) is None
+
+
+def test_search_reuses_table() -> None:
+    search = Search(ChessEngine(), table=TranspositionTable(size_mb=1))
+    best_move, score, _ = search.search(depth=3)
+    first_nodes = search.nodes
+    assert search.search(depth=3)[:2] == (best_move, score)
+    assert search.nodes < first_nodes
@@ -0,0 +1,118 @@
+import io
+import time
+
+import pytest
+
+from src.chess_engine import ChessEngine
+from src.constants import PieceName
+from src.exceptions import InvalidUciMove
+from src.move import Move
+from src.search import MATE_SCORE
+from src.uci import (
+    UciEngine,
+    allocate_time,
+    format_score,
+    format_uci_move,
+    parse_uci_move,
+)
+
+# the white pawn on b7 promotes
+PROMOTION_FEN = "8/1P6/8/8/8/8/k7/4K3 w - - 0 1"
+
+
+def _lines(uci: UciEngine):
+    return uci.output.getvalue().splitlines()
+
+
+def _wait_for_line(uci: UciEngine, prefix: str, timeout: float = 10.0) -> str:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        for line in _lines(uci):
+            if line.startswith(prefix):
+                return line
+        time.sleep(0.01)
+    raise AssertionError(f"no {prefix} line")
+
+
+def _wait_for_bestmove(uci: UciEngine) -> str:
+    return _wait_for_line(uci, "bestmove")
+
+
+def test_parse_and_format_uci_move() -> None:
+    engine = ChessEngine.from_fen(PROMOTION_FEN)
+    move = parse_uci_move(engine, "b7b8n")
+    assert move == Move((1, 1), (0, 1), PieceName.KNIGHT)
+    assert format_uci_move(move) == "b7b8n"
+    with pytest.raises(InvalidUciMove):
+        parse_uci_move(engine, "b7b8")
+    with pytest.raises(InvalidUciMove):
+        parse_uci_move(ChessEngine(), "e2e5")
+
+
+def test_format_score() -> None:
+    assert format_score(35) == "cp 35"
+    assert format_score(MATE_SCORE - 1) == "mate 1"
+    assert format_score(MATE_SCORE - 3) == "mate 2"
+    assert format_score(-(MATE_SCORE - 2)) == "mate -1"
+
+
+def test_allocate_time() -> None:
+    assert allocate_time(60000, moves_to_go=30) == pytest.approx(1.99833, abs=1e-4)
+    assert allocate_time(60000, 1000) > allocate_time(60000)
+    assert allocate_time(100, 5000) <= 0.025
+
+
+def test_go_depth() -> None:
+    uci = UciEngine(output=io.StringIO())
+    for line in ["uci", "isready", "position startpos moves e2e4 e7e5", "go depth 2"]:
+        uci.execute(line)
+    bestmove = _wait_for_bestmove(uci).split()
+    lines = _lines(uci)
+    assert lines[:2] == ["id name chess-ai", "id author jwallace145"]
+    assert "uciok" in lines and "readyok" in lines
+    assert any(line.startswith("info depth 2 score cp") for line in lines)
+    assert parse_uci_move(uci.engine, bestmove[1])
+
+
+def test_stop_infinite_search() -> None:
+    uci = UciEngine(output=io.StringIO())
+    uci.execute("position startpos")
+    uci.execute("go infinite")
+    # an infinite search never answers on its own, even after its first iteration
+    _wait_for_line(uci, "info depth 1")
+    uci.execute("isready")
+    assert "readyok" in _lines(uci)
+    assert not any(line.startswith("bestmove") for line in _lines(uci))
+
+    uci.execute("stop")
+    assert uci._thread is None
+    assert _lines(uci)[-1].startswith("bestmove")
+
+
+def test_ponderhit_releases_bestmove() -> None:
+    uci = UciEngine(output=io.StringIO())
+    uci.execute("position startpos moves e2e4")
+    uci.execute("go ponder depth 1")
+    _wait_for_line(uci, "info depth 1")
+    assert uci._thread.is_alive()
+    assert not any(line.startswith("bestmove") for line in _lines(uci))
+    uci.execute("ponderhit")
+    assert _wait_for_bestmove(uci).startswith("bestmove")
+
+
+def test_invalid_position_keeps_previous_position() -> None:
+    uci = UciEngine(output=io.StringIO())
+    uci.execute("position startpos moves e2e4")
+    fen = uci.engine.to_fen()
+    uci.execute("position fen 8/8/8 w")
+    assert uci.engine.to_fen() == fen
+    assert _lines(uci)[-1].startswith("info string FEN 8/8/8 w")
+
+
+def test_invalid_book_file(tmp_path) -> None:
+    path = tmp_path / "truncated.bin"
+    path.write_bytes(b"\x00" * 10)
+    uci = UciEngine(output=io.StringIO())
+    uci.execute(f"setoption name BookFile value {path}")
+    assert uci.book is None
+    assert _lines(uci)[-1].startswith("info string")
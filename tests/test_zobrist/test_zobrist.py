@@ -0,0 +1,66 @@
+from src.chess_engine import ChessEngine
+from src.constants import Color
+from src.move import Move
+from src.utils.chess_board_reader import ChessBoardReader
+
+START_POSITION = "./tests/chessboards/start-position.txt"
+
+
+def test_transpositions_have_equal_hashes() -> None:
+    knights_first = ChessEngine(debug=True)
+    for src, dest in [((7, 6), (5, 5)), ((0, 6), (2, 5)), ((6, 4), (4, 4))]:
+        knights_first.move(src, dest)
+
+    pawn_first = ChessEngine(debug=True)
+    for src, dest in [((6, 4), (4, 4)), ((0, 6), (2, 5)), ((7, 6), (5, 5))]:
+        pawn_first.move(src, dest)
+
+    assert knights_first.get_hash() == pawn_first.get_hash()
+
+
+def test_hash_covers_side_to_move_and_castling_rights(
+    chess_board_reader: ChessBoardReader,
+) -> None:
+    chess_engine = ChessEngine(debug=True)
+    start = chess_engine.get_hash()
+    assert start == chess_board_reader.read_chess_board(START_POSITION).get_hash()
+    assert (
+        start
+        != ChessBoardReader()
+        .read_chess_board(START_POSITION, current_team=Color.BLACK)
+        .get_hash()
+    )
+
+    # knights out and back again restore the start position
+    for src, dest in [
+        ((7, 6), (5, 5)),
+        ((0, 6), (2, 5)),
+        ((5, 5), (7, 6)),
+        ((2, 5), (0, 6)),
+    ]:
+        chess_engine.move(src, dest)
+    assert chess_engine.get_hash() == start
+
+    # kings out and back again lose their castling rights
+    for src, dest in [((6, 4), (4, 4)), ((1, 4), (3, 4))]:
+        chess_engine.move(src, dest)
+    after_pawns = chess_engine.get_hash()
+    for src, dest in [
+        ((7, 4), (6, 4)),
+        ((0, 4), (1, 4)),
+        ((6, 4), (7, 4)),
+        ((1, 4), (0, 4)),
+    ]:
+        chess_engine.move(src, dest)
+    assert chess_engine.get_hash() != after_pawns
+
+
+def test_unmake_move_restores_hash() -> None:
+    chess_engine = ChessEngine(debug=True)
+    start = chess_engine.get_hash()
+    undo = chess_engine.make_move(Move((7, 6), (5, 5)))
+    assert chess_engine.get_hash() != start
+    assert chess_engine.get_turn() == Color.BLACK
+    chess_engine.unmake_move(undo)
+    assert chess_engine.get_hash() == start
+    assert chess_engine.get_turn() == Color.WHITE